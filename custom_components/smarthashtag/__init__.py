@@ -6,10 +6,13 @@ https://github.com/DasBasti/SmartHashtag
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from pysmarthashtag.account import SmartAccount
+from homeassistant.helpers import issue_registry as ir
 from pysmarthashtag.const import EndpointUrls
 
 from .const import (
@@ -17,9 +20,15 @@ from .const import (
     CONF_API_BASE_URL_V2,
     CONF_REGION,
     CONF_VEHICLE,
+    DOMAIN,
     REGION_CUSTOM,
 )
-from .coordinator import SmartHashtagDataUpdateCoordinator
+from .coordinator import SmartHashtagDataUpdateCoordinator, latency_issue_id
+from .heating import LEGACY_DATA_KEY, HeatingLevelStore
+from .hub import async_get_account_hub, async_release_account_hub
+from .session import async_get_session_store
+from .snapshot import VehicleSnapshotStore
+from .transport import async_release_shared_transport
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -30,6 +39,17 @@ PLATFORMS: list[Platform] = [
     Platform.SELECT,
 ]
 
+# The entry data the account hub and the coordinator are built from. Changing
+# any of it takes a reload; everything else applies to the running entry.
+RELOAD_DATA_KEYS = (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_VEHICLE,
+    CONF_REGION,
+    CONF_API_BASE_URL,
+    CONF_API_BASE_URL_V2,
+)
+
 type SmartHashtagConfigEntry = ConfigEntry[SmartHashtagDataUpdateCoordinator]
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
@@ -42,11 +62,12 @@ async def async_setup_entry(
     Initialize the Smart Hashtag integration from a UI configuration entry.
 
     This asynchronous function sets up the integration by creating and initializing a
-    SmartHashtagDataUpdateCoordinator. It uses the Home Assistant instance along with
-    credentials (username and password) provided in the configuration entry's data to
-    instantiate a SmartAccount. The coordinator then performs an initial data refresh.
+    SmartHashtagDataUpdateCoordinator. Entries with the same username share one
+    SmartAccountHub, so a login holds a single session however many of its vehicles
+    are set up. If a snapshot of the vehicles was saved before, the coordinator serves
+    it and refreshes in the background; otherwise it performs an initial data refresh.
     Afterward, the function forwards the configuration entry to all supported platforms,
-    and registers an update listener to handle future reloads of the configuration.
+    and registers an update listener that applies later changes of the options.
 
     Parameters:
         hass (HomeAssistant): The Home Assistant instance.
@@ -77,23 +98,42 @@ async def async_setup_entry(
     # cars in the phone app). Falls back to all vehicles for legacy entries with
     # no stored vehicle.
     configured_vin = entry.data.get(CONF_VEHICLE)
-    tracked_vins = [configured_vin] if configured_vin else None
+
+    hub = async_get_account_hub(hass, entry, endpoint_urls)
+    hub.attach(entry.entry_id, configured_vin)
 
     entry.runtime_data = SmartHashtagDataUpdateCoordinator(
         hass=hass,
-        account=SmartAccount(
-            username=entry.data[CONF_USERNAME],
-            password=entry.data[CONF_PASSWORD],
-            endpoint_urls=endpoint_urls,
-            tracked_vins=tracked_vins,
-        ),
         entry=entry,
+        hub=hub,
     )
+    # Earlier versions kept the heating levels in the entry data.
+    if await entry.runtime_data.heating_levels.async_load(
+        entry.data.get(LEGACY_DATA_KEY)
+    ):
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                key: value
+                for key, value in entry.data.items()
+                if key != LEGACY_DATA_KEY
+            },
+        )
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await entry.runtime_data.async_config_entry_first_refresh()
+    try:
+        # With a snapshot from the last run the entities come up right away and
+        # the cloud is asked in the background; without one they need the data.
+        if not await entry.runtime_data.async_config_entry_background_refresh():
+            await entry.runtime_data.async_config_entry_first_refresh()
+    except Exception:
+        async_release_account_hub(hass, entry)
+        await async_release_shared_transport(hass)
+        raise
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(
+        entry.add_update_listener(_async_update_listener(_reload_data(entry)))
+    )
 
     return True
 
@@ -104,7 +144,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     This function initiates the unloading process for all platforms specified in the
     PLATFORMS list for the given configuration entry. It delegates the operation to Home
-    Assistant's asynchronous platform unload mechanism.
+    Assistant's asynchronous platform unload mechanism. Once the platforms are
+    unloaded the coordinator cancels its fetch in flight, its timers and its fast
+    poll leases, and the entry is detached from its account hub, which is dropped
+    together with its session when no other entry uses it. The pooled connections
+    to the cloud are closed with the last hub.
 
     Parameters:
         hass (HomeAssistant): The Home Assistant instance.
@@ -116,7 +160,55 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Raises:
         Exception: Propagates any exceptions raised during the unload process.
     """
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        # Before the hub and its connections go: the fetch in flight needs them.
+        await entry.runtime_data.async_shutdown()
+        async_release_account_hub(hass, entry)
+        await async_release_shared_transport(hass)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete what was saved for a removed entry, and for its login with the last entry."""
+    await VehicleSnapshotStore(hass, entry.entry_id).async_remove()
+    await HeatingLevelStore(hass, entry.entry_id).async_remove()
+    ir.async_delete_issue(hass, DOMAIN, latency_issue_id(entry.entry_id))
+    username = entry.data[CONF_USERNAME]
+    if not any(
+        other.entry_id != entry.entry_id and other.data.get(CONF_USERNAME) == username
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await async_get_session_store(hass).async_remove(username)
+
+
+def _reload_data(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry data that takes a reload to change."""
+    return {key: entry.data.get(key) for key in RELOAD_DATA_KEYS}
+
+
+def _async_update_listener(
+    loaded_data: dict[str, Any],
+) -> Callable[[HomeAssistant, SmartHashtagConfigEntry], Awaitable[None]]:
+    """Return the update listener of an entry set up with the given data."""
+
+    async def async_update_listener(
+        hass: HomeAssistant, entry: SmartHashtagConfigEntry
+    ) -> None:
+        """
+        Apply a changed configuration entry.
+
+        Changed options, such as the polling intervals, the staleness limit or
+        the default conditioning temperature, are handed to the running
+        coordinator: no entity is recreated and the cloud is not logged into
+        again. Only a change of the credentials, the endpoints or the vehicle
+        reloads the entry.
+        """
+        if _reload_data(entry) != loaded_data:
+            await async_reload_entry(hass, entry)
+        else:
+            entry.runtime_data.async_apply_options(entry.options)
+
+    return async_update_listener
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -125,7 +217,8 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     This function triggers a reload of the configuration entry by calling Home Assistant's
     config_entries.async_reload method using the entry's unique identifier. It is used to apply
-    configuration changes on the fly without requiring a full restart of Home Assistant.
+    changes of the credentials, the endpoints or the vehicle without requiring a full restart of
+    Home Assistant.
 
     Parameters:
         hass (HomeAssistant): The Home Assistant instance.
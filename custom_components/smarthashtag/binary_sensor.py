@@ -6,12 +6,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.core import callback
 
 from .const import (
     CONF_VEHICLE,
 )
 from .coordinator import SmartHashtagDataUpdateCoordinator
 from .entity import SmartHashtagEntity
+from .freshness import DataSource
 from .sensor import remove_vin_from_key, vin_from_key
 
 
@@ -152,24 +154,30 @@ class SmartHashtagLockBinarySensor(SmartHashtagEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
         self.entity_description = entity_description
+        self._key = remove_vin_from_key(entity_description.key)
+        self._vin = vin_from_key(entity_description.key)
+        self._data_source = (self._vin, DataSource.STATUS)
 
-    @property
-    def is_on(self) -> bool | None:
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Compute whether the binary sensor is on from the vehicle data."""
+        super()._update_from_coordinator()
+        self._attr_is_on = self._is_on()
+
+    def _is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
         if self.coordinator.data is None:
             return None
-        key = remove_vin_from_key(self.entity_description.key)
-        vin = vin_from_key(self.entity_description.key)
 
         # Safely get vehicle data, return None if VIN not found
-        vehicle = self.coordinator.data.get(vin)
+        vehicle = self.coordinator.data.get(self._vin)
         if vehicle is None:
             return None
 
         try:
             state = self.entity_description.is_on_fn(
                 vehicle,
-                key,
+                self._key,
             )
             # smart: 0 means open (unlocked), 1 means closed (locked)
             # ha: on means open (True), off means closed (False)
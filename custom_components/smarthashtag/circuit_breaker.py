@@ -0,0 +1,132 @@
+"""Circuit breaker for the Smart cloud."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+from .const import LOGGER
+
+# Failed refreshes in a row before the breaker opens. A single failure is
+# usually a blip that the next regular poll gets past.
+FAILURES_TO_OPEN = 3
+
+# Delay before the first probe once the breaker opened; it doubles with each
+# failed probe, up to MAX_BACKOFF. Outages of the Smart cloud tend to last
+# minutes to hours, and every doomed attempt can take the full API timeout.
+BASE_BACKOFF = timedelta(minutes=1)
+MAX_BACKOFF = timedelta(minutes=30)
+
+# Share by which each delay is randomly lengthened or shortened, so that
+# installations do not all probe the cloud at the same moment when it
+# comes back. Delays stay within MAX_BACKOFF.
+JITTER = 0.2
+
+
+class CircuitOpenError(Exception):
+    """A refresh was held back because the Smart cloud keeps failing."""
+
+    def __init__(self, retry_at: datetime | None) -> None:
+        """Initialize the error with the time of the next probe."""
+        super().__init__(f"Smart cloud failing, next attempt at {retry_at}")
+        self.retry_at = retry_at
+
+
+class BreakerState(StrEnum):
+    """Whether refreshes go to the cloud."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Stop asking a failing cloud for data, and probe it with growing delays.
+
+    While closed, every refresh goes to the cloud. After FAILURES_TO_OPEN
+    failed refreshes in a row the breaker opens: refreshes are answered
+    without the cloud until the backoff delay has passed. The next refresh
+    is let through as a probe (half-open). A successful probe closes the
+    breaker, a failed one opens it again with twice the delay.
+    """
+
+    failures_to_open: int = FAILURES_TO_OPEN
+    base_backoff: timedelta = BASE_BACKOFF
+    max_backoff: timedelta = MAX_BACKOFF
+    jitter: float = JITTER
+    state: BreakerState = BreakerState.CLOSED
+    consecutive_failures: int = 0
+    # Times the breaker opened since it last closed; sets the next delay.
+    failed_probes: int = 0
+    backoff: timedelta | None = None
+    retry_at: datetime | None = None
+    # Refreshes answered without the cloud while open.
+    rejected: int = 0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def allow_request(self, now: datetime) -> bool:
+        """
+        Return whether a refresh may go to the cloud now.
+
+        Once the delay of an open breaker has passed, this lets one refresh
+        through as a probe and turns the breaker half-open.
+        """
+        if self.state is BreakerState.OPEN:
+            if self.retry_at is not None and now < self.retry_at:
+                self.rejected += 1
+                return False
+            self.state = BreakerState.HALF_OPEN
+            LOGGER.debug("Probing the Smart cloud")
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a refresh that reached the cloud."""
+        if self.state is not BreakerState.CLOSED:
+            LOGGER.info(
+                "Smart cloud reachable again after %d failed refreshes",
+                self.consecutive_failures,
+            )
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.failed_probes = 0
+        self.backoff = None
+        self.retry_at = None
+
+    def record_failure(self, now: datetime) -> None:
+        """Count a failed refresh, opening the breaker when it is one too many."""
+        self.consecutive_failures += 1
+        if self.state is BreakerState.HALF_OPEN:
+            self.failed_probes += 1
+            self._open(now)
+        elif (
+            self.state is BreakerState.CLOSED
+            and self.consecutive_failures >= self.failures_to_open
+        ):
+            self._open(now)
+
+    def delay(self, now: datetime) -> timedelta | None:
+        """Return how long refreshes wait for the next probe, None if closed."""
+        if self.state is not BreakerState.OPEN or self.retry_at is None:
+            return None
+        return max(self.retry_at - now, timedelta(seconds=1))
+
+    def _open(self, now: datetime) -> None:
+        """Open the breaker for the next, jittered, backoff delay."""
+        backoff = min(
+            self.base_backoff
+            * 2**self.failed_probes
+            * self.rng.uniform(1 - self.jitter, 1 + self.jitter),
+            self.max_backoff,
+        )
+        self.state = BreakerState.OPEN
+        self.backoff = backoff
+        self.retry_at = now + backoff
+        LOGGER.warning(
+            "Smart cloud failed %d refreshes in a row, next attempt in %s",
+            self.consecutive_failures,
+            backoff,
+        )
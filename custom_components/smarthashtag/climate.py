@@ -1,6 +1,5 @@
 """Support for Smart #1 / #3 switches."""
 
-from datetime import timedelta
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
@@ -9,19 +8,29 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from pysmarthashtag.control.climate import HeatingLocation
 
+from .commands import RemoteCommand
 from .const import (
     CONF_CONDITIONING_TEMP,
     CONF_VEHICLE,
     DEFAULT_CONDITIONING_TEMP,
-    FAST_INTERVAL,
     LOGGER,
 )
 from .coordinator import SmartHashtagDataUpdateCoordinator
 from .entity import SmartHashtagEntity
+from .vehicle_data import VehicleData
+
+# The kind of the commands that start and stop conditioning.
+CONDITIONING_COMMAND = "conditioning"
+
+
+def is_conditioning(vehicle: VehicleData) -> bool:
+    """Return whether a vehicle snapshot reports active pre-conditioning."""
+    climate = vehicle.climate
+    return climate is not None and bool(climate.pre_climate_active)
 
 
 async def async_setup_entry(
@@ -55,7 +64,7 @@ async def async_setup_entry(
 
     entities.append(SmartConditioningMode(coordinator, vehicle))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
@@ -76,7 +85,6 @@ class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
     _attr_has_entity_name = False
     _attr_icon = "mdi:thermostat-auto"
     _enable_turn_on_off_backwards_compatibility = False
-    _last_mode = HVACMode.OFF
 
     @property
     def translation_key(self):
@@ -87,17 +95,13 @@ class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
         """Return hvac operating mode: heat, cool"""
         if self._vehicle is None:
             return HVACMode.OFF
-        current_mode = (
-            HVACMode.HEAT_COOL
-            if self._vehicle.climate.pre_climate_active
-            else HVACMode.OFF
-        )
-
-        # value is true, last setting is off -> keep on requesting
-        if current_mode == self._last_mode:
-            self.coordinator.reset_update_interval("climate")
-
-        return current_mode
+        queue = self.coordinator.command_queue(self._vehicle_vin)
+        if (requested := queue.optimistic.get(CONDITIONING_COMMAND)) is not None:
+            return HVACMode.HEAT_COOL if requested else HVACMode.OFF
+        snapshot = self._snapshot
+        if snapshot is not None and is_conditioning(snapshot):
+            return HVACMode.HEAT_COOL
+        return HVACMode.OFF
 
     @property
     def temperature_unit(self):
@@ -137,15 +141,28 @@ class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
             self._temperature = self.coordinator.config_entry.options.get(
                 CONF_CONDITIONING_TEMP, DEFAULT_CONDITIONING_TEMP
             )
+            self._default_temperature = self._temperature
             self._attr_target_temperature = self._temperature
         except Exception as e:
             LOGGER.error(f"Cannot access coordinator config: {e}")
 
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Follow the default temperature when it changes in the options."""
+        super()._update_from_coordinator()
+        default = self.coordinator.config_entry.options.get(
+            CONF_CONDITIONING_TEMP, DEFAULT_CONDITIONING_TEMP
+        )
+        if default != self._default_temperature:
+            # A target someone set on the entity is kept.
+            if self._temperature == self._default_temperature:
+                self._temperature = default
+            self._default_temperature = default
+
     def _restore_heating_levels(self) -> None:
-        """Restore heating levels from saved config entry data to the climate control."""
-        selects = self.coordinator.config_entry.data.get("selects", {})
+        """Restore the saved heating levels to the climate control."""
         for location in HeatingLocation:
-            level = selects.get(location.value, 0)
+            level = self.coordinator.heating_levels.get(location)
             try:
                 self._vehicle.climate_control.set_heating_level(location, level)
             except Exception as e:
@@ -155,37 +172,39 @@ class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
 
     async def async_turn_on(self) -> None:
         """Turn on the climate system."""
-        if self._vehicle is None:
-            LOGGER.warning(
-                "Cannot turn on climate; vehicle %s unavailable", self._vehicle_vin
-            )
-            return
-        await self.coordinator.account.select_active_vehicle(self._vehicle_vin)
-        self._restore_heating_levels()
-        await self._vehicle.climate_control.set_climate_conditioning(
-            self._temperature, True
-        )
-        self._last_mode = HVACMode.HEAT_COOL
-        self.coordinator.set_update_interval(
-            "climate", timedelta(seconds=FAST_INTERVAL)
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_set_conditioning(True)
 
     async def async_turn_off(self) -> None:
         """Turn off the climate system."""
+        await self._async_set_conditioning(False)
+
+    async def _async_set_conditioning(self, active: bool) -> None:
+        """Queue a command to start or stop conditioning, showing its outcome at once."""
         if self._vehicle is None:
             LOGGER.warning(
-                "Cannot turn off climate; vehicle %s unavailable", self._vehicle_vin
+                "Cannot turn %s climate; vehicle %s unavailable",
+                "on" if active else "off",
+                self._vehicle_vin,
             )
             return
-        await self._vehicle.climate_control.set_climate_conditioning(
-            self._temperature, False
-        )
-        self._last_mode = HVACMode.OFF
-        self.coordinator.set_update_interval(
-            "climate", timedelta(seconds=FAST_INTERVAL)
+
+        async def send() -> None:
+            if active:
+                await self.coordinator.account.select_active_vehicle(self._vehicle_vin)
+                self._restore_heating_levels()
+            await self._vehicle.climate_control.set_climate_conditioning(
+                self._temperature, active
+            )
+
+        await self.coordinator.command_queue(self._vehicle_vin).async_send(
+            RemoteCommand(
+                CONDITIONING_COMMAND,
+                active,
+                send,
+                confirmed=lambda vehicle: is_conditioning(vehicle) == active,
+                on_change=self.async_write_ha_state,
+            )
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature for the vehicle."""
@@ -207,9 +226,17 @@ class SmartConditioningMode(SmartHashtagEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if self._vehicle is None or self._vehicle.climate is None:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.climate is None:
             return None
-        return self._vehicle.climate.interior_temperature.value
+        temperature = snapshot.climate.interior_temperature
+        return temperature.value if temperature is not None else None
+
+    @property
+    def _snapshot(self) -> VehicleData | None:
+        """Return the vehicle as of the coordinator's last refresh."""
+        data = self.coordinator.data
+        return data.get(self._vehicle_vin) if data is not None else None
 
     def set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode."""
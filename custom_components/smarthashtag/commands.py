@@ -0,0 +1,234 @@
+"""Remote commands to a vehicle, sent one at a time with optimistic state."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, FAST_INTERVAL, FAST_POLL_TTL, LOGGER
+
+if TYPE_CHECKING:
+    from .coordinator import SmartHashtagDataUpdateCoordinator
+    from .vehicle_data import VehicleData
+
+# Seconds the vehicle has to report the outcome of a command. Until then,
+# the entity shows the requested state and the coordinator polls fast.
+CONFIRM_TIMEOUT = FAST_POLL_TTL
+
+# Errors of a command that never reached the vehicle.
+UNREACHABLE_ERRORS = (TimeoutError, httpx.TransportError)
+
+
+@dataclass
+class RemoteCommand:
+    """
+    A request for a vehicle to reach a state, e.g. to charge.
+
+    Commands of the same kind supersede each other: only the latest one
+    still waiting is sent.
+    """
+
+    kind: str
+    target: Any
+    send: Callable[[], Awaitable[Any]]
+    # Whether the vehicle data shows the target state. Commands without it
+    # change nothing the vehicle reports, and are done once sent.
+    confirmed: Callable[[VehicleData], bool] | None = None
+    # Called whenever the state shown for the kind changes.
+    on_change: Callable[[], None] | None = None
+    # Whether sending calls the cloud, and so waits for a refresh running.
+    cloud: bool = True
+    done: asyncio.Future[None] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class CommandQueue:
+    """
+    Send the remote commands of one vehicle one at a time.
+
+    A command waiting to be sent is replaced by a newer one of its kind, and
+    one asking for the state the last command of its kind is still waiting
+    for is not sent at all: on, off, on in a row sends one command. Entities
+    show the requested state right away. After a command went through, the
+    coordinator polls fast until the vehicle reports the requested state, or
+    the state shown goes back to the reported one after CONFIRM_TIMEOUT.
+    """
+
+    def __init__(
+        self, coordinator: SmartHashtagDataUpdateCoordinator, vin: str
+    ) -> None:
+        """Initialize the queue of a vehicle."""
+        self._coordinator = coordinator
+        self._vin = vin
+        self._waiting: dict[str, RemoteCommand] = {}
+        self._worker: asyncio.Task[None] | None = None
+        # The state requested by kind, shown until the vehicle reports it.
+        self.optimistic: dict[str, Any] = {}
+        # The commands sent and waiting for their outcome, by kind.
+        self._unconfirmed: dict[str, RemoteCommand] = {}
+        self._confirmations: dict[str, list[CALLBACK_TYPE]] = {}
+        self.sent = 0
+        self.superseded = 0
+        self.reverted = 0
+
+    async def async_send(self, command: RemoteCommand) -> None:
+        """
+        Queue a command and wait until it was sent or superseded.
+
+        Raises:
+            HomeAssistantError: If the cloud rejected the command or could
+                not be reached; the state shown goes back to the reported one.
+        """
+        if (superseded := self._waiting.pop(command.kind, None)) is not None:
+            self.superseded += 1
+            LOGGER.debug(
+                "%s command for %s superseded by a newer one", command.kind, self._vin
+            )
+            superseded.done.set_result(None)
+        self._waiting[command.kind] = command
+        if command.confirmed is not None:
+            self._show(command, command.target)
+        if self._worker is None or self._worker.done():
+            self._worker = self._coordinator.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} {self._vin} commands"
+            )
+        await asyncio.shield(command.done)
+
+    async def _async_run(self) -> None:
+        """Send the waiting commands, oldest kind first."""
+        while self._waiting:
+            kind = next(iter(self._waiting))
+            command = self._waiting.pop(kind)
+            unconfirmed = self._unconfirmed.get(kind)
+            if unconfirmed is not None and unconfirmed.target == command.target:
+                # The vehicle is still on its way to this state.
+                command.done.set_result(None)
+                continue
+            try:
+                if command.cloud:
+                    # Remote commands and refreshes of the login take turns.
+                    async with self._coordinator.hub.lock:
+                        await command.send()
+                else:
+                    await command.send()
+            except asyncio.CancelledError:
+                command.done.cancel()
+                raise
+            except Exception as exception:
+                LOGGER.warning(
+                    "%s command for %s failed: %s", kind, self._vin, exception
+                )
+                if command.confirmed is not None:
+                    self._stop_confirming(kind)
+                    self._show(command, None)
+                command.done.set_exception(command_error(kind, self._vin, exception))
+                continue
+            self.sent += 1
+            if command.confirmed is not None:
+                self._confirm(command)
+            command.done.set_result(None)
+
+    @callback
+    def _show(self, command: RemoteCommand, state: Any) -> None:
+        """Show a requested state, or the reported one for None."""
+        if state is None:
+            self.optimistic.pop(command.kind, None)
+        else:
+            self.optimistic[command.kind] = state
+        if command.on_change is not None:
+            command.on_change()
+
+    @callback
+    def _confirm(self, command: RemoteCommand) -> None:
+        """Poll fast until the vehicle reports the outcome of a sent command."""
+        kind = command.kind
+        coordinator = self._coordinator
+        self._stop_confirming(kind)
+        self._unconfirmed[kind] = command
+        key = f"{self._vin}_{kind}"
+        vin = self._vin
+        coordinator.acquire_fast_poll(
+            key,
+            timedelta(seconds=FAST_INTERVAL),
+            timedelta(seconds=CONFIRM_TIMEOUT),
+            until=lambda vehicles: vin in vehicles and command.confirmed(vehicles[vin]),
+        )
+        self._confirmations[kind] = [
+            partial(coordinator.release_fast_poll, key),
+            coordinator.async_add_listener(partial(self._check, command)),
+            async_call_later(
+                coordinator.hass, CONFIRM_TIMEOUT, partial(self._expire, command)
+            ),
+        ]
+        coordinator.hass.async_create_task(
+            coordinator.async_request_refresh(), eager_start=False
+        )
+
+    @callback
+    def _check(self, command: RemoteCommand) -> None:
+        """Settle a command once the vehicle reports its target state."""
+        data = self._coordinator.data
+        vehicle = data.get(self._vin) if data is not None else None
+        if vehicle is None or not command.confirmed(vehicle):
+            return
+        LOGGER.debug("%s command for %s confirmed", command.kind, self._vin)
+        self._stop_confirming(command.kind)
+        self._show(command, None)
+
+    @callback
+    def _expire(self, command: RemoteCommand, _now: datetime) -> None:
+        """Show the reported state again when the vehicle never got there."""
+        LOGGER.warning(
+            "Vehicle %s did not report %s=%s within %ss, showing its state again",
+            self._vin,
+            command.kind,
+            command.target,
+            CONFIRM_TIMEOUT,
+        )
+        self.reverted += 1
+        self._stop_confirming(command.kind)
+        self._show(command, None)
+
+    @callback
+    def _stop_confirming(self, kind: str) -> None:
+        """Stop waiting for the outcome of the last command of a kind."""
+        self._unconfirmed.pop(kind, None)
+        for cancel in self._confirmations.pop(kind, ()):
+            cancel()
+
+    async def async_shutdown(self) -> None:
+        """Drop the waiting commands and stop waiting for outcomes."""
+        for command in self._waiting.values():
+            command.done.cancel()
+        self._waiting.clear()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            await asyncio.wait({self._worker})
+        self._worker = None
+        for kind in list(self._confirmations):
+            self._stop_confirming(kind)
+        self.optimistic.clear()
+
+
+def command_error(kind: str, vin: str, exception: Exception) -> HomeAssistantError:
+    """Return the error a failed command surfaces to the caller of the service."""
+    placeholders = {"command": kind, "vin": vin, "error": str(exception)}
+    return HomeAssistantError(
+        translation_domain=DOMAIN,
+        translation_key=(
+            "command_unreachable"
+            if isinstance(exception, UNREACHABLE_ERRORS)
+            else "command_failed"
+        ),
+        translation_placeholders=placeholders,
+    )
@@ -27,6 +27,7 @@ from .const import (
     CONF_CONDITIONING_TEMP,
     CONF_DRIVING_INTERVAL,
     CONF_REGION,
+    CONF_STALENESS_LIMIT,
     CONF_VEHICLE,
     CONF_VEHICLES,
     DEFAULT_CHARGING_INTERVAL,
@@ -35,6 +36,7 @@ from .const import (
     DEFAULT_NAME,
     DEFAULT_REGION,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALENESS_LIMIT,
     DOMAIN,
     LOGGER,
     MIN_SCAN_INTERVAL,
@@ -42,6 +44,8 @@ from .const import (
     REGION_CUSTOM,
     REGIONS,
 )
+from .session import async_get_session_store, export_session
+from .transport import async_release_shared_transport, use_shared_transport
 
 
 class SmartHashtagFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -214,13 +218,22 @@ class SmartHashtagFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             )
         # For EU region (default) or other regions, use default endpoints
 
-        client = SmartAccount(
-            username=username,
-            password=password,
-            endpoint_urls=endpoint_urls,
+        client = use_shared_transport(
+            self.hass,
+            SmartAccount(
+                username=username,
+                password=password,
+                endpoint_urls=endpoint_urls,
+            ),
         )
-        await client.login()
-        await client.get_vehicles()
+        try:
+            await client.login()
+            await client.get_vehicles()
+        finally:
+            await async_release_shared_transport(self.hass)
+        # Let the entry set up with this session instead of logging in again.
+        if session := export_session(client.config.authentication):
+            await async_get_session_store(self.hass).async_set(username, session)
         return client.vehicles.keys()
 
     @staticmethod
@@ -315,6 +328,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_CONDITIONING_TEMP, DEFAULT_CONDITIONING_TEMP
                     ),
                 ): vol.All(cv.positive_int, vol.Clamp(min=MIN_SCAN_INTERVAL)),
+                vol.Optional(
+                    CONF_STALENESS_LIMIT,
+                    default=self.config_entry.options.get(
+                        CONF_STALENESS_LIMIT, DEFAULT_STALENESS_LIMIT
+                    ),
+                ): vol.All(cv.positive_int, vol.Clamp(min=MIN_SCAN_INTERVAL)),
             }
         )
         return self.async_show_form(step_id="user", data_schema=data_schema)
@@ -32,6 +32,7 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_CHARGING_INTERVAL = "charging_interval"
 CONF_DRIVING_INTERVAL = "driving_interval"
+CONF_STALENESS_LIMIT = "staleness_limit"
 CONF_CONDITIONING_TEMP = "conditioning_temp"
 CONF_SEATHEATING_LEVEL = "seatheating_level"
 CONF_REGION = "region"
@@ -43,7 +44,13 @@ DEFAULT_NAME = DOMAIN
 DEFAULT_SCAN_INTERVAL = 300
 DEFAULT_CHARGING_INTERVAL = 30
 DEFAULT_DRIVING_INTERVAL = 60
+# Seconds a data source may keep failing before the entities it feeds turn
+# unavailable; the others keep updating from the sources that still work.
+DEFAULT_STALENESS_LIMIT = 3600
 FAST_INTERVAL = 5
+# Upper bound (seconds) on fast polling after a remote command. Charging and
+# conditioning show up in the cloud within a minute or two when they work.
+FAST_POLL_TTL = 120
 MIN_SCAN_INTERVAL = 10
 DEFAULT_CONDITIONING_TEMP = 21
 DEFAULT_SEATHEATING_LEVEL = 3
@@ -72,6 +79,18 @@ If you have any issues with this you need to open an issue here:
 CONF_VEHICLE: Final = "vehicle"
 CONF_VEHICLES: Final = "vehicles"
 
+# Set on entities while their values come from the snapshot saved before a
+# restart; holds when that data was fetched.
+ATTR_RESTORED_AT: Final = "restored_at"
+
+# Fired once per refresh for every vehicle whose values changed, carrying
+# only the changed values by path, e.g. "battery.charging_status".
+EVENT_VEHICLE_CHANGED: Final = f"{DOMAIN}_vehicle_changed"
+
+# Repair issue raised while refreshes take longer than the shortest interval
+# configured in the options.
+ISSUE_INTERVAL_BELOW_LATENCY: Final = "interval_below_latency"
+
 # Shown when the cloud reports the VIN is no longer bound to the account (8040).
 # No token refresh or re-login recovers this, so tell the user what does.
 UNBOUND_VIN_AUTH_MESSAGE: Final = (
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import traceback
-from datetime import timedelta
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 from typing import Any
 
 import httpx
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pysmarthashtag.account import SmartAccount
 from pysmarthashtag.models import SmartAPIError, SmartAuthError, SmartRemoteServiceError
 
@@ -27,7 +33,33 @@ except ImportError:  # pragma: no cover - depends on installed pysmarthashtag
         """Placeholder for older pysmarthashtag without the typed unbound error."""
 
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, UNBOUND_VIN_AUTH_MESSAGE
+from .circuit_breaker import BreakerState, CircuitBreaker, CircuitOpenError
+from .commands import CommandQueue
+from .const import (
+    CONF_STALENESS_LIMIT,
+    CONF_VEHICLE,
+    DEFAULT_STALENESS_LIMIT,
+    DOMAIN,
+    EVENT_VEHICLE_CHANGED,
+    ISSUE_INTERVAL_BELOW_LATENCY,
+    LOGGER,
+    UNBOUND_VIN_AUTH_MESSAGE,
+)
+from .freshness import DataSource, stale_sources
+from .heating import HeatingLevelStore
+from .hub import SmartAccountHub
+from .latency import LatencyTracker
+from .polling import FastPollLease, PollingScheduler
+from .snapshot import VehicleSnapshotStore
+from .vehicle_data import (
+    FieldChange,
+    FieldSubscription,
+    FleetData,
+    build_fleet_data,
+    diff_vehicle_data,
+    event_value,
+)
+from .vehicle_mode import VehicleMode, detect_vehicle_mode
 
 # Maximum consecutive transient failures before raising UpdateFailed
 # Set high enough to tolerate multiple internal API calls failing within a single refresh
@@ -44,8 +76,46 @@ UNBOUND_FAILURES_BEFORE_REAUTH = 3
 
 # Timeout (seconds) for a full vehicle data refresh. A healthy refresh is a
 # chain of sequential Smart/Geely cloud calls that can legitimately take ~20s.
+# The calls share this as their budget, so a slow one cannot cut off the
+# sources fetched before it. It starts once the account hub's lock is taken,
+# so a refresh queued behind another entry of the login gets all of it.
 API_TIMEOUT = 30
 
+# Seconds past API_TIMEOUT after which a refresh is abandoned altogether.
+# The budget normally ends the calls in time; this is the backstop.
+API_TIMEOUT_GRACE = 5
+
+# Seconds during which further refresh requests are folded into one trailing
+# fetch. Entities and remote commands ask for refreshes freely, but every
+# fetch is the full chain of cloud calls above, so queueing more than one
+# per window only piles up redundant work.
+REQUEST_REFRESH_COOLDOWN = 10
+
+
+@dataclass
+class StateWriteStats:
+    """How many entities wrote their state on a coordinator update."""
+
+    written: int = 0
+    skipped: int = 0
+
+
+def latency_issue_id(entry_id: str) -> str:
+    """Return the repair issue raised while an entry's intervals cannot be met."""
+    return f"{ISSUE_INTERVAL_BELOW_LATENCY}_{entry_id}"
+
+
+def _status_fetched(previous: Any, vehicles: FleetData) -> bool:
+    """Return whether a refresh fetched the status of every vehicle anew."""
+    for vin, vehicle in vehicles.items():
+        fetched_at = vehicle.fetched_at.get(DataSource.STATUS)
+        if fetched_at is None:
+            return False
+        old = previous.get(vin) if isinstance(previous, FleetData) else None
+        if old is not None and old.fetched_at.get(DataSource.STATUS) == fetched_at:
+            return False
+    return True
+
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
@@ -54,86 +124,192 @@ class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
     config_entry: ConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, account: SmartAccount, *, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        account: SmartAccount | None = None,
+        *,
+        entry: ConfigEntry,
+        hub: SmartAccountHub | None = None,
+        request_refresh_cooldown: float = REQUEST_REFRESH_COOLDOWN,
     ) -> None:
         """
         Initialize a SmartHashtagDataUpdateCoordinator instance.
 
         This constructor sets up the data update coordinator with the provided Home Assistant
-        instance, Smart account, and configuration entry. It initializes the coordinator with a
-        default update interval of 5 minutes and prepares an internal dictionary to track update
-        intervals for various keys.
+        instance, Smart account, and configuration entry. The update interval is owned by a
+        PollingScheduler that starts out at the idle interval from the options flow.
 
         Parameters:
             hass (HomeAssistant): The Home Assistant instance.
-            account (SmartAccount): An instance used to interact with the Smart Web API.
+            account (SmartAccount | None): An account of its own, for a coordinator
+                that does not share a hub.
             entry (ConfigEntry): The configuration entry containing integration settings.
+            hub (SmartAccountHub | None): The hub holding the session of the entry's
+                login, shared with the other entries of that login.
+            request_refresh_cooldown (float): Seconds during which refresh requests are
+                coalesced into a single trailing fetch.
         """
-        self.account = account
+        self.hub = hub if hub is not None else SmartAccountHub(account)
+        vin = entry.data.get(CONF_VEHICLE)
+        self.vins: list[str] | None = [vin] if vin else None
+        self.polling = PollingScheduler(entry.options)
+        # Holds refreshes back from the cloud while it keeps failing.
+        self.breaker = CircuitBreaker()
+        # How long refreshes take, which bounds how fast polling is useful.
+        self.latency = LatencyTracker()
+        self._latency_issue = False
+        debouncer = Debouncer(
+            hass, LOGGER, cooldown=request_refresh_cooldown, immediate=True
+        )
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=5),
+            update_interval=self.polling.interval,
             config_entry=entry,
+            request_refresh_debouncer=debouncer,
         )
-        self._update_intervals = {}
+        # The base class points the debouncer at async_refresh. Route it through
+        # our own hook so requests folded into another fetch can be counted.
+        debouncer.function = self._async_requested_refresh
+        self._update_task: asyncio.Task | None = None
+        self._pending_refresh_requests = 0
+        self.coalesced_refresh_requests = 0
+        self.vehicle_modes: dict[str, VehicleMode] = {}
+        self._lease_timers: dict[str, CALLBACK_TYPE] = {}
         self._consecutive_failures = 0
         self._unbound_failures = 0
         self._last_error: str | None = None
+        self.snapshots = VehicleSnapshotStore(hass, entry.entry_id)
+        self.heating_levels = HeatingLevelStore(hass, entry.entry_id)
+        # The remote commands of each vehicle, sent one at a time.
+        self._command_queues: dict[str, CommandQueue] = {}
+        # When the data served was fetched, while it comes from a saved snapshot.
+        self.restored_at: datetime | None = None
+        # When the cloud last answered a refresh, whether or not values changed.
+        self.last_refresh: datetime | None = None
+        # States written and skipped as unchanged by the last update, and by the
+        # update being dispatched.
+        self.state_writes = StateWriteStats()
+        self._dispatch_writes = StateWriteStats()
+        # How long a source may keep failing before its entities turn
+        # unavailable, and the sources past that limit, by VIN.
+        self.staleness_limit = timedelta(
+            seconds=entry.options.get(CONF_STALENESS_LIMIT, DEFAULT_STALENESS_LIMIT)
+        )
+        self.stale_sources: frozenset[tuple[str, DataSource]] = frozenset()
+        # The snapshot the last changes were published for, and who wants them.
+        self._published_data: Any = None
+        self._subscriptions: dict[str, list[FieldSubscription]] = {}
 
-    async def _async_setup(self) -> None:
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
         """
-        Asynchronously set up the data update coordinator.
+        Apply changed options without reloading the entry.
 
-        This method is called when the coordinator is initialized. It sets the update interval
-        based on the configuration entry options and prepares the coordinator for data updates.
+        New polling intervals move the refresh already scheduled, and a new
+        staleness limit decides availability right away. The listeners are
+        updated so entities reading the options, such as the default
+        temperature of the climate entity, pick them up.
         """
-        try:
-            await self.account.get_vehicles()
-        except SmartVehicleUnboundError as exception:
-            # Setup has no history to tell a transient 8040 from a real one, so
-            # let HA retry with backoff instead of demanding reauth up front.
-            # A genuine unbinding still surfaces from the update path.
-            raise ConfigEntryNotReady(UNBOUND_VIN_AUTH_MESSAGE) from exception
-        except SmartAuthError as exception:
-            raise ConfigEntryAuthFailed(exception) from exception
-        except SmartRemoteServiceError as exception:
-            raise UpdateFailed(exception) from exception
-        except SmartAPIError as exception:
-            LOGGER.info(f"API access failed with: {exception}")
-        except Exception as exception:
-            raise UpdateFailed(exception) from exception
+        self.polling.apply_options(options)
+        self.staleness_limit = timedelta(
+            seconds=options.get(CONF_STALENESS_LIMIT, DEFAULT_STALENESS_LIMIT)
+        )
+        self._apply_polling_interval(reschedule=True)
+        self._update_latency_issue()
+        self.async_update_listeners()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh, joining a fetch that is already in flight.
+
+        Requests arriving while a fetch runs wait for that fetch instead of
+        queueing another one. All other requests go through the debouncer, which
+        folds everything inside the cooldown window into one trailing fetch.
+        """
+        task = self._update_task
+        if task is not None and not task.done():
+            self.coalesced_refresh_requests += 1
+            await asyncio.wait({task})
+            return
+        self._pending_refresh_requests += 1
+        await super().async_request_refresh()
+
+    async def _async_requested_refresh(self) -> None:
+        """Run the refresh the debouncer settled on for the pending requests."""
+        if self._pending_refresh_requests > 0:
+            self._pending_refresh_requests -= 1
+        await self.async_refresh()
 
     async def _async_update_data(self):
+        """
+        Fetch vehicle data, sharing one cloud fetch between concurrent callers.
+
+        A refresh that starts while another one is running joins it and gets the
+        same result, so simultaneous refreshes cost a single get_vehicles() call.
+        Refresh requests still pending when a fetch starts are served by it and
+        counted in coalesced_refresh_requests.
+        """
+        task = self._update_task
+        if task is None or task.done():
+            self.coalesced_refresh_requests += self._pending_refresh_requests
+            self._pending_refresh_requests = 0
+            task = self._update_task = self.hass.async_create_task(
+                self._async_fetch_data(), f"{DOMAIN} vehicle data fetch"
+            )
+        else:
+            self.coalesced_refresh_requests += 1
+            LOGGER.debug("Joining vehicle data fetch already in flight")
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._update_task is task:
+                self._update_task = None
+
+    async def _async_fetch_data(self):
         """
         Asynchronously fetch vehicle data from the Smart API.
 
-        This coroutine retrieves the latest vehicle data by calling the account's
-        asynchronous get_vehicles method. Authentication and remote service issues are
-        handled by raising appropriate exceptions, while any API errors are logged and
-        return the last known data to keep entities available.
+        This coroutine retrieves the latest data of the entry's vehicles through
+        the account hub, which only fetches the data sources that are due.
+        Authentication and remote service issues are handled by raising
+        appropriate exceptions, while any API errors are logged and return the
+        last known data to keep entities available.
 
         Returns:
-            Any: The vehicle data as returned by self.account.get_vehicles(), or the
-                 last known data if a SmartAPIError or HTTP error is encountered.
+            FleetData: A new snapshot of the entry's vehicles, or the last known
+                 data if a SmartAPIError or HTTP error is encountered.
 
         Note:
             self.data can be None in the following scenarios:
             - On first run if the API call fails (SmartAPIError or HTTP error)
             - During entity setup before the first successful data fetch
             - If coordinator initialization fails
-            All entity properties that access self.data or self.account.vehicles
-            must handle None values gracefully to prevent AttributeError during
+            All entities reading self.data must handle None values gracefully to prevent AttributeError during
             entity registration.
 
         Raises:
             ConfigEntryAuthFailed: If a SmartAuthError is caught, indicating an authentication failure.
-            UpdateFailed: If a SmartRemoteServiceError is raised during the data retrieval.
+            UpdateFailed: If a SmartRemoteServiceError is raised during the data retrieval,
+                or the status kept failing MAX_TRANSIENT_FAILURES times; a refresh that
+                only fetched other sources does not count as a success then.
         """
+        if not self.breaker.allow_request(dt_util.utcnow()):
+            # Counts like a failed refresh, so a long outage still ends in
+            # UpdateFailed after MAX_TRANSIENT_FAILURES refreshes.
+            return self._handle_transient_failure(
+                CircuitOpenError(self.breaker.retry_at), reached_cloud=False
+            )
+        previous = self.data
         try:
-            async with asyncio.timeout(API_TIMEOUT):
-                await self.account.get_vehicles()
+            fetched_in = await self.hub.async_fetch(
+                self.vins, API_TIMEOUT, grace=API_TIMEOUT_GRACE
+            )
+            self.latency.record(fetched_in)
+            self._unbound_failures = 0
+            self.breaker.record_success()
+            vehicles = self._snapshot_vehicles()
+            if _status_fetched(previous, vehicles):
                 # Reset failure counter on success
                 if self._consecutive_failures > 0:
                     LOGGER.info(
@@ -141,9 +317,28 @@ class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
                         self._consecutive_failures,
                     )
                 self._consecutive_failures = 0
-                self._unbound_failures = 0
                 self._last_error = None
-                return self.account.vehicles
+            elif self._consecutive_failures >= MAX_TRANSIENT_FAILURES:
+                # Only sources fetched now and then, such as the charging
+                # settings, came through. They do not end an outage of the
+                # status, which most entities depend on; their values are
+                # published with the first refresh that fetches it again.
+                raise UpdateFailed(
+                    "Vehicle status unavailable after "
+                    f"{self._consecutive_failures} attempts"
+                )
+            self.last_refresh = dt_util.utcnow()
+            # A refresh can succeed with only some sources; values of the
+            # others are still those of the restored snapshot, or older.
+            if all(
+                DataSource.STATUS in vehicle.fetched_at for vehicle in vehicles.values()
+            ):
+                self.restored_at = None
+                self.snapshots.async_schedule_save(vehicles)
+            self._update_vehicle_modes(vehicles)
+            self._settle_fast_poll_leases(vehicles)
+            self._update_latency_issue()
+            return vehicles
         except SmartVehicleUnboundError as exception:
             # Only terminal once it repeats: a lone 8040 is usually the cloud
             # catching up after a session refresh. Below the threshold it goes
@@ -173,6 +368,8 @@ class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
                 exception,
             )
             raise UpdateFailed(f"Remote service error: {exception}") from exception
+        except UpdateFailed:
+            raise
         except (
             SmartAPIError,
             httpx.HTTPStatusError,
@@ -198,13 +395,208 @@ class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
                 f"Unexpected error ({error_type}): {error_msg}"
             ) from exception
 
-    def _handle_transient_failure(self, exception: Exception) -> Any:
+    async def async_config_entry_background_refresh(self) -> bool:
+        """
+        Serve the saved snapshot and run the first refresh in the background.
+
+        Setup can then go on without waiting for the cloud. The entities start out
+        with the snapshot values and go live once the refresh completes. A failure
+        of that refresh is handled like that of any later one: transient errors
+        keep serving the snapshot and authentication errors start a reauth.
+
+        Returns:
+            bool: True if the refresh was started, False if there is no snapshot to
+                serve. Entities need to know the vehicles to be set up, so the caller
+                then has to await async_config_entry_first_refresh instead.
+        """
+        if not await self._async_restore_snapshots():
+            return False
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN} first refresh"
+        )
+        return True
+
+    async def _async_restore_snapshots(self) -> bool:
+        """Serve the saved snapshots of the entry's vehicles as initial data."""
+        snapshots = await self.snapshots.async_load()
+        restored = [
+            snapshot
+            for vin, snapshot in snapshots.items()
+            if (self.vins is None or vin in self.vins)
+            and self.hub.restore(vin, snapshot.data)
+        ]
+        if not restored:
+            return False
+        self.restored_at = min(snapshot.saved_at for snapshot in restored)
+        self.data = self._snapshot_vehicles()
+        LOGGER.debug("Restored vehicle data fetched at %s", self.restored_at)
+        return True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities, counting how many wrote their state."""
+        self.stale_sources = self._find_stale_sources()
+        self._dispatch_writes = StateWriteStats()
+        super().async_update_listeners()
+        self.state_writes = self._dispatch_writes
+        LOGGER.debug(
+            "Coordinator update wrote %d entity states, skipped %d unchanged",
+            self.state_writes.written,
+            self.state_writes.skipped,
+        )
+        self._publish_changes()
+
+    @callback
+    def count_state_write(self, *, written: bool) -> None:
+        """Count an entity that wrote, or skipped writing, its state."""
+        if written:
+            self._dispatch_writes.written += 1
+        else:
+            self._dispatch_writes.skipped += 1
+
+    @callback
+    def async_subscribe(
+        self,
+        vin: str,
+        field_paths: Iterable[str],
+        update_callback: Callable[[str, Mapping[str, FieldChange]], None],
+    ) -> CALLBACK_TYPE:
+        """
+        Call back whenever a refresh changes some of the values of a vehicle.
+
+        The callback gets the VIN and the changes it asked for by path, once per
+        refresh that changed any of them. It runs in the event loop and must not
+        block.
+
+        Parameters:
+            vin (str): The vehicle to watch.
+            field_paths (Iterable[str]): The values to watch, e.g.
+                "battery.charging_status", or "safety" for all safety values.
+            update_callback (Callable[[str, Mapping[str, FieldChange]], None]):
+                Called with the VIN and the matching changes.
+
+        Returns:
+            CALLBACK_TYPE: Ends the subscription.
+        """
+        subscription = FieldSubscription(tuple(field_paths), update_callback)
+        self._subscriptions.setdefault(vin, []).append(subscription)
+
+        @callback
+        def unsubscribe() -> None:
+            subscriptions = self._subscriptions.get(vin, [])
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(vin, None)
+
+        return unsubscribe
+
+    @callback
+    def _publish_changes(self) -> None:
+        """
+        Tell subscribers and the event bus what the last refresh changed.
+
+        Compares the snapshot with the one published last. Nothing is published
+        for the first snapshot, nor while failures keep serving the same one.
+        """
+        previous, data = self._published_data, self.data
+        self._published_data = data
+        if (
+            not isinstance(previous, FleetData)
+            or not isinstance(data, FleetData)
+            or previous.version == data.version
+        ):
+            return
+        for vin, vehicle in data.items():
+            if (old := previous.get(vin)) is None or old is vehicle:
+                continue
+            if not (changes := diff_vehicle_data(old, vehicle)):
+                continue
+            LOGGER.debug("Vehicle %s changed: %s", vin, ", ".join(changes))
+            self.hass.bus.async_fire(
+                EVENT_VEHICLE_CHANGED,
+                {
+                    "vin": vin,
+                    "version": data.version,
+                    "changed": {
+                        path: event_value(change.new)
+                        for path, change in changes.items()
+                    },
+                    "previous": {
+                        path: event_value(change.old)
+                        for path, change in changes.items()
+                    },
+                },
+            )
+            for subscription in list(self._subscriptions.get(vin, ())):
+                if matching := subscription.matching(changes):
+                    try:
+                        subscription.update_callback(vin, matching)
+                    except Exception:
+                        LOGGER.exception("Error in vehicle change subscriber")
+
+    @property
+    def account(self) -> SmartAccount:
+        """Return the account of the hub, shared with the login's other entries."""
+        return self.hub.account
+
+    def _own_vehicles(self) -> dict[str, Any] | None:
+        """Return the vehicles of the account that this entry tracks."""
+        vehicles = self.account.vehicles
+        if vehicles is None or self.vins is None:
+            return vehicles
+        return {vin: vehicle for vin, vehicle in vehicles.items() if vin in self.vins}
+
+    def _snapshot_vehicles(self) -> FleetData:
+        """
+        Take the next immutable snapshot of the entry's vehicles.
+
+        The library updates its vehicles in place, so entities and anything
+        comparing one update with the next read the snapshot instead. Vehicles
+        and subsystems that did not change are shared with the previous one.
+        """
+        vehicles = self._own_vehicles()
+        freshness = self.hub.freshness
+        return build_fleet_data(
+            vehicles,
+            self.data,
+            {vin: freshness.fetched(vin) for vin in vehicles or ()},
+        )
+
+    def source_fetched(self, vin: str, source: DataSource) -> bool:
+        """Return whether a source of a vehicle was fetched since setup."""
+        vehicle = self.data.get(vin) if isinstance(self.data, FleetData) else None
+        return vehicle is not None and source in vehicle.fetched_at
+
+    def _find_stale_sources(self) -> frozenset[tuple[str, DataSource]]:
+        """Return the sources that kept failing past the staleness limit."""
+        if self.data is None:
+            return frozenset()
+        now = dt_util.utcnow()
+        freshness = self.hub.freshness
+        return frozenset(
+            (vin, source)
+            for vin in self.data
+            for source in stale_sources(
+                freshness.fetched(vin), now, self.staleness_limit, freshness.ttls
+            )
+        )
+
+    def _handle_transient_failure(
+        self, exception: Exception, *, reached_cloud: bool = True
+    ) -> Any:
         """Serve cached data for a transient failure, or fail once it persists.
 
         Keeps entities alive across a cloud blip and only raises UpdateFailed
         when there is nothing cached or the failures stop looking transient.
+        Refreshes the circuit breaker held back pass reached_cloud=False: they
+        count as failed refreshes, but not as failures of the cloud.
         """
         self._consecutive_failures += 1
+        if reached_cloud:
+            self.breaker.record_failure(dt_util.utcnow())
+        # While the breaker is open, the next scheduled refresh is its probe.
+        self._apply_polling_interval()
         error_type = type(exception).__name__
         error_msg = f"{error_type}: {exception}" if str(exception) else error_type
 
@@ -246,34 +638,216 @@ class SmartHashtagDataUpdateCoordinator(DataUpdateCoordinator):
             f"API unavailable after {self._consecutive_failures} attempts: {error_msg}"
         ) from exception
 
-    def set_update_interval(self, key: str, deltatime: timedelta) -> None:
-        """Update intervals by key and select the shortest"""
-        LOGGER.info(f"Updatefrequency set for {key}: {deltatime}")
-        self._update_intervals[key] = deltatime
-        sorted_intervals = list(self._update_intervals.values())
-        sorted_intervals.sort()
-        if sorted_intervals:
-            self.update_interval = sorted_intervals[0]
-
-    def reset_update_interval(self, key: str):
-        """Remove interval for this key and select shortest remaining or default"""
-        if key in self._update_intervals:
-            del self._update_intervals[key]
-            LOGGER.info("Update frequency reset for %s", key)
-
-        # Recalculate the update interval
-        if self._update_intervals:
-            sorted_intervals = list(self._update_intervals.values())
-            sorted_intervals.sort()
-            self.update_interval = sorted_intervals[0]
-        elif self.config_entry:
-            # No active intervals, revert to configured default
-            self.update_interval = timedelta(
-                seconds=self.config_entry.options.get(
-                    CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                )
+    def _update_vehicle_modes(self, vehicles: dict[str, Any] | None) -> None:
+        """
+        Classify every vehicle and poll at the rate its mode calls for.
+
+        Runs once per successful update, so the polling interval follows the
+        data itself rather than how often Home Assistant reads entity states.
+        """
+        modes = {
+            vin: detect_vehicle_mode(vehicle)
+            for vin, vehicle in (vehicles or {}).items()
+        }
+        for vin in self.polling.vehicles.keys() - modes.keys():
+            self.polling.forget(vin)
+        for vin, mode in modes.items():
+            if self.vehicle_modes.get(vin) != mode:
+                LOGGER.debug("Vehicle %s is now %s", vin, mode)
+            self.polling.observe(vin, mode)
+        self.vehicle_modes = modes
+        self._apply_polling_interval()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """
+        Schedule the next refresh with the hub rather than on a timer of our own.
+
+        The hub starts the refreshes of all entries of the login that are due
+        around the same time together, so a login polls in one pass.
+        """
+        if self._update_interval_seconds is None:
+            return
+        if self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        self._unsub_refresh = self.hub.schedule_refresh(
+            self.hass,
+            self.config_entry.entry_id,
+            self._update_interval_seconds,
+            self._async_start_scheduled_refresh,
+        )
+
+    @callback
+    def _async_start_scheduled_refresh(self) -> None:
+        """Start the refresh the hub found due, in the entry's background."""
+        self._unsub_refresh = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._handle_refresh_interval(),
+            name=f"{self.name} - {self.config_entry.title} - refresh",
+            eager_start=True,
+        )
+
+    def _apply_polling_interval(self, *, reschedule: bool = False) -> None:
+        """
+        Poll at the interval the scheduler settled on.
+
+        Updates take the new interval into account when they schedule the next
+        one. Changes made between updates pass reschedule=True so the refresh
+        already scheduled moves as well instead of firing at the old rate.
+
+        Polling never gets faster than refreshes take, as measured by the
+        latency tracker. While the circuit breaker is open, the next refresh
+        waits for its probe instead, whatever the vehicles and the leases ask for.
+        """
+        reason = self.polling.reason
+        interval = self.polling.interval
+        if (floor := self.latency.floor) is not None and interval < floor:
+            reason = f"refreshes take up to {floor}"
+            interval = floor
+        if (backoff := self.breaker.delay(dt_util.utcnow())) is not None:
+            reason = BreakerState.OPEN
+            interval = backoff
+        if interval == self.update_interval:
+            return
+        LOGGER.debug("Polling every %s (%s)", interval, reason)
+        self.update_interval = interval
+        if reschedule and self._listeners:
+            self._schedule_refresh()
+
+    def _update_latency_issue(self) -> None:
+        """
+        Raise a repair issue while refreshes take longer than the options allow.
+
+        The shortest configured interval is then never met: polling slows down to
+        the refresh duration instead. The issue goes away once the cloud answers
+        fast enough again, or the intervals are raised.
+        """
+        floor = self.latency.floor
+        shortest = min(self.polling.state_intervals.values())
+        issue_id = latency_issue_id(self.config_entry.entry_id)
+        if floor is None or shortest >= floor:
+            if self._latency_issue:
+                ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+                self._latency_issue = False
+            return
+        if not self._latency_issue:
+            LOGGER.warning(
+                "Refreshes take up to %s, polling every %s is not possible",
+                floor,
+                shortest,
             )
-        else:
-            # Fallback to default if no config entry
-            self.update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
-            LOGGER.warning("Using fallback update interval due to missing config_entry")
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=ISSUE_INTERVAL_BELOW_LATENCY,
+            translation_placeholders={
+                "interval": str(int(shortest.total_seconds())),
+                "latency": str(int(floor.total_seconds())),
+            },
+        )
+        self._latency_issue = True
+
+    def command_queue(self, vin: str) -> CommandQueue:
+        """Return the queue the remote commands of a vehicle go through."""
+        if (queue := self._command_queues.get(vin)) is None:
+            queue = self._command_queues[vin] = CommandQueue(self, vin)
+        return queue
+
+    @property
+    def fast_poll_leases(self) -> Mapping[str, FastPollLease]:
+        """Return the fast poll leases currently held, by key."""
+        return self.polling.leases
+
+    @callback
+    def acquire_fast_poll(
+        self,
+        key: str,
+        interval: timedelta,
+        ttl: timedelta,
+        until: Callable[[Any], bool] | None = None,
+    ) -> FastPollLease:
+        """
+        Poll at least every interval for a while, typically after a remote command.
+
+        The lease ends when the TTL elapses, or earlier once until returns True
+        for the data of a successful update, e.g. when charging_status reaches
+        CHARGING. Acquiring a key that is already held replaces that lease.
+
+        Parameters:
+            key (str): Identifies the lease, so it can be renewed or released.
+            interval (timedelta): The polling interval to hold the coordinator to.
+            ttl (timedelta): How long the lease lasts at most.
+            until (Callable[[Any], bool] | None): Predicate on the coordinator data
+                that ends the lease early once it returns True.
+
+        Returns:
+            FastPollLease: The lease now held.
+        """
+        self._cancel_lease_timer(key)
+        lease = FastPollLease(key, interval, dt_util.utcnow() + ttl, until)
+        self.polling.add_lease(lease)
+        self._lease_timers[key] = async_call_later(
+            self.hass, ttl, partial(self._expire_fast_poll_lease, key)
+        )
+        LOGGER.debug("Fast poll lease %s: every %s for up to %s", key, interval, ttl)
+        self._apply_polling_interval(reschedule=True)
+        return lease
+
+    @callback
+    def release_fast_poll(self, key: str) -> None:
+        """End a fast poll lease before it expires."""
+        self._cancel_lease_timer(key)
+        if self.polling.release(key) is not None:
+            LOGGER.debug("Fast poll lease %s released", key)
+            self._apply_polling_interval(reschedule=True)
+
+    @callback
+    def _expire_fast_poll_lease(self, key: str, _now: datetime) -> None:
+        """Drop a lease whose TTL elapsed and slow down right away."""
+        self._lease_timers.pop(key, None)
+        if self.polling.release(key) is not None:
+            LOGGER.debug("Fast poll lease %s expired", key)
+            self._apply_polling_interval(reschedule=True)
+
+    def _settle_fast_poll_leases(self, data: Any) -> None:
+        """Drop the leases whose condition the fresh data meets."""
+        for lease in self.polling.settle_leases(dt_util.utcnow(), data):
+            LOGGER.debug("Fast poll lease %s ended", lease.key)
+            self._cancel_lease_timer(lease.key)
+        self._apply_polling_interval()
+
+    def _cancel_lease_timer(self, key: str) -> None:
+        """Cancel the expiry timer of a lease, if one is pending."""
+        if (cancel := self._lease_timers.pop(key, None)) is not None:
+            cancel()
+
+    async def async_shutdown(self) -> None:
+        """
+        Stop everything the coordinator started, save what is pending and shut down.
+
+        Drops the remote commands still waiting, cancels the fetch in flight,
+        the lease timers and the leases themselves, and drops the change
+        subscribers. Runs on unload, and is safe to run
+        again when Home Assistant calls it once more after the entry unloaded.
+        """
+        for queue in self._command_queues.values():
+            await queue.async_shutdown()
+        task, self._update_task = self._update_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+            if not task.cancelled():
+                task.exception()
+        for key in list(self._lease_timers):
+            self._cancel_lease_timer(key)
+        for key in list(self.polling.leases):
+            self.polling.release(key)
+        self._subscriptions.clear()
+        await self.snapshots.async_flush()
+        await self.heating_levels.async_flush()
+        await super().async_shutdown()
@@ -2,15 +2,13 @@
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from custom_components.smarthashtag.entity import SmartHashtagEntity
 
 from .const import CONF_VEHICLE, LOGGER
 from .coordinator import SmartHashtagDataUpdateCoordinator
-
-# API returns position in 1/3600000 of a degree (1/10000 arc seconds)
-POSITION_SCALE_FACTOR = 3600000
+from .freshness import DataSource
 
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
@@ -19,14 +17,13 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
 
     This asynchronous function initializes and adds a SmartVehicleLocation entity using the configuration entry's
     runtime data. It retrieves the coordinator from the entry, extracts the vehicle information from the coordinator's
-    configuration (using the CONF_VEHICLE key), and schedules the addition of the device tracker with an immediate update.
-    Finally, it triggers an asynchronous refresh of the coordinator to update the device state.
+    configuration (using the CONF_VEHICLE key), and adds the device tracker. Its state comes from the coordinator
+    data; adding it does not ask the cloud for another refresh.
 
     Parameters:
         hass (HomeAssistant): The Home Assistant instance.
         entry (ConfigEntry): Configuration entry that contains runtime data for the device tracker.
         async_add_entities (Callable[[List[Entity], bool], None]): Function to add device tracker entities to Home Assistant.
-            The entity is added with update_before_add set to True.
 
     Returns:
         None
@@ -34,10 +31,7 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     coordinator = entry.runtime_data
     vehicle = coordinator.config_entry.data.get(CONF_VEHICLE)
 
-    async_add_entities(
-        [SmartVehicleLocation(coordinator, vehicle)], update_before_add=True
-    )
-    await coordinator.async_request_refresh()
+    async_add_entities([SmartVehicleLocation(coordinator, vehicle)])
 
 
 class SmartVehicleLocation(SmartHashtagEntity, TrackerEntity):
@@ -57,63 +51,48 @@ class SmartVehicleLocation(SmartHashtagEntity, TrackerEntity):
         self.coordinator = coordinator
         self._vehicle = vehicle
         self.name = f"Smart {vehicle}"
-
-    def _get_vehicle_data(self):
-        """Get vehicle data from coordinator.
-
-        Returns:
-            Vehicle object or None if data is not available.
-        """
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self._vehicle)
+        self._battery_level: int | None = None
+        self._data_source = (vehicle, DataSource.STATUS)
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Compute the position and the battery level from the vehicle data."""
+        super()._update_from_coordinator()
+        vehicle = None
+        if self.coordinator.data is not None:
+            vehicle = self.coordinator.data.get(self._vehicle)
+
+        latitude = longitude = altitude = position_can_be_trusted = None
+        battery_level = None
+        if vehicle is not None:
+            try:
+                position = vehicle.position
+                # The snapshot holds the position in degrees.
+                latitude = position.latitude
+                longitude = position.longitude
+                altitude = position.altitude
+                position_can_be_trusted = position.position_can_be_trusted
+            except (AttributeError, TypeError) as err:
+                LOGGER.error("AttributeError getting position: %s", err)
+            try:
+                battery_level = vehicle.battery.remaining_battery_percent.value
+            except AttributeError as err:
+                LOGGER.error("AttributeError getting battery_level: %s", err)
+
+        self._attr_latitude = latitude
+        self._attr_longitude = longitude
+        self._battery_level = battery_level
+        self._attr_extra_state_attributes = {
+            **(self._attr_extra_state_attributes or {}),
+            "altitude": altitude,
+            "position_can_be_trusted": position_can_be_trusted,
+        }
 
     @property
     def source_type(self):
         """Return device tracker source type."""
         return SourceType.GPS
 
-    @property
-    def longitude(self):
-        """Return longitude."""
-        try:
-            vehicle = self._get_vehicle_data()
-            if vehicle is None:
-                return None
-            return vehicle.position.longitude / POSITION_SCALE_FACTOR
-        except AttributeError as err:
-            LOGGER.error("AttributeError getting longitude: %s", err)
-            return None
-
-    @property
-    def latitude(self):
-        """Return latitude."""
-        try:
-            vehicle = self._get_vehicle_data()
-            if vehicle is None:
-                return None
-            return vehicle.position.latitude / POSITION_SCALE_FACTOR
-        except AttributeError as err:
-            LOGGER.error("AttributeError getting latitude: %s", err)
-            return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return device state attributes."""
-        altitude = None
-        position_can_be_trusted = None
-        try:
-            vehicle = self._get_vehicle_data()
-            if vehicle is not None:
-                altitude = vehicle.position.altitude
-                position_can_be_trusted = vehicle.position.position_can_be_trusted
-        except AttributeError as err:
-            LOGGER.error("AttributeError getting extra_state_attributes: %s", err)
-        return {
-            "altitude": altitude,
-            "position_can_be_trusted": position_can_be_trusted,
-        }
-
     @property
     def force_update(self):
         """Disable forced updated since we are polling via the coordinator updates."""
@@ -125,11 +104,4 @@ class SmartVehicleLocation(SmartHashtagEntity, TrackerEntity):
 
         Percentage from 0-100.
         """
-        try:
-            vehicle = self._get_vehicle_data()
-            if vehicle is None:
-                return None
-            return vehicle.battery.remaining_battery_percent.value
-        except AttributeError as err:
-            LOGGER.error("AttributeError getting battery_level: %s", err)
-            return None
+        return self._battery_level
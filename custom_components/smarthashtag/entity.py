@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, LOGGER, NAME, VERSION
+from .const import ATTR_RESTORED_AT, ATTRIBUTION, LOGGER, NAME, VERSION
 from .coordinator import SmartHashtagDataUpdateCoordinator
+from .freshness import DataSource
 
 
 class SmartHashtagEntity(CoordinatorEntity[SmartHashtagDataUpdateCoordinator]):
@@ -32,6 +36,10 @@ class SmartHashtagEntity(CoordinatorEntity[SmartHashtagDataUpdateCoordinator]):
             Any exceptions encountered during configuration access are caught and logged; they are not re-raised.
         """
         super().__init__(coordinator=coordinator)
+        self._written_state: tuple[Any, ...] | None = None
+        # The VIN and the source the entity's values come from, if any. The
+        # entity turns unavailable while that source is stale.
+        self._data_source: tuple[str, DataSource] | None = None
         try:
             self._attr_unique_id = coordinator.config_entry.entry_id
             self._attr_device_info = DeviceInfo(
@@ -47,3 +55,76 @@ class SmartHashtagEntity(CoordinatorEntity[SmartHashtagDataUpdateCoordinator]):
             )
         except Exception as e:
             LOGGER.error(f"Cannot access coordinator config: {e}")
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the state from the data the coordinator already has."""
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
+
+    @property
+    def available(self) -> bool:
+        """Return if the last update worked and the entity's source is not stale."""
+        return super().available and self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Compute the state once per coordinator update, and write it if it changed.
+
+        Most values are the same from one poll to the next. Writing them anyway
+        costs a state machine update and an event per entity, so the write is
+        skipped when the state, the attributes and the availability match what
+        was written last time.
+        """
+        self._update_from_coordinator()
+        if self._state_signature() == self._written_state:
+            self.coordinator.count_state_write(written=False)
+            return
+        self.coordinator.count_state_write(written=True)
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, remembering what was written."""
+        # Every write counts, including the first one and the optimistic
+        # states of remote commands, or an update could skip writing a state
+        # that differs from the one in the state machine.
+        self._written_state = self._state_signature()
+        super().async_write_ha_state()
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return everything about the entity that a state write publishes."""
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.capability_attributes,
+            self.unit_of_measurement,
+            self.icon,
+        )
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """
+        Compute the entity's _attr_* values from the current coordinator data.
+
+        Home Assistant reads several properties per state write, and more
+        when the UI or templates ask. Entities that derive their state from
+        the vehicle data do so here, once per update, so their properties are
+        plain attribute reads. Subclasses extend this and call super() first.
+        """
+        self._attr_available = self._data_source not in self.coordinator.stale_sources
+        # Mark values that come from a saved snapshot, not from the cloud.
+        restored_at = self.coordinator.restored_at
+        if (
+            restored_at is not None
+            and self._data_source is not None
+            and self.coordinator.source_fetched(*self._data_source)
+        ):
+            restored_at = None
+        self._attr_extra_state_attributes = (
+            {ATTR_RESTORED_AT: restored_at.isoformat()}
+            if restored_at is not None
+            else None
+        )
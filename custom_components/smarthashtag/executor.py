@@ -0,0 +1,175 @@
+"""Budgeted, retried and hedged calls to the Smart cloud within one refresh."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from .const import LOGGER
+from .latency import MIN_LATENCY_SAMPLES, LatencyTracker
+
+_T = TypeVar("_T")
+
+# Seconds a whole refresh may take when the caller sets no budget. A healthy
+# refresh is a chain of sequential cloud calls that can take ~20s.
+REFRESH_BUDGET = 30
+
+# Seconds held back for each call still planned after the running one. A
+# single slow call can then use up most of the budget, but never the time
+# the rest of the chain needs to get its data in.
+MIN_CALL_BUDGET = 3
+
+# Times an idempotent call is repeated after a timeout or a dropped
+# connection, as long as the budget still has room for it.
+MAX_RETRIES = 1
+
+# Seconds a call runs at least before it is hedged. Below that, a second
+# request costs the cloud more than waiting saves.
+MIN_HEDGE_DELAY = 1.0
+
+# Errors after which repeating an idempotent call can succeed.
+RETRYABLE_ERRORS = (TimeoutError, httpx.TransportError)
+
+
+class RequestExecutor:
+    """
+    Run the cloud calls of refreshes within per-refresh budgets.
+
+    Keeps the latencies of every kind of call across refreshes, so calls
+    running past their usual 95th percentile can be hedged with a duplicate
+    request. The hub holds one executor per login.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the executor without any latencies measured yet."""
+        self.latency: defaultdict[str, LatencyTracker] = defaultdict(LatencyTracker)
+        self.retries = 0
+        self.hedges = 0
+
+    def budget(self, seconds: float = REFRESH_BUDGET) -> RefreshBudget:
+        """Return the budget of a refresh starting now."""
+        return RefreshBudget(self, seconds)
+
+
+class RefreshBudget:
+    """
+    The time left for the calls of one refresh.
+
+    Each call gets what is left of the refresh, minus MIN_CALL_BUDGET for
+    every call still planned after it. When the budget runs out, calls fail
+    with TimeoutError right away, so the sources fetched so far are kept
+    instead of the whole refresh being cut off by a single timeout.
+    """
+
+    def __init__(self, executor: RequestExecutor, seconds: float) -> None:
+        """Initialize the budget of a refresh of the given length."""
+        self._executor = executor
+        self._loop = asyncio.get_running_loop()
+        self.deadline = self._loop.time() + seconds
+        self._planned = 0
+
+    @property
+    def remaining(self) -> float:
+        """Return the seconds left until the refresh deadline."""
+        return self.deadline - self._loop.time()
+
+    def plan(self, calls: int) -> None:
+        """Announce the calls the refresh makes next, to keep time for them."""
+        self._planned = calls
+
+    def _call_timeout(self) -> float:
+        """Return the seconds the next call may take."""
+        remaining = self.remaining
+        reserve = MIN_CALL_BUDGET * max(self._planned - 1, 0)
+        return max(remaining - reserve, min(MIN_CALL_BUDGET, remaining))
+
+    async def run(
+        self,
+        name: str,
+        call: Callable[[], Awaitable[_T]],
+        *,
+        idempotent: bool = False,
+    ) -> _T:
+        """
+        Make one cloud call within the budget.
+
+        Idempotent calls, the GETs of the vehicle data, are retried after a
+        timeout or a dropped connection while the budget allows, and hedged:
+        once one runs past the 95th percentile of its kind, a duplicate is
+        sent and whichever answers first wins.
+
+        Parameters:
+            name (str): The kind of call, under which its latency is kept.
+            call (Callable[[], Awaitable]): Makes the call; called again for
+                every retry and hedge.
+            idempotent (bool): Whether the call may be sent more than once.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            TimeoutError: If the budget ran out before the call answered.
+        """
+        executor = self._executor
+        attempts = 0
+        try:
+            while True:
+                timeout = self._call_timeout()
+                if timeout <= 0:
+                    raise TimeoutError(f"No time left in the refresh for {name}")
+                try:
+                    return await self._attempt(name, call, timeout, hedge=idempotent)
+                except RETRYABLE_ERRORS as exception:
+                    if (
+                        not idempotent
+                        or attempts >= MAX_RETRIES
+                        or self._call_timeout() < MIN_CALL_BUDGET
+                    ):
+                        raise
+                    attempts += 1
+                    executor.retries += 1
+                    LOGGER.debug("Retrying %s after %r", name, exception)
+        finally:
+            self._planned = max(self._planned - 1, 0)
+
+    async def _attempt(
+        self,
+        name: str,
+        call: Callable[[], Awaitable[_T]],
+        timeout: float,
+        *,
+        hedge: bool,
+    ) -> _T:
+        """Make a call, and a hedge of it if it runs late, within a timeout."""
+        tracker = self._executor.latency[name]
+        hedge_after: float | None = None
+        if hedge and tracker.samples >= MIN_LATENCY_SAMPLES:
+            hedge_after = max(tracker.p95 or 0.0, MIN_HEDGE_DELAY)
+        started = self._loop.time()
+        pending: set[asyncio.Future[Any]] = {asyncio.ensure_future(call())}
+        try:
+            async with asyncio.timeout(timeout):
+                if hedge_after is not None and hedge_after < timeout:
+                    done, _ = await asyncio.wait(pending, timeout=hedge_after)
+                    if not done:
+                        self._executor.hedges += 1
+                        LOGGER.debug("Hedging %s after %.1fs", name, hedge_after)
+                        pending.add(asyncio.ensure_future(call()))
+                while True:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    failed = [future for future in done if future.exception()]
+                    if succeeded := [future for future in done if future not in failed]:
+                        tracker.record(self._loop.time() - started)
+                        return succeeded[0].result()
+                    # A failed request is only final if no other one runs.
+                    if not pending:
+                        return failed[0].result()
+        finally:
+            for future in pending:
+                future.cancel()
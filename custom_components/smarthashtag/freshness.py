@@ -0,0 +1,147 @@
+"""Per-source data freshness for Smart #1/#3."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+
+class DataSource(StrEnum):
+    """Cloud endpoint that feeds part of a vehicle's data."""
+
+    STATUS = "status"
+    CHARGING_SETTINGS = "charging_settings"
+    OTA = "ota"
+    JOURNAL = "journal"
+    STATE = "state"
+
+
+# Vehicle subsystems each source fills in. pysmarthashtag parses battery,
+# climate, safety, running, maintenance, tires and position from the one
+# status response, so those subsystems cannot be fetched one by one; their
+# freshness is that of the status source.
+SOURCE_SUBSYSTEMS: dict[DataSource, tuple[str, ...]] = {
+    DataSource.STATUS: (
+        "battery",
+        "climate",
+        "safety",
+        "running",
+        "maintenance",
+        "tires",
+        "position",
+    ),
+    DataSource.CHARGING_SETTINGS: ("battery",),
+    DataSource.OTA: ("ota",),
+    DataSource.JOURNAL: ("last_trip",),
+    DataSource.STATE: ("state",),
+}
+
+# Values of a subsystem that come from another source than the subsystem.
+FIELD_SOURCES: dict[tuple[str, str], DataSource] = {
+    ("battery", "charging_target_soc"): DataSource.CHARGING_SETTINGS,
+}
+
+
+def source_of(subsystem: str | None, field: str = "") -> DataSource:
+    """
+    Return the source a value of the vehicle data comes from.
+
+    Parameters:
+        subsystem (str | None): The vehicle attribute holding the value, None
+            for the vehicle itself, e.g. its odometer.
+        field (str): The attribute of the subsystem, if any.
+
+    Returns:
+        DataSource: The source whose failures leave the value stale.
+    """
+    if subsystem is not None:
+        if (source := FIELD_SOURCES.get((subsystem, field))) is not None:
+            return source
+        for source, subsystems in SOURCE_SUBSYSTEMS.items():
+            if subsystem in subsystems:
+                return source
+    # The vehicle's own values and its service values are parsed from status.
+    return DataSource.STATUS
+
+
+# How long the data of each source stays fresh. Status carries everything
+# that changes during a charge or a drive and is fetched on every poll. The
+# charging target, firmware versions, trip journal and TBox flags change on
+# the scale of hours, yet used to cost four extra calls per poll, which is
+# most of the chain during a 5s fast poll.
+SOURCE_TTLS: dict[DataSource, timedelta] = {
+    DataSource.STATUS: timedelta(0),
+    DataSource.CHARGING_SETTINGS: timedelta(minutes=15),
+    DataSource.OTA: timedelta(hours=6),
+    DataSource.JOURNAL: timedelta(minutes=15),
+    DataSource.STATE: timedelta(minutes=15),
+}
+
+
+class FreshnessTracker:
+    """Remember when each source was last fetched for each VIN."""
+
+    def __init__(self, ttls: dict[DataSource, timedelta] | None = None) -> None:
+        """Initialize the tracker, optionally with TTLs other than the defaults."""
+        self.ttls = dict(SOURCE_TTLS if ttls is None else ttls)
+        self._fetched: dict[str, dict[DataSource, datetime]] = {}
+
+    def due(self, vin: str, now: datetime) -> set[DataSource]:
+        """
+        Return the sources of a VIN that have to be fetched now.
+
+        Parameters:
+            vin (str): The vehicle to check.
+            now (datetime): The current time.
+
+        Returns:
+            set[DataSource]: Sources never fetched or past their TTL.
+        """
+        fetched = self._fetched.get(vin, {})
+        return {
+            source
+            for source, ttl in self.ttls.items()
+            if (fetched_at := fetched.get(source)) is None or now - fetched_at >= ttl
+        }
+
+    def mark(self, vin: str, sources: Iterable[DataSource], now: datetime) -> None:
+        """Record that the given sources of a VIN were fetched successfully."""
+        fetched = self._fetched.setdefault(vin, {})
+        for source in sources:
+            fetched[source] = now
+
+    def fetched(self, vin: str) -> dict[DataSource, datetime]:
+        """Return when each source of a VIN was last fetched successfully."""
+        return dict(self._fetched.get(vin, {}))
+
+
+def stale_sources(
+    fetched: Mapping[DataSource, datetime],
+    now: datetime,
+    limit: timedelta,
+    ttls: Mapping[DataSource, timedelta] = SOURCE_TTLS,
+) -> set[DataSource]:
+    """
+    Return the sources whose data outlived the staleness limit.
+
+    A source turns stale once it kept failing for longer than the limit after
+    it became due, so sources with a long TTL do not turn stale just because
+    they are not fetched on every poll. Sources never fetched are not stale:
+    there is no data to serve from them in the first place.
+
+    Parameters:
+        fetched (Mapping[DataSource, datetime]): When each source was last
+            fetched successfully.
+        now (datetime): The current time.
+        limit (timedelta): How long a source may keep failing.
+        ttls (Mapping[DataSource, timedelta]): How long each source stays fresh.
+
+    Returns:
+        set[DataSource]: The stale sources.
+    """
+    return {
+        source
+        for source, fetched_at in fetched.items()
+        if now - fetched_at > ttls.get(source, timedelta(0)) + limit
+    }
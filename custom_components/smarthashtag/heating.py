@@ -0,0 +1,93 @@
+"""Persistent heating levels of the seats and the steering wheel."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from pysmarthashtag.control.climate import HeatingLocation
+
+from .const import DOMAIN, LOGGER
+
+STORAGE_VERSION = 1
+
+# Seconds to gather level changes before writing them. Picking the levels of
+# the seats and the steering wheel one after another ends up in one write.
+HEATING_LEVELS_SAVE_DELAY = 10
+
+# Where earlier versions kept the levels in the config entry data.
+LEGACY_DATA_KEY = "selects"
+
+
+class HeatingLevelStore:
+    """
+    Keep the heating levels chosen for an entry's vehicle in HA storage.
+
+    The levels are read from memory; changes are written in batches. They
+    used to live in the config entry data, where every change updated the
+    entry and reloaded it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of one config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.heating_levels.{entry_id}"
+        )
+        self._levels: dict[str, int] = {}
+        self._pending = False
+
+    async def async_load(self, legacy: Mapping[str, Any] | None = None) -> bool:
+        """
+        Load the saved levels.
+
+        Parameters:
+            legacy (Mapping | None): The levels saved in the config entry data
+                by earlier versions, taken over if nothing was stored yet.
+
+        Returns:
+            bool: Whether legacy levels were taken over and saved.
+        """
+        stored = await self._store.async_load()
+        if stored is not None:
+            self._levels = dict(stored.get("levels") or {})
+            return False
+        if not legacy:
+            return False
+        self._levels = {str(location): int(level) for location, level in legacy.items()}
+        await self._store.async_save(self._data_to_save())
+        LOGGER.debug("Moved the heating levels out of the config entry")
+        return True
+
+    def get(self, location: HeatingLocation) -> int:
+        """Return the level chosen for a location, off if none was."""
+        return self._levels.get(location.value, 0)
+
+    @callback
+    def async_set(self, location: HeatingLocation, level: int) -> None:
+        """Choose the level of a location, saving it with the changes around it."""
+        if self._levels.get(location.value, 0) == level:
+            return
+        self._levels[location.value] = level
+        if not self._pending:
+            # Later changes join the scheduled write, which saves the levels
+            # as they are by then.
+            self._pending = True
+            self._store.async_delay_save(self._data_to_save, HEATING_LEVELS_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write pending changes right away."""
+        if self._pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the saved levels."""
+        self._pending = False
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the levels to write."""
+        self._pending = False
+        return {"levels": dict(self._levels)}
@@ -0,0 +1,618 @@
+"""Smart account sessions shared between config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Collection, Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from pysmarthashtag.account import SmartAccount
+from pysmarthashtag.const import EndpointUrls
+from pysmarthashtag.models import SmartAuthError
+from pysmarthashtag.vehicle.vehicle import SmartVehicle
+
+try:
+    from pysmarthashtag.models import SmartVehicleUnboundError
+except ImportError:  # pragma: no cover - depends on installed pysmarthashtag
+    # Older versions report no typed unbound error; nothing to let through.
+    SmartVehicleUnboundError = SmartAuthError
+
+from .const import CONF_VEHICLE, DOMAIN, DOMAIN_DATA, LOGGER
+from .executor import REFRESH_BUDGET, RefreshBudget, RequestExecutor
+from .freshness import DataSource, FreshnessTracker
+from .session import (
+    RENEWED_SESSION_LIFETIME,
+    SESSION_REFRESH_SHARE,
+    SESSION_RETRY_DELAY,
+    SessionStore,
+    async_get_session_store,
+    export_session,
+    import_session,
+)
+from .transport import use_shared_transport
+
+# Share of its interval by which a scheduled refresh may run early, to join
+# the refreshes another entry of the login is running. The poll loops of a
+# login's entries thus fall into step instead of drifting apart.
+REFRESH_JOIN_SHARE = 0.25
+
+# Errors of a data source that fail the whole fetch instead of only the
+# source, since no other call of the login can get past them either.
+FATAL_FETCH_ERRORS = (SmartAuthError, SmartVehicleUnboundError)
+
+
+@dataclass(slots=True)
+class ScheduledRefresh:
+    """The next refresh an entry of the login polls for."""
+
+    due: float
+    """Loop time at which the refresh is due."""
+
+    interval: float
+    """Seconds the entry polls at."""
+
+    start: Callable[[], None]
+    """Starts the refresh of the entry."""
+
+
+class SmartAccountHub:
+    """
+    One authenticated Smart session shared by every entry of the same login.
+
+    Each config entry tracks a single vehicle, but a Smart login often owns
+    several. Giving every entry its own SmartAccount meant one login, one
+    token rotation and one vehicle list per car, and sessions that rotated
+    each other's tokens away. The hub holds the only SmartAccount of a
+    login, tracks the union of the VINs its entries want, and runs every
+    fetch under one lock: the cloud binds requests to whichever vehicle
+    was selected last, so two fetches must never interleave.
+    """
+
+    def __init__(
+        self,
+        account: SmartAccount,
+        password: str | None = None,
+        configured_vins: Iterable[str | None] = (),
+        *,
+        hass: HomeAssistant | None = None,
+        sessions: SessionStore | None = None,
+    ) -> None:
+        """
+        Initialize the hub around an account that may not be logged in yet.
+
+        Parameters:
+            account (SmartAccount): The account holding the session.
+            password (str | None): The password the account was created with.
+            configured_vins (Iterable[str | None]): VINs of every entry of the
+                login, loaded or not, so the first vehicle list covers the
+                entries set up after the first one. None stands for all VINs.
+            hass (HomeAssistant | None): Needed to renew the session ahead of
+                its expiry.
+            sessions (SessionStore | None): Where the session tokens of the
+                login are kept across restarts, None to always log in.
+        """
+        self.account = account
+        self.password = password
+        self.lock = asyncio.Lock()
+        self.freshness = FreshnessTracker()
+        self.executor = RequestExecutor()
+        self._hass = hass
+        self._sessions = sessions
+        # Whether the saved session was considered yet; a new account, e.g.
+        # after a reauth, must not resume the session of the old password.
+        self._session_resumed = sessions is None
+        self._saved_session: dict[str, Any] | None = None
+        self._cancel_session_refresh: Callable[[], None] | None = None
+        # The refreshes the entries' coordinators are scheduled for, which one
+        # timer of the hub starts together.
+        self._scheduled: dict[Hashable, ScheduledRefresh] = {}
+        self._refresh_timer: asyncio.TimerHandle | None = None
+        # Set once the last entry let go; a fetch still finishing must not
+        # schedule another renewal then.
+        self._closed = False
+        self._configured_vins = set(configured_vins)
+        self._entries: dict[str, str | None] = {}
+        # VINs a vehicle list has been fetched for; None once all were listed.
+        self._listed_vins: set[str | None] = set()
+        # VINs a full fetch refreshed for entries that have not asked yet.
+        self._prefetched_vins: set[str] = set()
+        if self._configured_vins:
+            account.tracked_vins = self.tracked_vins
+
+    @property
+    def entry_ids(self) -> Collection[str]:
+        """Return the config entries using this hub."""
+        return self._entries.keys()
+
+    @property
+    def tracked_vins(self) -> list[str] | None:
+        """Return the VINs to track, or None if an entry wants every vehicle."""
+        vins = self._configured_vins | set(self._entries.values())
+        if not vins or None in vins:
+            return None
+        return sorted(vins)
+
+    def attach(self, entry_id: str, vin: str | None) -> None:
+        """Start serving an entry that tracks one VIN, or every VIN if None."""
+        self._entries[entry_id] = vin
+        self.account.tracked_vins = self.tracked_vins
+
+    def detach(self, entry_id: str) -> bool:
+        """Stop serving an entry, returning whether other entries remain."""
+        self._configured_vins.discard(self._entries.pop(entry_id, None))
+        if self._entries:
+            self.account.tracked_vins = self.tracked_vins
+        return bool(self._entries)
+
+    def replace_account(self, account: SmartAccount, password: str) -> None:
+        """Start over with a new account, e.g. after the password changed."""
+        account.tracked_vins = self.tracked_vins
+        self.account = account
+        self.password = password
+        self.freshness = FreshnessTracker()
+        self._listed_vins = set()
+        self._prefetched_vins = set()
+        # A reauth flow saves the session it opened with the new password.
+        self._session_resumed = self._sessions is None
+        self._saved_session = None
+
+    def shutdown(self) -> None:
+        """Stop renewing the session and refreshing once no entry uses the hub."""
+        self._closed = True
+        self._cancel_session_timer()
+        self._scheduled.clear()
+        self._arm_refresh_timer(None)
+
+    def schedule_refresh(
+        self,
+        hass: HomeAssistant,
+        key: Hashable,
+        interval: float,
+        start: Callable[[], None],
+    ) -> Callable[[], None]:
+        """
+        Schedule the next refresh of an entry, in step with the login's others.
+
+        One timer serves every entry of the login. When it fires, it starts
+        each refresh that is due, and those due within REFRESH_JOIN_SHARE of
+        their interval, so the entries refresh in one pass under the lock
+        instead of each on a timer of its own.
+
+        Parameters:
+            hass (HomeAssistant): The Home Assistant instance.
+            key (Hashable): Identifies the entry; its earlier refresh is replaced.
+            interval (float): Seconds from now the refresh is due.
+            start (Callable[[], None]): Starts the refresh, without awaiting it.
+
+        Returns:
+            Callable[[], None]: Cancels the scheduled refresh.
+        """
+        scheduled = ScheduledRefresh(hass.loop.time() + interval, interval, start)
+        self._scheduled[key] = scheduled
+        self._arm_refresh_timer(hass)
+        return partial(self._cancel_refresh, hass, key, scheduled)
+
+    def _cancel_refresh(
+        self, hass: HomeAssistant, key: Hashable, scheduled: ScheduledRefresh
+    ) -> None:
+        """Cancel a scheduled refresh, unless a later one replaced it."""
+        if self._scheduled.get(key) is scheduled:
+            del self._scheduled[key]
+            self._arm_refresh_timer(hass)
+
+    def _arm_refresh_timer(self, hass: HomeAssistant | None) -> None:
+        """Set the timer for the earliest scheduled refresh, if any."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if hass is None or not self._scheduled:
+            return
+        due = min(scheduled.due for scheduled in self._scheduled.values())
+        self._refresh_timer = hass.loop.call_at(
+            due, self._start_due_refreshes, hass, due
+        )
+
+    def _start_due_refreshes(self, hass: HomeAssistant, now: float) -> None:
+        """Start the refreshes that are due, or nearly, as of the timer's time."""
+        self._refresh_timer = None
+        due = [
+            key
+            for key, scheduled in self._scheduled.items()
+            if scheduled.due - scheduled.interval * REFRESH_JOIN_SHARE <= now
+        ]
+        starts = [self._scheduled.pop(key).start for key in due]
+        self._arm_refresh_timer(hass)
+        if len(starts) > 1:
+            LOGGER.debug(
+                "Refreshing %d entries of %s together",
+                len(starts),
+                self.account.username,
+            )
+        for start in starts:
+            start()
+
+    def _cancel_session_timer(self) -> None:
+        """Cancel the pending renewal of the session, if any."""
+        if self._cancel_session_refresh is not None:
+            self._cancel_session_refresh()
+            self._cancel_session_refresh = None
+
+    async def async_fetch(
+        self,
+        vins: Collection[str] | None = None,
+        seconds: float = REFRESH_BUDGET,
+        grace: float = 0,
+    ) -> float:
+        """
+        Refresh the given vehicles, fetching only the data sources that are due.
+
+        The first fetch resumes the session saved by an earlier run, if any.
+        Without a session or a vehicle list this goes through get_vehicles(),
+        which logs in, lists the vehicles and fetches everything; the first
+        request for each other VIN it covered is served from that. After that
+        each VIN is bound once and only its stale sources are fetched. The
+        library merges each response into the vehicle data it already holds,
+        so sources skipped this time keep their previous values.
+
+        Like get_vehicles(), a failing vehicle does not fail the others; the
+        first error is raised only if no vehicle could be refreshed. The calls
+        share a budget of the given seconds, and a source whose call ran out
+        of it fails like any other source. Both the budget and the timeout
+        start once the lock is taken, so time spent waiting for the refresh
+        of another entry or for a remote command does not count.
+
+        Parameters:
+            vins (Collection[str] | None): The vehicles to refresh, or None for
+                every vehicle of the account.
+            seconds (float): The time the calls of the refresh may take.
+            grace (float): Extra time before the whole refresh times out, for
+                the work between the calls such as saving the session.
+
+        Returns:
+            float: The seconds the vehicles took to fetch, without waiting for
+                the lock or resuming and saving the session.
+        """
+        async with self.lock:
+            async with asyncio.timeout(seconds + grace):
+                if not self._session_resumed:
+                    await self._async_resume_session()
+                budget = self.executor.budget(seconds)
+                try:
+                    started = time.monotonic()
+                    await self._async_fetch(vins, budget)
+                    return time.monotonic() - started
+                finally:
+                    await self._async_save_session()
+
+    async def _async_fetch(
+        self, vins: Collection[str] | None, budget: RefreshBudget
+    ) -> None:
+        """Refresh the given vehicles; the lock must be held."""
+        if self._needs_session():
+            await self._async_fetch_all(budget)
+            self._prefetched_vins = set(self.account.vehicles or ()).difference(
+                vins or ()
+            )
+            return
+
+        account = self.account
+        now = dt_util.utcnow()
+        wanted = [vin for vin in account.vehicles if vins is None or vin in vins]
+        if prefetched := self._prefetched_vins.intersection(wanted):
+            # The full fetch that set up the session covered these
+            # already, e.g. while another entry of the login started.
+            self._prefetched_vins -= prefetched
+            wanted = [vin for vin in wanted if vin not in prefetched]
+        errors: list[Exception] = []
+        for vin in wanted:
+            try:
+                await self._async_fetch_sources(
+                    vin, account.vehicles[vin], self.freshness.due(vin, now), budget
+                )
+            except Exception as exception:
+                errors.append(exception)
+                LOGGER.warning(
+                    "Vehicle %s update failed this cycle: %s", vin, exception
+                )
+        if errors and len(errors) == len(wanted):
+            raise errors[0]
+
+    def restore(self, vin: str, data: dict[str, Any]) -> bool:
+        """
+        Seed the account with a vehicle rebuilt from its last saved data.
+
+        The next fetch updates the restored vehicle in place instead of
+        listing it again, so entities set up from it keep their vehicle.
+
+        Parameters:
+            vin (str): The vehicle to restore.
+            data (dict[str, Any]): The raw vehicle data as the library holds it.
+
+        Returns:
+            bool: True if the vehicle was restored, False if the account
+                already knows it or the data could not be read.
+        """
+        vehicles = self.account.vehicles
+        if vehicles is None or vin in vehicles:
+            return False
+        try:
+            vehicles[vin] = SmartVehicle(self.account, data)
+        except Exception as exception:
+            LOGGER.debug("Cannot restore vehicle %s: %s", vin, exception)
+            return False
+        return True
+
+    def _unlisted_vins(self) -> set[str | None]:
+        """Return the tracked VINs that need a vehicle list, None for all."""
+        if None in self._listed_vins:
+            return set()
+        tracked = self.tracked_vins
+        wanted: set[str | None] = {None} if tracked is None else set(tracked)
+        return wanted - self._listed_vins - set(self.account.vehicles or {})
+
+    def _needs_session(self) -> bool:
+        """Return whether a login or a new vehicle list is needed first."""
+        account = self.account
+        return (
+            not account.vehicles
+            or account.config.authentication.api_user_id is None
+            or bool(self._unlisted_vins())
+        )
+
+    async def _async_fetch_all(self, budget: RefreshBudget) -> None:
+        """Log in if needed, list missing vehicles and fetch all of their data."""
+        account = self.account
+        now = dt_util.utcnow()
+        unlisted = self._unlisted_vins()
+        if unlisted and account.vehicles and None not in unlisted:
+            # List only the vehicles we do not know yet. Listing again would
+            # replace the vehicle objects the entities of other entries hold.
+            tracked = account.tracked_vins
+            account.tracked_vins = sorted(unlisted)
+            try:
+                await budget.run(
+                    "get_vehicles", partial(account.get_vehicles, force_init=True)
+                )
+            finally:
+                account.tracked_vins = tracked
+        else:
+            await budget.run("get_vehicles", account.get_vehicles)
+        self._listed_vins |= unlisted
+        for vin in account.vehicles or {}:
+            self.freshness.mark(vin, DataSource, now)
+
+    async def _async_fetch_sources(
+        self,
+        vin: str,
+        vehicle: Any,
+        sources: set[DataSource],
+        budget: RefreshBudget,
+    ) -> None:
+        """
+        Fetch the given sources of one vehicle and merge them into its data.
+
+        Each source is merged as soon as it arrives, so a failing source does
+        not throw away the others: its values stay those of its last good
+        fetch, and it stays due until it succeeds. The vehicle only fails if
+        every source it was due for failed. Authentication errors and an
+        unbound VIN fail it right away, as no other source would get through
+        either. The GETs of the sources are retried and hedged within the
+        budget; selecting the vehicle is not.
+        """
+        account = self.account
+        now = dt_util.utcnow()
+        budget.plan(1 + len(sources))
+        await budget.run(
+            "select_active_vehicle", partial(account.select_active_vehicle, vin)
+        )
+        errors: list[Exception] = []
+        fetched = 0
+        for source, fetch in (
+            (DataSource.STATUS, account.get_vehicle_information),
+            (DataSource.CHARGING_SETTINGS, account.get_vehicle_soc),
+        ):
+            if source not in sources:
+                continue
+            try:
+                await budget.run(source, partial(fetch, vin), idempotent=True)
+            except FATAL_FETCH_ERRORS:
+                raise
+            except Exception as exception:
+                errors.append(exception)
+                LOGGER.warning(
+                    "Fetching %s for %s failed, keeping its last values: %s",
+                    source,
+                    vin,
+                    exception,
+                )
+                continue
+            self.freshness.mark(vin, (source,), now)
+            fetched += 1
+
+        # These endpoints fail routinely (OTA 500s, journal 8153), as they do
+        # in get_vehicles(); their failures are not worth a warning.
+        extra: dict[str, Any] = {}
+        for source, argument, fetch in (
+            (DataSource.OTA, "ota_info", account.get_vehicle_ota_info),
+            (DataSource.JOURNAL, "journal_response", account.get_trip_journal),
+            (DataSource.STATE, "state_response", account.get_vehicle_state),
+        ):
+            if source not in sources:
+                continue
+            try:
+                extra[argument] = await budget.run(
+                    source, partial(fetch, vin), idempotent=True
+                )
+            except Exception as exception:
+                LOGGER.debug("Fetching %s for %s failed: %s", source, vin, exception)
+                errors.append(exception)
+                continue
+            self.freshness.mark(vin, (source,), now)
+        if extra:
+            vehicle.combine_data({}, **extra)
+        if errors and not fetched and not extra:
+            raise errors[0]
+
+    async def _async_resume_session(self) -> None:
+        """Resume the saved session of the login instead of logging in."""
+        self._session_resumed = True
+        account = self.account
+        authentication = account.config.authentication
+        if self._sessions is None or authentication.api_user_id is not None:
+            return
+        session = await self._sessions.async_get(account.username)
+        if not session:
+            return
+        import_session(authentication, session)
+        # The login that is skipped now would have prepared the SSL context.
+        authentication.ssl_context = await account.config.get_ssl_context()
+        self._saved_session = session
+        self._schedule_session_refresh()
+        LOGGER.debug("Resumed the saved session of %s", account.username)
+
+    async def _async_save_session(self) -> None:
+        """Save the session tokens if they changed since they were saved."""
+        if self._sessions is None:
+            return
+        session = export_session(self.account.config.authentication)
+        if session is None or session == self._saved_session:
+            return
+        expiry_changed = (
+            self._saved_session is None
+            or session["expires_at"] != self._saved_session["expires_at"]
+        )
+        self._saved_session = session
+        await self._sessions.async_set(self.account.username, session)
+        if expiry_changed or self._cancel_session_refresh is None:
+            self._schedule_session_refresh()
+
+    def _schedule_session_refresh(self, delay: float | None = None) -> None:
+        """
+        Renew the session once SESSION_REFRESH_SHARE of its lifetime passed.
+
+        Parameters:
+            delay (float | None): Seconds to wait instead, e.g. to retry a
+                renewal that did not extend the session.
+        """
+        if self._hass is None or self._closed:
+            return
+        self._cancel_session_timer()
+        if delay is None:
+            now = dt_util.utcnow()
+            expires_at = self.account.config.authentication.expires_at
+            if expires_at is None:
+                expires_at = now + RENEWED_SESSION_LIFETIME
+            remaining = (expires_at - now).total_seconds()
+            delay = max(remaining * SESSION_REFRESH_SHARE, 0)
+        self._cancel_session_refresh = async_call_later(
+            self._hass, delay, self._async_refresh_session
+        )
+
+    async def _async_refresh_session(self, _now: datetime) -> None:
+        """
+        Renew the OAuth token and the API session ahead of their expiry.
+
+        Polls keep the API session alive through the library's cheap refresh,
+        but only a login or a refresh-token exchange extends the OAuth token
+        behind it. Exchanging it here, in the background, keeps polls from
+        running into an expired token and a full login; the library's refresh
+        ladder only logs in if the refresh token is rejected too.
+        """
+        self._cancel_session_timer()
+        async with self.lock:
+            authentication = self.account.config.authentication
+            if authentication.api_user_id is None:
+                # No session to renew; the next fetch logs in.
+                return
+            expires_at = authentication.expires_at
+            try:
+                await authentication.refresh_token_exchange()
+                await authentication.refresh_api_session()
+                authentication.expires_at = dt_util.utcnow() + RENEWED_SESSION_LIFETIME
+            except Exception as exception:
+                LOGGER.debug(
+                    "Refresh-token exchange for %s failed (%s), refreshing the session",
+                    self.account.username,
+                    exception,
+                )
+                try:
+                    await authentication.refresh()
+                except Exception as exception:
+                    LOGGER.warning("Could not renew the Smart session: %s", exception)
+            await self._async_save_session()
+            if authentication.expires_at == expires_at:
+                # Still close to expiry; try again rather than wait for it.
+                self._schedule_session_refresh(SESSION_RETRY_DELAY)
+
+
+def async_get_account_hub(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    endpoint_urls: EndpointUrls | None = None,
+) -> SmartAccountHub:
+    """
+    Return the hub for the login of an entry, creating it if needed.
+
+    Hubs are kept in hass.data per username. A hub whose password no longer
+    matches the entry, e.g. after a reauth, gets a fresh account so the new
+    credentials are used by every entry of that login.
+
+    Parameters:
+        hass (HomeAssistant): The Home Assistant instance.
+        entry (ConfigEntry): The entry to get the hub for.
+        endpoint_urls (EndpointUrls | None): Endpoints of the account's region,
+            None for the default EU endpoints.
+
+    Returns:
+        SmartAccountHub: The hub shared by all entries of the same login.
+    """
+    hubs: dict[str, SmartAccountHub] = hass.data.setdefault(DOMAIN_DATA, {})
+    username = entry.data[CONF_USERNAME]
+    password = entry.data[CONF_PASSWORD]
+    hub = hubs.get(username)
+    if hub is None or hub.password != password:
+        account = use_shared_transport(
+            hass,
+            SmartAccount(
+                username=username,
+                password=password,
+                endpoint_urls=endpoint_urls,
+            ),
+        )
+        if hub is None:
+            configured_vins = [
+                other.data.get(CONF_VEHICLE)
+                for other in hass.config_entries.async_entries(DOMAIN)
+                if other.data.get(CONF_USERNAME) == username
+                and other.disabled_by is None
+            ]
+            hub = hubs[username] = SmartAccountHub(
+                account,
+                password,
+                configured_vins,
+                hass=hass,
+                sessions=async_get_session_store(hass),
+            )
+        else:
+            LOGGER.debug("Credentials of %s changed, starting a new session", username)
+            hub.replace_account(account, password)
+    return hub
+
+
+def async_release_account_hub(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Detach an entry from its hub, dropping the hub with its last entry."""
+    hubs: dict[str, SmartAccountHub] = hass.data.get(DOMAIN_DATA, {})
+    username = entry.data[CONF_USERNAME]
+    hub = hubs.get(username)
+    if hub is not None and not hub.detach(entry.entry_id):
+        hub.shutdown()
+        del hubs[username]
@@ -0,0 +1,65 @@
+"""Rolling estimate of how long a refresh of the Smart cloud takes."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import timedelta
+
+# Refreshes the estimate looks back on. A refresh is a chain of cloud calls,
+# and how long it takes changes with the time of day; the last twenty keep
+# the estimate current without one outlier moving it much.
+LATENCY_WINDOW = 20
+
+# Refreshes measured before the estimate limits the interval. The first few,
+# which include the login, are no guide to the ones after.
+MIN_LATENCY_SAMPLES = 5
+
+
+class LatencyTracker:
+    """
+    Keep the durations of the last refreshes and derive an interval floor.
+
+    Polling no faster than the 95th percentile of the refresh duration keeps
+    the cloud busy for at most about half of the time. Faster polling only
+    queues refreshes back to back, at a rate set by the cloud rather than by
+    the options.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize the tracker with room for the last window durations."""
+        self._durations: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        """Add the duration of a refresh that reached the cloud."""
+        self._durations.append(seconds)
+
+    @property
+    def samples(self) -> int:
+        """Return the number of durations the estimate is based on."""
+        return len(self._durations)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a percentile of the durations, None without any."""
+        if not self._durations:
+            return None
+        ordered = sorted(self._durations)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    @property
+    def p50(self) -> float | None:
+        """Return the median refresh duration in seconds."""
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        """Return the 95th percentile of the refresh duration in seconds."""
+        return self.percentile(95)
+
+    @property
+    def floor(self) -> timedelta | None:
+        """Return the shortest interval worth polling at, None while unknown."""
+        if self.samples < MIN_LATENCY_SAMPLES or (p95 := self.p95) is None:
+            return None
+        return timedelta(seconds=math.ceil(p95))
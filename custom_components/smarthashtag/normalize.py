@@ -0,0 +1,108 @@
+"""Normalization of the vehicle data for Smart #1/#3."""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from typing import Any
+
+from pysmarthashtag.models import ValueWithUnit
+from pysmarthashtag.vehicle.battery import CHARGING_STATES
+
+from .const import LOGGER
+
+# API returns position in 1/3600000 of a degree (1/10000 arc seconds)
+POSITION_SCALE_FACTOR = 3600000
+
+# Units the library reports that Home Assistant does not know.
+# FIXME: if pysmarthashtag is updated to return the unit as °C remove this
+UNIT_ALIASES = {"C": "°C"}
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Return a value with its unit in the form Home Assistant knows.
+
+    Values with a unit get their unit translated and -0.0 reported as 0.0,
+    lists of them item by item. Anything else is returned as it is.
+    """
+    if isinstance(value, ValueWithUnit):
+        number, unit = value
+        if isinstance(number, float) and number == 0 and math.copysign(1, number) < 0:
+            number = 0.0
+        unit = UNIT_ALIASES.get(unit, unit) if unit is not None else None
+        if number is value.value and unit is value.unit:
+            return value
+        return ValueWithUnit(number, unit)
+    if isinstance(value, list) and any(
+        isinstance(item, ValueWithUnit) for item in value
+    ):
+        return [normalize_value(item) for item in value]
+    return value
+
+
+def normalize_charging_status(status: Any) -> str | None:
+    """Return a charging status the library knows, in its own spelling."""
+    if not isinstance(status, str):
+        return None
+    canonical = status.upper()
+    if canonical not in CHARGING_STATES:
+        LOGGER.debug("Unknown charging status %s; reporting unknown", status)
+        return None
+    return status if canonical == status else canonical
+
+
+def float_zero(value: Any) -> Any:
+    """Return a value that is zero as 0.0, the way a power is reported."""
+    if (
+        isinstance(value, ValueWithUnit)
+        and type(value.value) is int
+        and not value.value
+    ):
+        return ValueWithUnit(0.0, value.unit)
+    return value
+
+
+def scale_coordinate(coordinate: Any) -> float | None:
+    """Return a coordinate of the API in degrees."""
+    if isinstance(coordinate, bool) or not isinstance(coordinate, int | float):
+        return None
+    return coordinate / POSITION_SCALE_FACTOR
+
+
+# Rules for single fields, by subsystem and field, run after the units are
+# normalized.
+FIELD_RULES = {
+    ("battery", "charging_power"): float_zero,
+    ("battery", "charging_status"): normalize_charging_status,
+    ("position", "latitude"): scale_coordinate,
+    ("position", "longitude"): scale_coordinate,
+}
+
+
+def normalize_subsystem(name: str, subsystem: Any) -> Any:
+    """
+    Return a subsystem of a vehicle with canonical values.
+
+    Units are translated, -0.0 becomes 0.0, the charging status is one the
+    library knows or None, and coordinates are in degrees. The library's
+    object is left as it is: a copy is returned if any value changed.
+
+    Parameters:
+        name (str): The attribute of the vehicle holding the subsystem.
+        subsystem (Any): The subsystem as the library built it.
+
+    Returns:
+        Any: The subsystem with canonical values.
+    """
+    if not dataclasses.is_dataclass(subsystem) or isinstance(subsystem, type):
+        return subsystem
+    changes: dict[str, Any] = {}
+    for field in dataclasses.fields(subsystem):
+        value = getattr(subsystem, field.name)
+        normalized = normalize_value(value)
+        if (rule := FIELD_RULES.get((name, field.name))) is not None:
+            normalized = rule(normalized)
+        if normalized is not value:
+            changes[field.name] = normalized
+    return dataclasses.replace(subsystem, **changes) if changes else subsystem
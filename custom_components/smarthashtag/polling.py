@@ -0,0 +1,239 @@
+"""Adaptive polling scheduler for Smart #1/#3."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Any
+
+from homeassistant.const import CONF_SCAN_INTERVAL
+
+from .const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_DRIVING_INTERVAL,
+    DEFAULT_CHARGING_INTERVAL,
+    DEFAULT_DRIVING_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    LOGGER,
+)
+from .vehicle_mode import VehicleMode
+
+# Parked readings in a row before an active state is left. The cloud reports
+# a charge or a drive a little behind the car, and a single stale "parked"
+# snapshot in the middle of one must not drop us to the idle interval.
+# Entering an active state needs no confirmation, so real events are never
+# picked up any later than the interval that was running when they started.
+EXIT_HYSTERESIS = 2
+
+# Factor by which the interval grows on each parked poll after an active
+# state ends, until it reaches the idle interval. A car that was just
+# charging or driving is the one most likely to start again soon.
+DECAY_FACTOR = 2
+
+
+class PollingState(StrEnum):
+    """Polling state of a single vehicle."""
+
+    IDLE = "idle"
+    CHARGING = "charging"
+    DRIVING = "driving"
+    CONDITIONING = "conditioning"
+    DECAY = "decay"
+
+
+MODE_STATES: dict[VehicleMode, PollingState] = {
+    VehicleMode.CHARGING: PollingState.CHARGING,
+    VehicleMode.DC_CHARGING: PollingState.CHARGING,
+    VehicleMode.DRIVING: PollingState.DRIVING,
+    VehicleMode.CONDITIONING: PollingState.CONDITIONING,
+}
+
+
+@dataclass
+class VehiclePolling:
+    """Where a vehicle is in the polling state machine, and why."""
+
+    state: PollingState
+    interval: timedelta
+    reason: str
+    parked_streak: int = 0
+
+
+@dataclass
+class FastPollLease:
+    """
+    A time-boxed request to poll faster than the vehicle state asks for.
+
+    The lease ends at expires_at at the latest, or as soon as until returns
+    True for the data of a successful update, whichever comes first.
+    """
+
+    key: str
+    interval: timedelta
+    expires_at: datetime
+    until: Callable[[Any], bool] | None = None
+
+    def is_satisfied(self, data: Any) -> bool:
+        """Return whether the data shows what the lease was waiting for."""
+        if self.until is None or data is None:
+            return False
+        try:
+            return bool(self.until(data))
+        except Exception as exception:
+            # A broken predicate must not break polling; the TTL still ends it.
+            LOGGER.debug("Fast poll lease %s predicate failed: %s", self.key, exception)
+            return False
+
+
+class PollingScheduler:
+    """
+    Decide how often the coordinator polls, one state machine per VIN.
+
+    Each vehicle moves between idle and one active state per vehicle mode.
+    Entering an active state happens on the first poll that reports it;
+    leaving one takes EXIT_HYSTERESIS parked polls and is followed by a decay
+    phase that grows the interval back to idle. The coordinator polls at the
+    shortest interval any vehicle, or any fast poll lease, asks for.
+    """
+
+    def __init__(self, options: Mapping[str, Any]) -> None:
+        """Initialize the scheduler with the intervals from the options flow."""
+        self.vehicles: dict[str, VehiclePolling] = {}
+        self._leases: dict[str, FastPollLease] = {}
+        self.apply_options(options)
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Take the per-state intervals from the options flow."""
+        driving = timedelta(
+            seconds=options.get(CONF_DRIVING_INTERVAL, DEFAULT_DRIVING_INTERVAL)
+        )
+        # Conditioning has no option of its own; the cabin temperature moves
+        # on the same minute scale as a drive, so it shares that interval.
+        self.state_intervals: dict[PollingState, timedelta] = {
+            PollingState.IDLE: timedelta(
+                seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            ),
+            PollingState.CHARGING: timedelta(
+                seconds=options.get(CONF_CHARGING_INTERVAL, DEFAULT_CHARGING_INTERVAL)
+            ),
+            PollingState.DRIVING: driving,
+            PollingState.CONDITIONING: driving,
+        }
+        for polling in self.vehicles.values():
+            if polling.state in self.state_intervals:
+                polling.interval = self.state_intervals[polling.state]
+            else:
+                polling.interval = min(polling.interval, self.idle_interval)
+
+    @property
+    def idle_interval(self) -> timedelta:
+        """Return the interval used while every vehicle is parked."""
+        return self.state_intervals[PollingState.IDLE]
+
+    @property
+    def leases(self) -> Mapping[str, FastPollLease]:
+        """Return the fast poll leases currently held, by key."""
+        return self._leases
+
+    def observe(self, vin: str, mode: VehicleMode) -> VehiclePolling:
+        """
+        Feed the mode detected by the latest update into the VIN's state machine.
+
+        Parameters:
+            vin (str): The vehicle the mode was detected for.
+            mode (VehicleMode): The mode detected from the latest snapshot.
+
+        Returns:
+            VehiclePolling: The state the vehicle is in afterwards.
+        """
+        polling = self.vehicles.get(vin)
+        if polling is None:
+            polling = self.vehicles[vin] = VehiclePolling(
+                PollingState.IDLE, self.idle_interval, "parked"
+            )
+
+        if (state := MODE_STATES.get(mode)) is not None:
+            polling.state = state
+            polling.interval = self.state_intervals[state]
+            polling.reason = f"{mode} reported"
+            polling.parked_streak = 0
+        elif polling.state in MODE_STATES.values():
+            polling.parked_streak += 1
+            if polling.parked_streak < EXIT_HYSTERESIS:
+                polling.reason = (
+                    f"parked reported {polling.parked_streak}/{EXIT_HYSTERESIS}, "
+                    f"still {polling.state}"
+                )
+            else:
+                polling.reason = f"{polling.state} ended, decaying to idle"
+                polling.state = PollingState.DECAY
+                self._decay(polling)
+        elif polling.state is PollingState.DECAY:
+            self._decay(polling)
+
+        return polling
+
+    def _decay(self, polling: VehiclePolling) -> None:
+        """Grow the interval of a decaying vehicle, settling on idle at the top."""
+        polling.interval = polling.interval * DECAY_FACTOR
+        if polling.interval >= self.idle_interval:
+            polling.state = PollingState.IDLE
+            polling.interval = self.idle_interval
+            polling.reason = "parked"
+
+    def forget(self, vin: str) -> None:
+        """Drop the state machine of a vehicle that is no longer reported."""
+        self.vehicles.pop(vin, None)
+
+    def add_lease(self, lease: FastPollLease) -> None:
+        """Hold a lease, replacing any earlier one with the same key."""
+        self._leases[lease.key] = lease
+
+    def release(self, key: str) -> FastPollLease | None:
+        """Drop the lease for a key, returning it if there was one."""
+        return self._leases.pop(key, None)
+
+    def settle_leases(self, now: datetime, data: Any = None) -> list[FastPollLease]:
+        """
+        Drop every lease that ran out or whose condition the data now meets.
+
+        Parameters:
+            now (datetime): The current time, compared against each expiry.
+            data (Any): The data of the latest successful update, if any.
+
+        Returns:
+            list[FastPollLease]: The leases that were dropped.
+        """
+        ended = [
+            lease
+            for lease in self._leases.values()
+            if now >= lease.expires_at or lease.is_satisfied(data)
+        ]
+        for lease in ended:
+            del self._leases[lease.key]
+        return ended
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the interval the coordinator should poll at."""
+        return min(
+            [
+                self.idle_interval,
+                *(polling.interval for polling in self.vehicles.values()),
+                *(lease.interval for lease in self._leases.values()),
+            ]
+        )
+
+    @property
+    def reason(self) -> str:
+        """Return what currently decides the polling interval."""
+        interval = self.interval
+        for key, lease in self._leases.items():
+            if lease.interval == interval:
+                return f"lease {key}"
+        for vin, polling in self.vehicles.items():
+            if polling.interval == interval and polling.state is not PollingState.IDLE:
+                return f"{vin}: {polling.reason}"
+        return "parked"
@@ -7,6 +7,7 @@ from homeassistant.core import HomeAssistant
 from pysmarthashtag.control.climate import HeatingLocation
 
 from . import SmartHashtagConfigEntry
+from .commands import RemoteCommand
 from .const import CONF_VEHICLE, LOGGER
 from .coordinator import SmartHashtagDataUpdateCoordinator
 from .entity import SmartHashtagEntity
@@ -87,7 +88,7 @@ async def async_setup_entry(
     for location in HeatingLocation:
         entities.append(SmartPreHeatedLocation(coordinator, vehicle, location))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class SmartPreHeatedLocation(SmartHashtagEntity, SelectEntity):
@@ -128,15 +129,7 @@ class SmartPreHeatedLocation(SmartHashtagEntity, SelectEntity):
 
     def _get_level_for_location(self, location: HeatingLocation) -> Literal[0, 1, 2, 3]:
         """Get the heating level for the specified location."""
-        if (
-            self.coordinator.config_entry
-            and "selects" in self.coordinator.config_entry.data
-        ):
-            level = self.coordinator.config_entry.data["selects"].get(location.value, 0)
-            return level
-        else:
-            LOGGER.debug("No heating level found for %s", location)
-        return 0
+        return self.coordinator.heating_levels.get(location)
 
     async def async_select_option(self, option: str, **kwargs):
         """Change the selected option."""
@@ -149,21 +142,20 @@ class SmartPreHeatedLocation(SmartHashtagEntity, SelectEntity):
             return
 
         level: int = HEATING_LEVEL_OPTIONS_MAP[option]
-        self._vehicle.climate_control.set_heating_level(self._location, level)
 
         # save the selected level
-        new_data = self.coordinator.config_entry.data.copy()
-        if "selects" not in new_data:
-            new_data["selects"] = {}
-        else:
-            # Create a copy of the nested selects dict to avoid mutating the original
-            new_data["selects"] = new_data["selects"].copy()
-        new_data["selects"][self._location.value] = level
-        self.hass.config_entries.async_update_entry(
-            self.coordinator.config_entry, data=new_data
-        )
+        self.coordinator.heating_levels.async_set(self._location, level)
+        self.async_write_ha_state()
         LOGGER.debug(f"Setting {self._location} to %s", level)
 
+        async def apply() -> None:
+            self._vehicle.climate_control.set_heating_level(self._location, level)
+
+        # Behind a conditioning command being sent, which sends the levels too.
+        await self.coordinator.command_queue(self._vehicle_vin).async_send(
+            RemoteCommand(f"heating_{self._location.value}", level, apply, cloud=False)
+        )
+
     @property
     def current_option(self) -> str:
         """Return current heated steering setting."""
@@ -3,24 +3,22 @@
 from __future__ import annotations
 
 import dataclasses
-from datetime import timedelta
+from collections.abc import Callable, Iterable
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.core import callback
 from pysmarthashtag.models import ValueWithUnit
 
-from .const import (
-    CONF_CHARGING_INTERVAL,
-    CONF_DRIVING_INTERVAL,
-    CONF_VEHICLE,
-    DEFAULT_CHARGING_INTERVAL,
-    DEFAULT_DRIVING_INTERVAL,
-    LOGGER,
-)
+from .const import CONF_VEHICLE, LOGGER
 from .coordinator import SmartHashtagDataUpdateCoordinator
 from .entity import SmartHashtagEntity
+from .freshness import DataSource, source_of
 from .sensor_groups import (
     ENTITY_BATTERY_DESCRIPTIONS,
+    ENTITY_CIRCUIT_BREAKER_DESCRIPTIONS,
     ENTITY_CLIMATE_DESCRIPTIONS,
+    ENTITY_DIAGNOSTIC_DESCRIPTIONS,
     ENTITY_GENERAL_DESCRIPTIONS,
     ENTITY_MAINTENANCE_DESCRIPTIONS,
     ENTITY_RUNNING_DESCRIPTIONS,
@@ -28,6 +26,9 @@ from .sensor_groups import (
     ENTITY_TIRE_DESCRIPTIONS,
 )
 
+# Stands for a vehicle, or a section of it, that has no data yet.
+_MISSING = object()
+
 
 def remove_vin_from_key(key: str) -> str:
     """Remove the vin from the key."""
@@ -39,489 +40,309 @@ def vin_from_key(key: str) -> str:
     return key.split("_")[0]
 
 
-async def async_setup_entry(hass, entry, async_add_devices):
-    """
-    Initialize the Smart Hashtag sensor platform for Home Assistant.
+@dataclasses.dataclass(frozen=True, slots=True)
+class SensorGroup:
+    """How the sensors of one description group read the vehicle data."""
 
-    This asynchronous function sets up and registers sensor devices for a Smart Hashtag vehicle by iterating over
-    multiple predefined sensor entity descriptions. It retrieves the coordinator from the configuration entry’s runtime data,
-    extracts the vehicle identifier from the coordinator’s configuration, and creates sensor instances with updated entity
-    descriptions that incorporate the vehicle identifier. The sensors added include battery range, tire, general update,
-    maintenance, running, climate, and safety sensors.
+    section: str | None
+    """Vehicle attribute holding the group's data, None for the vehicle itself."""
 
-    Parameters:
-        hass (HomeAssistant): The Home Assistant instance.
-        entry (ConfigEntry): The configuration entry that provides integration-specific data, including runtime data and
-            the vehicle configuration.
-        async_add_devices (Callable[[Iterable[SensorEntity]], None]): A callback function used to add the sensor entities
-            to Home Assistant.
+    remember_last_value: bool = True
+    """Keep serving the last value while the section has no data."""
 
-    Returns:
-        None
+    unit_from_data: bool = True
+    """Report the unit that comes with the value over the description's."""
 
-    Example:
-        await async_setup_entry(hass, entry, async_add_devices)
-    """
-    coordinator = entry.runtime_data
-    vehicle = coordinator.config_entry.data.get(CONF_VEHICLE)
+    errors: tuple[type[Exception], ...] = (AttributeError,)
+    """Lookup errors that mean the value is not available."""
 
-    async_add_devices(
-        SmartHashtagBatteryRangeSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_BATTERY_DESCRIPTIONS
-    )
+    quiet: bool = False
+    """Log lookup errors at debug level, e.g. for data many cars do not send."""
 
-    async_add_devices(
-        SmartHashtagTireSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_TIRE_DESCRIPTIONS
-    )
 
-    async_add_devices(
-        SmartHashtagUpdateSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_GENERAL_DESCRIPTIONS
-    )
+@dataclasses.dataclass(frozen=True, slots=True)
+class SensorResolver:
+    """
+    Where one sensor finds its value, worked out once when it is set up.
 
-    async_add_devices(
-        SmartHashtagMaintenanceSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_MAINTENANCE_DESCRIPTIONS
-    )
+    Sensor keys carry the VIN and the attribute path, e.g.
+    "<vin>_tire_pressure_0". Splitting them on every read cost more than
+    the lookup itself, and Home Assistant reads several properties per
+    state write, so the key is taken apart once here.
+    """
 
-    async_add_devices(
-        SmartHashtagRunningSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_RUNNING_DESCRIPTIONS
-    )
+    vin: str
+    group: SensorGroup
+    section: str | None
+    attribute: str
+    index: int | str | None = None
+    """Position in the attribute for tires, key in the section for service."""
+
+    transform: Callable[[SmartHashtagSensor, Any, Any], Any] | None = None
+    """Turns (sensor, vehicle, data) into the value, replacing the default."""
+
+    icon: Callable[[Any], str] | None = None
+    """Returns the icon for the vehicle, replacing the description's."""
+
+    variant_specific: bool = False
+    """The field is only sent by some vehicle variants; log its absence as info."""
+
+    source: DataSource = DataSource.STATUS
+    """The cloud endpoint the value comes from."""
+
+    def lookup(self, vehicle: Any) -> Any:
+        """Return the raw data of the sensor, or _MISSING if there is none."""
+        if vehicle is None:
+            return _MISSING
+        source = vehicle if self.section is None else getattr(vehicle, self.section)
+        if source is None:
+            return _MISSING
+        if self.attribute:
+            source = getattr(source, self.attribute)
+        if self.index is not None:
+            source = source[self.index]
+        return source
+
+
+SENSOR_GROUPS: tuple[tuple[tuple[SensorEntityDescription, ...], SensorGroup], ...] = (
+    (ENTITY_BATTERY_DESCRIPTIONS, SensorGroup("battery", remember_last_value=False)),
+    (
+        ENTITY_TIRE_DESCRIPTIONS,
+        SensorGroup(
+            "tires", errors=(AttributeError, IndexError, TypeError), quiet=True
+        ),
+    ),
+    (ENTITY_GENERAL_DESCRIPTIONS, SensorGroup(None, remember_last_value=False)),
+    (ENTITY_MAINTENANCE_DESCRIPTIONS, SensorGroup("maintenance", unit_from_data=False)),
+    (ENTITY_RUNNING_DESCRIPTIONS, SensorGroup("running")),
+    (ENTITY_CLIMATE_DESCRIPTIONS, SensorGroup("climate")),
+    (ENTITY_SAFETY_DESCRIPTIONS, SensorGroup("safety")),
+)
 
-    async_add_devices(
-        SmartHashtagClimateSensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_CLIMATE_DESCRIPTIONS
-    )
 
-    async_add_devices(
-        SmartHashtagSafetySensor(
-            coordinator=coordinator,
-            entity_description=dataclasses.replace(
-                entity_description, key=f"{vehicle}_{entity_description.key}"
-            ),
-        )
-        for entity_description in ENTITY_SAFETY_DESCRIPTIONS
-    )
+def _charging_power(sensor: SmartHashtagSensor, vehicle: Any, data: Any) -> Any:
+    """Keep the last charging power while charging reports 0 W, see #292."""
+    if data.value is not None and data.value != 0:
+        sensor.last_valid_value = data.value
+    is_charging = vehicle.battery.charging_status in ("CHARGING", "DC_CHARGING")
+    if is_charging and (data.value is None or data.value == 0):
+        if sensor.last_valid_value is not None:
+            return sensor.last_valid_value
+    return data.value
 
 
-class SmartHashtagBatteryRangeSensor(SmartHashtagEntity, SensorEntity):
-    """Battery Sensor class."""
+def _charger_connection(sensor: SmartHashtagSensor, vehicle: Any, data: Any) -> Any:
+    """Report the name the library derives from the raw connection code."""
+    # The raw code cannot serve as an enum option.
+    return vehicle.battery.charger_connection_state
 
-    def __init__(
-        self,
-        coordinator: SmartHashtagDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the sensor class."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
-        self.entity_description = entity_description
-        self._last_valid_value = None
 
-    @property
-    def native_value(self) -> int:
-        """Return the native value of the sensor."""
-        try:
-            vehicle = self.coordinator.account.vehicles.get(
-                vin_from_key(self.entity_description.key)
-            )
-            if vehicle is None or vehicle.battery is None:
-                return self._last_valid_value
+def _charging_status(sensor: SmartHashtagSensor, vehicle: Any, data: Any) -> Any:
+    """Report the charging status as one of the sensor's options."""
+    # The snapshot only holds statuses the library knows, see normalize.py.
+    return data.lower() if isinstance(data, str) else data
 
-            data = getattr(
-                vehicle.battery,
-                remove_vin_from_key(self.entity_description.key),
-            )
 
-            if "charging_current" in self.entity_description.key:
-                if data.value != 0:
-                    self.coordinator.set_update_interval(
-                        "charging",
-                        timedelta(
-                            seconds=self.coordinator.config_entry.options.get(
-                                CONF_CHARGING_INTERVAL, DEFAULT_CHARGING_INTERVAL
-                            )
-                        ),
-                    )
-                    self.hass.async_create_task(
-                        self.coordinator.async_request_refresh()
-                    )
-                else:
-                    self.coordinator.reset_update_interval("charging")
-
-            if "charging_power" in self.entity_description.key:
-                # Store valid non-zero values for future use
-                if data.value is not None and data.value != 0:
-                    self._last_valid_value = data.value
-                # When charging is active but power reads as 0, retain last valid value
-                charging_status = vehicle.battery.charging_status
-                is_charging = charging_status in ("CHARGING", "DC_CHARGING")
-                if is_charging and (data.value is None or data.value == 0):
-                    if self._last_valid_value is not None:
-                        return self._last_valid_value
-                # Handle -0.0 case (return 0.0 only if not charging or no previous value)
-                if data.value == -0.0:
-                    return 0.0
-
-            if "charger_connection_status" in self.entity_description.key:
-                # The raw code cannot serve as an enum option, so report the name
-                # the library derives from it.
-                return vehicle.battery.charger_connection_state
-
-            if "charging_status" in self.entity_description.key:
-                if isinstance(data, str):
-                    data = data.lower()
-                    allowed = set(self.entity_description.options or {})
-                    if allowed and data not in allowed:
-                        LOGGER.debug(
-                            "Charging status %s not in allowed options %s; reporting unknown",
-                            data,
-                            allowed,
-                        )
-                        return None
-                return data
-
-            if isinstance(data, ValueWithUnit):
-                return data.value
-
-            return data
-
-        except AttributeError as err:
-            LOGGER.error(
-                "AttributeError value: %s (%s)", self.entity_description.key, err
-            )
-            return self._last_valid_value
+def _engine_icon(vehicle: Any) -> str:
+    """Return the icon following the engine state."""
+    if vehicle is not None and vehicle.engine_state == "engine_running":
+        return "mdi:engine"
+    return "mdi:engine-off"
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
-        try:
-            vehicle = self.coordinator.account.vehicles.get(
-                vin_from_key(self.entity_description.key)
-            )
-            if vehicle is None or vehicle.battery is None:
-                return None
 
-            data = getattr(
-                vehicle.battery,
-                remove_vin_from_key(self.entity_description.key),
-            )
-            if "charging_status" in self.entity_description.key:
-                return None
-            if "charger_connection_status" in self.entity_description.key:
-                return None
-            if isinstance(data, ValueWithUnit):
-                return data.unit
+# Per-sensor hooks, by section and attribute.
+_TRANSFORMS: dict[tuple[str | None, str], Callable[..., Any]] = {
+    ("battery", "charging_power"): _charging_power,
+    ("battery", "charger_connection_status"): _charger_connection,
+    ("battery", "charging_status"): _charging_status,
+}
+_ICONS: dict[tuple[str | None, str], Callable[[Any], str]] = {
+    (None, "engine_state"): _engine_icon,
+}
+_VARIANT_SPECIFIC: set[tuple[str | None, str]] = {("climate", "interior_PM25")}
 
-            return data
 
-        except AttributeError as err:
-            LOGGER.debug(
-                "AttributeError unit: %s (%s)", self.entity_description.key, err
-            )
-            return None
+def compile_resolver(
+    vin: str, group: SensorGroup, description: SensorEntityDescription
+) -> SensorResolver:
+    """
+    Work out where a sensor of a group finds its value.
 
+    Parameters:
+        vin (str): The vehicle the sensor belongs to.
+        group (SensorGroup): The group the description belongs to.
+        description (SensorEntityDescription): The description, with the key
+            as the group declares it, without the VIN.
 
-class SmartHashtagTireSensor(SmartHashtagEntity, SensorEntity):
-    """Tire Status class."""
+    Returns:
+        SensorResolver: The resolver the sensor reads its value with.
+    """
+    section, attribute = group.section, description.key
+    index: int | str | None = None
+    if section == "tires":
+        # One sensor per wheel, e.g. "tire_pressure_0".
+        attribute, position = attribute.rsplit("_", maxsplit=1)
+        index = int(position)
+    elif section is None and attribute.startswith("service"):
+        # e.g. "service_daysToService", read from the vehicle's service dict.
+        section, index = "service", attribute.rsplit("_", maxsplit=1)[-1]
+        attribute = ""
+    return SensorResolver(
+        vin=vin,
+        group=group,
+        section=section,
+        attribute=attribute,
+        index=index,
+        transform=_TRANSFORMS.get((section, attribute)),
+        icon=_ICONS.get((section, attribute)),
+        variant_specific=(section, attribute) in _VARIANT_SPECIFIC,
+        source=source_of(section, attribute),
+    )
 
-    def __init__(
-        self,
-        coordinator: SmartHashtagDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the sensor class."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
-        self.entity_description = entity_description
-        self._last_valid_value = None
 
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        try:
-            key = "_".join(self.entity_description.key.split("_")[1:-1])
-            tire_idx = int(self.entity_description.key.split("_")[-1])
-            tires = self.coordinator.account.vehicles.get(
-                vin_from_key(self.entity_description.key)
-            ).tires
+def _with_vin(
+    vehicle: str | None, descriptions: Iterable[SensorEntityDescription]
+) -> Iterable[tuple[SensorEntityDescription, SensorEntityDescription]]:
+    """Yield each description along with a copy keyed by the VIN."""
+    for description in descriptions:
+        yield (
+            description,
+            dataclasses.replace(description, key=f"{vehicle}_{description.key}"),
+        )
 
-            if not tires:
-                return self._last_valid_value
 
-            value = getattr(tires, key)[tire_idx].value
-            self._last_valid_value = value
-            return value
+async def async_setup_entry(hass, entry, async_add_devices):
+    """
+    Initialize the Smart Hashtag sensor platform for Home Assistant.
 
-        except (AttributeError, IndexError, TypeError) as err:
-            LOGGER.debug(
-                "Tire value unavailable for %s: %s", self.entity_description.key, err
-            )
-            return self._last_valid_value
+    This asynchronous function sets up and registers sensor devices for a Smart Hashtag vehicle from the predefined
+    sensor entity description groups. Each description gets the vehicle identifier in its key, and each sensor a
+    resolver compiled from its group, so reading its state needs no parsing of the key. The sensors added include
+    battery range, tire, general update, maintenance, running, climate, safety, polling and
+    circuit breaker sensors.
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
-        try:
-            key = "_".join(self.entity_description.key.split("_")[1:-1])
-            tire_idx = int(self.entity_description.key.split("_")[-1])
-            tires = self.coordinator.account.vehicles.get(
-                vin_from_key(self.entity_description.key)
-            ).tires
+    Parameters:
+        hass (HomeAssistant): The Home Assistant instance.
+        entry (ConfigEntry): The configuration entry that provides integration-specific data, including runtime data and
+            the vehicle configuration.
+        async_add_devices (Callable[[Iterable[SensorEntity]], None]): A callback function used to add the sensor entities
+            to Home Assistant.
 
-            if not tires:
-                return None
+    Returns:
+        None
 
-            data = getattr(tires, key)[tire_idx]
+    Example:
+        await async_setup_entry(hass, entry, async_add_devices)
+    """
+    coordinator = entry.runtime_data
+    vehicle = coordinator.config_entry.data.get(CONF_VEHICLE)
 
-        except (AttributeError, IndexError, TypeError) as err:
-            LOGGER.debug(
-                "Tire unit unavailable for %s: %s", self.entity_description.key, err
+    for descriptions, group in SENSOR_GROUPS:
+        async_add_devices(
+            SmartHashtagSensor(
+                coordinator=coordinator,
+                entity_description=entity_description,
+                resolver=compile_resolver(str(vehicle), group, description),
             )
-            return None
+            for description, entity_description in _with_vin(vehicle, descriptions)
+        )
 
-        # FIXME: if pysmarthashtag is updated to return the unit as °C remove this
-        if data.unit == "C":
-            return "°C"
+    async_add_devices(
+        SmartHashtagPollingSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for _, entity_description in _with_vin(vehicle, ENTITY_DIAGNOSTIC_DESCRIPTIONS)
+    )
 
-        return data.unit
+    async_add_devices(
+        SmartHashtagCircuitBreakerSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for _, entity_description in _with_vin(
+            vehicle, ENTITY_CIRCUIT_BREAKER_DESCRIPTIONS
+        )
+    )
 
 
-class SmartHashtagUpdateSensor(SmartHashtagEntity, SensorEntity):
-    """Tire Status class."""
+class SmartHashtagSensor(SmartHashtagEntity, SensorEntity):
+    """Vehicle data sensor, computing its state through a compiled resolver."""
 
     def __init__(
         self,
         coordinator: SmartHashtagDataUpdateCoordinator,
         entity_description: SensorEntityDescription,
+        resolver: SensorResolver,
     ) -> None:
         """Initialize the sensor class."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
         self.entity_description = entity_description
-        self._last_valid_value = None
-
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None:
-                return self._last_valid_value
-
-            if key.startswith("service"):
-                key = self.entity_description.key.split("_")[-1]
-                if vehicle.service is None:
-                    return self._last_valid_value
-                data = vehicle.service[key]
-            else:
-                data = getattr(
-                    vehicle, remove_vin_from_key(self.entity_description.key)
-                )
-
-            if key == "engine_state":
-                if data == "engine_running":
-                    self.coordinator.set_update_interval(
-                        "driving",
-                        timedelta(
-                            seconds=self.coordinator.config_entry.options.get(
-                                CONF_DRIVING_INTERVAL, DEFAULT_DRIVING_INTERVAL
-                            )
-                        ),
-                    )
-                    self.hass.async_create_task(
-                        self.coordinator.async_request_refresh()
-                    )
-                    self.icon = "mdi:engine"
-                else:
-                    self.coordinator.reset_update_interval("driving")
-                    self.icon = "mdi:engine-off"
-
-            if isinstance(data, ValueWithUnit):
-                return data.value
-            return data
-
-        except AttributeError as err:
-            LOGGER.error(
-                "AttributeError value: %s (%s)", self.entity_description.key, err
-            )
-            return self._last_valid_value
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
+        self.resolver = resolver
+        self.last_valid_value: Any = None
+        self._data_source = (resolver.vin, resolver.source)
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Compute the value, the unit and the icon from the vehicle data."""
+        super()._update_from_coordinator()
+        resolver = self.resolver
+        data = self.coordinator.data
+        vehicle = data.get(resolver.vin) if data is not None else None
         try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None:
-                return self.entity_description.native_unit_of_measurement
-            if key.startswith("service"):
-                key = key.rsplit("_", maxsplit=1)[-1]
-                if vehicle.service is None:
-                    return self.entity_description.native_unit_of_measurement
-                data = vehicle.service[key]
-            else:
-                data = getattr(vehicle, key)
-            if isinstance(data, ValueWithUnit):
-                return data.unit
-        except AttributeError as err:
-            LOGGER.debug(
-                "AttributeError in native_unit_of_measurement: %s (%s)",
+            data = resolver.lookup(vehicle)
+        except resolver.group.errors as err:
+            self._log_lookup_error(err)
+            data = _MISSING
+
+        self._attr_native_value = self._value(vehicle, data)
+        unit = self.entity_description.native_unit_of_measurement
+        if (
+            resolver.group.unit_from_data
+            and isinstance(data, ValueWithUnit)
+            and data.unit is not None
+        ):
+            unit = data.unit
+        self._attr_native_unit_of_measurement = unit
+        if resolver.icon is not None:
+            self._attr_icon = resolver.icon(vehicle)
+
+    def _value(self, vehicle: Any, data: Any) -> Any:
+        """Return the value of the sensor for the data it looked up."""
+        if data is _MISSING:
+            return self.last_valid_value
+        resolver = self.resolver
+        if resolver.transform is not None:
+            try:
+                return resolver.transform(self, vehicle, data)
+            except resolver.group.errors as err:
+                self._log_lookup_error(err)
+                return self.last_valid_value
+        value = data.value if isinstance(data, ValueWithUnit) else data
+        if resolver.group.remember_last_value:
+            self.last_valid_value = value
+        return value
+
+    def _log_lookup_error(self, err: Exception) -> None:
+        """Log why the value of the sensor could not be read."""
+        if self.resolver.variant_specific:
+            LOGGER.info(
+                "Field '%s' not found in data (not available in this vehicle variant)",
                 self.entity_description.key,
-                err,
             )
-        return self.entity_description.native_unit_of_measurement
-
-
-class SmartHashtagMaintenanceSensor(SmartHashtagEntity, SensorEntity):
-    """Tire Status class."""
-
-    def __init__(
-        self,
-        coordinator: SmartHashtagDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
-    ) -> None:
-        """
-        Initialize the maintenance sensor instance with vehicle data and a unique identifier.
-
-        This constructor extracts the maintenance data for a specific vehicle by using the coordinator's account data.
-        It retrieves the vehicle's maintenance information by extracting the VIN from the provided entity description key
-        and accessing the corresponding vehicle object. The sensor's unique identifier is then updated by appending the
-        entity description key to ensure its distinctiveness.
-
-        Parameters:
-            coordinator (SmartHashtagDataUpdateCoordinator): The coordinator that manages data updates and provides access
-                to the account's vehicles.
-            entity_description (SensorEntityDescription): The sensor's metadata containing the key used to extract the VIN
-                and retrieve related maintenance data.
-
-        Returns:
-            None
-        """
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
-        self.entity_description = entity_description
-        self._last_valid_value = None
-
-    @property
-    def native_value(self) -> str:
-        """Return the native value of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.maintenance is None:
-                return self._last_valid_value
-
-            data = getattr(vehicle.maintenance, key)
-            if isinstance(data, ValueWithUnit):
-                self._last_valid_value = data.value
-                return data.value
-            self._last_valid_value = data
-            return data
-
-        except AttributeError as err:
-            LOGGER.error(
-                "AttributeError value: %s (%s)", self.entity_description.key, err
+        elif self.resolver.group.quiet:
+            LOGGER.debug(
+                "Value unavailable for %s: %s", self.entity_description.key, err
             )
-            return self._last_valid_value
-
-
-class SmartHashtagRunningSensor(SmartHashtagEntity, SensorEntity):
-    """Tire Status class."""
-
-    def __init__(
-        self,
-        coordinator: SmartHashtagDataUpdateCoordinator,
-        entity_description: SensorEntityDescription,
-    ) -> None:
-        """Initialize the sensor class."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
-        self.entity_description = entity_description
-        self._last_valid_value = None
-
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the native value of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.running is None:
-                return self._last_valid_value
-
-            data = getattr(vehicle.running, key)
-            if isinstance(data, ValueWithUnit):
-                self._last_valid_value = data.value
-                return data.value
-            self._last_valid_value = data
-            return data
-
-        except AttributeError as err:
+        else:
             LOGGER.error(
                 "AttributeError value: %s (%s)", self.entity_description.key, err
             )
-            return self._last_valid_value
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.running is None:
-                return self.entity_description.native_unit_of_measurement
-            data = getattr(vehicle.running, key)
-            if isinstance(data, ValueWithUnit):
-                return data.unit
-        except AttributeError as err:
-            LOGGER.debug(
-                "AttributeError in native_unit_of_measurement: %s (%s)",
-                self.entity_description.key,
-                err,
-            )
-        return self.entity_description.native_unit_of_measurement
 
-
-class SmartHashtagClimateSensor(SmartHashtagEntity, SensorEntity):
-    """Tire Status class."""
+class SmartHashtagPollingSensor(SmartHashtagEntity, SensorEntity):
+    """Polling scheduler state of a vehicle, for debugging the poll rate."""
 
     def __init__(
         self,
@@ -532,62 +353,43 @@ class SmartHashtagClimateSensor(SmartHashtagEntity, SensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
         self.entity_description = entity_description
-        self._last_valid_value = None
-
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the native value of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.climate is None:
-                return self._last_valid_value
-
-            data = getattr(vehicle.climate, key)
-            if isinstance(data, ValueWithUnit):
-                self._last_valid_value = data.value
-                return data.value
-            self._last_valid_value = data
-            return data
-
-        except AttributeError as err:
-            # Interior PM25 sensor is not available in all vehicle variants
-            key = remove_vin_from_key(self.entity_description.key)
-            if key == "interior_PM25":
-                LOGGER.info(
-                    "Field '%s' not found in data (not available in this vehicle variant)",
-                    self.entity_description.key,
-                )
-            else:
-                LOGGER.error(
-                    "AttributeError value: %s (%s)", self.entity_description.key, err
-                )
-            return self._last_valid_value
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.climate is None:
-                return self.entity_description.native_unit_of_measurement
-            data = getattr(vehicle.climate, key)
-            if isinstance(data, ValueWithUnit):
-                return data.unit
-        except AttributeError as err:
-            LOGGER.debug(
-                "AttributeError in native_unit_of_measurement: %s (%s)",
-                self.entity_description.key,
-                err,
-            )
-        return self.entity_description.native_unit_of_measurement
-
-
-class SmartHashtagSafetySensor(SmartHashtagEntity, SensorEntity):
-    """Safety class."""
+        self._vin = vin_from_key(entity_description.key)
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Compute the polling state and why the vehicle polls at its rate."""
+        super()._update_from_coordinator()
+        scheduler = self.coordinator.polling
+        attributes: dict[str, Any] = {
+            **(self._attr_extra_state_attributes or {}),
+            "coordinator_interval": scheduler.interval.total_seconds(),
+            "coordinator_reason": scheduler.reason,
+            "leases": {
+                key: {
+                    "interval": lease.interval.total_seconds(),
+                    "expires_at": lease.expires_at.isoformat(),
+                }
+                for key, lease in scheduler.leases.items()
+            },
+        }
+        coordinator = self.coordinator
+        if coordinator.last_refresh is not None:
+            attributes["last_refresh"] = coordinator.last_refresh.isoformat()
+        attributes["refresh_p50"] = coordinator.latency.p50
+        attributes["refresh_p95"] = coordinator.latency.p95
+        # Counts of the previous update; this one is still being dispatched.
+        attributes["states_written"] = coordinator.state_writes.written
+        attributes["states_skipped"] = coordinator.state_writes.skipped
+        polling = scheduler.vehicles.get(self._vin)
+        if polling is not None:
+            attributes["reason"] = polling.reason
+            attributes["interval"] = polling.interval.total_seconds()
+        self._attr_native_value = polling.state if polling is not None else None
+        self._attr_extra_state_attributes = attributes
+
+
+class SmartHashtagCircuitBreakerSensor(SmartHashtagEntity, SensorEntity):
+    """Circuit breaker state of the cloud connection, for following outages."""
 
     def __init__(
         self,
@@ -598,47 +400,27 @@ class SmartHashtagSafetySensor(SmartHashtagEntity, SensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
         self.entity_description = entity_description
-        self._last_valid_value = None
 
     @property
-    def native_value(self) -> float | int | str | None:
-        """Return the native value of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.safety is None:
-                return self._last_valid_value
-
-            data = getattr(vehicle.safety, key)
-            if isinstance(data, ValueWithUnit):
-                self._last_valid_value = data.value
-                return data.value
-            self._last_valid_value = data
-            return data
-
-        except AttributeError as err:
-            LOGGER.error(
-                "AttributeError value: %s (%s)", self.entity_description.key, err
-            )
-            return self._last_valid_value
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the unit of measurement of the sensor."""
-        try:
-            key = remove_vin_from_key(self.entity_description.key)
-            vin = vin_from_key(self.entity_description.key)
-            vehicle = self.coordinator.account.vehicles.get(vin)
-            if vehicle is None or vehicle.safety is None:
-                return self.entity_description.native_unit_of_measurement
-            data = getattr(vehicle.safety, key)
-            if isinstance(data, ValueWithUnit):
-                return data.unit
-        except AttributeError as err:
-            LOGGER.debug(
-                "AttributeError in native_unit_of_measurement: %s (%s)",
-                self.entity_description.key,
-                err,
-            )
-        return self.entity_description.native_unit_of_measurement
+    def available(self) -> bool:
+        """Stay available while the cloud is failing; that is what this reports."""
+        return True
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Compute the breaker state and when the cloud is tried next."""
+        super()._update_from_coordinator()
+        breaker = self.coordinator.breaker
+        attributes: dict[str, Any] = {
+            **(self._attr_extra_state_attributes or {}),
+            "consecutive_failures": breaker.consecutive_failures,
+            "rejected_refreshes": breaker.rejected,
+            "backoff": (
+                breaker.backoff.total_seconds() if breaker.backoff is not None else None
+            ),
+            "retry_at": (
+                breaker.retry_at.isoformat() if breaker.retry_at is not None else None
+            ),
+        }
+        self._attr_native_value = breaker.state
+        self._attr_extra_state_attributes = attributes
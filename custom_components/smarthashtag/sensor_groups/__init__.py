@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from .battery import ENTITY_BATTERY_DESCRIPTIONS
 from .climate import ENTITY_CLIMATE_DESCRIPTIONS
+from .diagnostic import (
+    ENTITY_CIRCUIT_BREAKER_DESCRIPTIONS,
+    ENTITY_DIAGNOSTIC_DESCRIPTIONS,
+)
 from .general import ENTITY_GENERAL_DESCRIPTIONS
 from .maintenance import ENTITY_MAINTENANCE_DESCRIPTIONS
 from .position import ENTITY_POSITION_DESCRIPTIONS
@@ -13,7 +17,9 @@ from .tire import ENTITY_TIRE_DESCRIPTIONS
 
 __all__ = [
     "ENTITY_BATTERY_DESCRIPTIONS",
+    "ENTITY_CIRCUIT_BREAKER_DESCRIPTIONS",
     "ENTITY_CLIMATE_DESCRIPTIONS",
+    "ENTITY_DIAGNOSTIC_DESCRIPTIONS",
     "ENTITY_GENERAL_DESCRIPTIONS",
     "ENTITY_MAINTENANCE_DESCRIPTIONS",
     "ENTITY_POSITION_DESCRIPTIONS",
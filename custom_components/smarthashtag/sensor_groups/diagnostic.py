@@ -0,0 +1,33 @@
+"""Integration diagnostic sensor entity descriptions."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
+from homeassistant.const import EntityCategory
+
+from ..circuit_breaker import BreakerState
+from ..polling import PollingState
+
+ENTITY_DIAGNOSTIC_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="polling_state",
+        translation_key="polling_state",
+        name="Polling state",
+        icon="mdi:timer-sync-outline",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in PollingState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+ENTITY_CIRCUIT_BREAKER_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key="cloud_circuit",
+        translation_key="cloud_circuit",
+        name="Cloud circuit",
+        icon="mdi:cloud-sync-outline",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in BreakerState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
@@ -0,0 +1,114 @@
+"""Persisted Smart session tokens."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pysmarthashtag.api.authentication import SmartAuthentication
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.sessions"
+
+# Renew the session once this share of the OAuth token's remaining lifetime
+# has passed, well before it expires, so no poll has to wait for a token
+# exchange or a login. Logins hand out tokens living for weeks.
+SESSION_REFRESH_SHARE = 0.8
+
+# The refresh-token exchange does not say how long the new OAuth token lives.
+# Tokens from a login have lived for weeks; renew again after this long.
+RENEWED_SESSION_LIFETIME = timedelta(days=7)
+
+# Seconds to wait before renewing again after a renewal did not extend the
+# session, e.g. while the cloud is down.
+SESSION_RETRY_DELAY = 3600
+
+# Everything SmartAuthentication needs to resume a session without a login.
+# The device id is part of the request signatures the session was opened with.
+SESSION_FIELDS = (
+    "access_token",
+    "refresh_token",
+    "api_access_token",
+    "api_refresh_token",
+    "api_user_id",
+    "api_client_id",
+    "device_id",
+)
+
+
+def export_session(authentication: SmartAuthentication) -> dict[str, Any] | None:
+    """Return the tokens of a logged in session, None if there is no session."""
+    session: dict[str, Any] = {}
+    for field in SESSION_FIELDS:
+        value = getattr(authentication, field, None)
+        if value is not None and not isinstance(value, str):
+            return None
+        session[field] = value
+    if not session["api_access_token"] or not session["api_user_id"]:
+        return None
+    expires_at = getattr(authentication, "expires_at", None)
+    session["expires_at"] = expires_at.isoformat() if expires_at else None
+    return session
+
+
+def import_session(
+    authentication: SmartAuthentication, session: dict[str, Any]
+) -> None:
+    """
+    Resume a saved session.
+
+    A session whose OAuth token has expired is resumed too: its refresh token
+    can still be exchanged for a new one, which is cheaper than a login.
+    """
+    for field in SESSION_FIELDS:
+        if session.get(field) is not None:
+            setattr(authentication, field, session[field])
+    authentication.expires_at = dt_util.parse_datetime(session.get("expires_at") or "")
+
+
+class SessionStore:
+    """Keep the session tokens of every Smart login in HA's private storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        self._sessions: dict[str, dict[str, Any]] | None = None
+
+    async def _async_sessions(self) -> dict[str, dict[str, Any]]:
+        """Return the saved sessions by username, loading them once."""
+        if self._sessions is None:
+            stored = await self._store.async_load()
+            self._sessions = dict((stored or {}).get("sessions") or {})
+        return self._sessions
+
+    async def async_get(self, username: str) -> dict[str, Any] | None:
+        """Return the saved session of a login, if any."""
+        return (await self._async_sessions()).get(username)
+
+    async def async_set(self, username: str, session: dict[str, Any]) -> None:
+        """Save the session of a login."""
+        sessions = await self._async_sessions()
+        if sessions.get(username) == session:
+            return
+        sessions[username] = session
+        await self._store.async_save({"sessions": sessions})
+
+    async def async_remove(self, username: str) -> None:
+        """Forget the session of a login."""
+        sessions = await self._async_sessions()
+        if sessions.pop(username, None) is not None:
+            await self._store.async_save({"sessions": sessions})
+
+
+@singleton(f"{DOMAIN}_session_store")
+def async_get_session_store(hass: HomeAssistant) -> SessionStore:
+    """Return the session store shared by all Smart logins."""
+    return SessionStore(hass)
@@ -0,0 +1,94 @@
+"""Persistent vehicle snapshots for Smart #1/#3."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+
+STORAGE_VERSION = 1
+STORAGE_MINOR_VERSION = 1
+
+# Seconds to wait before writing a new snapshot. Fast polling produces one
+# every few seconds, while a restart only needs a recent one; HA still writes
+# the pending snapshot when it shuts down.
+SNAPSHOT_SAVE_DELAY = 60
+
+
+@dataclass
+class VehicleSnapshot:
+    """The raw data of a vehicle, and when it was fetched."""
+
+    saved_at: datetime
+    data: dict[str, Any]
+
+
+class VehicleSnapshotStore:
+    """Keep the last good data of an entry's vehicles in HA storage."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of one config entry."""
+        # The raw data holds the vehicle's position and identifiers; like the
+        # session tokens, only the user Home Assistant runs as may read it.
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.snapshot.{entry_id}",
+            minor_version=STORAGE_MINOR_VERSION,
+            private=True,
+        )
+        self._vehicles: Mapping[str, Any] | None = None
+        self._fetched_at = dt_util.utcnow()
+
+    async def async_load(self) -> dict[str, VehicleSnapshot]:
+        """Return the saved snapshots by VIN, empty if there are none."""
+        stored = await self._store.async_load()
+        snapshots: dict[str, VehicleSnapshot] = {}
+        for vin, snapshot in ((stored or {}).get("vehicles") or {}).items():
+            saved_at = dt_util.parse_datetime(snapshot.get("saved_at") or "")
+            data = snapshot.get("data")
+            if saved_at is None or not isinstance(data, dict):
+                LOGGER.debug("Ignoring unreadable snapshot of %s", vin)
+                continue
+            if isinstance(fetched_at := data.get("fetched_at"), str):
+                data["fetched_at"] = dt_util.parse_datetime(fetched_at)
+            snapshots[vin] = VehicleSnapshot(saved_at, data)
+        return snapshots
+
+    @callback
+    def async_schedule_save(self, vehicles: Mapping[str, Any] | None) -> None:
+        """Save the vehicles once SNAPSHOT_SAVE_DELAY has passed."""
+        if not vehicles:
+            return
+        self._vehicles = vehicles
+        self._fetched_at = dt_util.utcnow()
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending snapshot right away."""
+        if self._vehicles is not None:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the saved snapshots."""
+        self._vehicles = None
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshots to write."""
+        saved_at = self._fetched_at.isoformat()
+        vehicles, self._vehicles = self._vehicles or {}, None
+        return {
+            "vehicles": {
+                vin: {"saved_at": saved_at, "data": dict(vehicle.data)}
+                for vin, vehicle in vehicles.items()
+            }
+        }
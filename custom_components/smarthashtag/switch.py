@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import (
-    CONF_VEHICLE,
-    FAST_INTERVAL,
-    LOGGER,
-)
+from .commands import RemoteCommand
+from .const import CONF_VEHICLE, LOGGER
 from .coordinator import SmartHashtagDataUpdateCoordinator
 from .entity import SmartHashtagEntity
 
 if TYPE_CHECKING:
     from . import SmartHashtagConfigEntry
+    from .vehicle_data import VehicleData
+
+# The kind of the commands that start and stop charging.
+CHARGING_COMMAND = "charging"
+
+# The charging statuses that turn the switch on.
+CHARGING_STATUSES = ("CHARGING", "DC_CHARGING")
+
+
+def is_charging(vehicle: VehicleData) -> bool:
+    """Return whether a vehicle snapshot reports an active AC or DC charge."""
+    # Snapshots hold the normalized status: upper case, or None if unknown.
+    battery = vehicle.battery
+    return battery is not None and battery.charging_status in CHARGING_STATUSES
 
 
 async def async_setup_entry(
@@ -36,7 +46,7 @@ async def async_setup_entry(
 
     entities.append(SmartChargingSwitch(coordinator, vehicle))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class SmartChargingSwitch(SmartHashtagEntity, SwitchEntity):
@@ -44,16 +54,17 @@ class SmartChargingSwitch(SmartHashtagEntity, SwitchEntity):
     Switch entity for controlling and monitoring the charging state of a Smart #1/#3 vehicle.
 
     This switch reflects whether the vehicle is currently charging by monitoring the
-    `charging_status` attribute of the vehicle's battery. It considers the switch "on"
-    when `charging_status` is either "charging" or "dc_charging".
+    normalized `charging_status` of the battery in the coordinator's snapshot. It
+    considers the switch "on" when `charging_status` is either "CHARGING" or
+    "DC_CHARGING".
 
     Turning the switch on or off will start or stop charging, respectively, by invoking
     the vehicle API via the `ChargingControl` interface.
 
-    After a charging state change (on/off), the switch triggers a fast polling interval
-    (using `FAST_INTERVAL`) to quickly update the entity's state in Home Assistant.
-    Once the charging state stabilizes (i.e., no further change detected), the polling
-    interval is reset to normal to reduce API calls.
+    Charging commands go through the vehicle's command queue. The switch shows
+    the requested state right away, while the coordinator polls fast until the
+    vehicle reports it; if it never does, the switch falls back to the reported
+    state after `CONFIRM_TIMEOUT` seconds.
     """
 
     _attr_entity_category = EntityCategory.CONFIG
@@ -65,22 +76,15 @@ class SmartChargingSwitch(SmartHashtagEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
-        """Return true if charging is active."""
+        """Return true if charging is active, or was asked for and not reported yet."""
         if self._vehicle is None:
             return False
-        try:
-            return bool(
-                self._vehicle.battery
-                and self._vehicle.battery.charging_status
-                and self._vehicle.battery.charging_status.upper()
-                in ["CHARGING", "DC_CHARGING"]
-            )
-        except Exception as e:
-            LOGGER.warning(
-                "Error accessing charging status for vehicle %s: %s",
-                getattr(self._vehicle, "vin", "unknown"),
-                e,
-            )
+        queue = self.coordinator.command_queue(self._vehicle_vin)
+        if (requested := queue.optimistic.get(CHARGING_COMMAND)) is not None:
+            return requested
+        data = self.coordinator.data
+        snapshot = data.get(self._vehicle_vin) if data is not None else None
+        return snapshot is not None and is_charging(snapshot)
 
     def __init__(
         self,
@@ -96,57 +100,36 @@ class SmartChargingSwitch(SmartHashtagEntity, SwitchEntity):
             self._attr_available = False
             return
         self._attr_unique_id = f"{self._attr_unique_id}_charging_switch"
-        self._last_state: bool | None = None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start charging the vehicle."""
-        if self._vehicle is None:
-            LOGGER.warning(
-                "Cannot start charging; vehicle %s unavailable", self._vehicle_vin
-            )
-            return
-        LOGGER.debug("Starting charging for vehicle %s", self._vehicle.vin)
-        try:
-            await self._vehicle.charging_control.start_charging()
-            # Set fast polling to quickly reflect state changes
-            self.coordinator.set_update_interval(
-                "charging_switch", timedelta(seconds=FAST_INTERVAL)
-            )
-        except Exception:
-            # Log with exception info to avoid formatting errors and aid debugging
-            LOGGER.exception(
-                "Error turning on charging for vehicle %s",
-                getattr(self._vehicle, "vin", "unknown"),
-            )
-
-        await self.coordinator.async_request_refresh()
+        await self._async_set_charging(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop charging the vehicle."""
+        await self._async_set_charging(False)
+
+    async def _async_set_charging(self, charging: bool) -> None:
+        """Queue a command to start or stop charging, showing its outcome at once."""
         if self._vehicle is None:
             LOGGER.warning(
-                "Cannot stop charging; vehicle %s unavailable", self._vehicle_vin
+                "Cannot %s charging; vehicle %s unavailable",
+                "start" if charging else "stop",
+                self._vehicle_vin,
             )
             return
-        LOGGER.debug("Stopping charging for vehicle %s", self._vehicle.vin)
-        try:
-            await self._vehicle.charging_control.stop_charging()
-            # Set fast polling to quickly reflect state changes
-            self.coordinator.set_update_interval(
-                "charging_switch", timedelta(seconds=FAST_INTERVAL)
-            )
-        except Exception:
-            LOGGER.exception(
-                "Error turning off charging for vehicle %s",
-                getattr(self._vehicle, "vin", "unknown"),
+        LOGGER.debug(
+            "%s charging for vehicle %s",
+            "Starting" if charging else "Stopping",
+            self._vehicle_vin,
+        )
+        control = self._vehicle.charging_control
+        await self.coordinator.command_queue(self._vehicle_vin).async_send(
+            RemoteCommand(
+                CHARGING_COMMAND,
+                charging,
+                control.start_charging if charging else control.stop_charging,
+                confirmed=lambda vehicle: is_charging(vehicle) == charging,
+                on_change=self.async_write_ha_state,
             )
-
-        await self.coordinator.async_request_refresh()
-
-    async def async_update(self) -> None:
-        """Update the entity state and reset polling interval when stable."""
-        current_state = self.is_on
-        # Reset to normal interval when state has stabilized
-        if self._last_state is not None and current_state == self._last_state:
-            self.coordinator.reset_update_interval("charging_switch")
-        self._last_state = current_state
+        )
@@ -0,0 +1,127 @@
+"""Pooled HTTP transport shared by all Smart cloud traffic."""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+from homeassistant.core import HomeAssistant
+from homeassistant.util.ssl import client_context
+from pysmarthashtag.account import SmartAccount
+from pysmarthashtag.api.client import SmartClient
+
+from .const import DOMAIN, DOMAIN_DATA, LOGGER
+
+DATA_TRANSPORT = f"{DOMAIN}_transport"
+
+# Connections kept open to the Smart cloud. A refresh is a chain of
+# sequential calls to the same two hosts; hedged calls and remote commands
+# running next to a refresh need a few more.
+MAX_CONNECTIONS = 10
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+# Seconds an idle connection is kept. Long enough to carry it from one call
+# of a refresh to the next, and across polls at the charging interval.
+KEEPALIVE_EXPIRY = 60
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    The connection pool every client of the library sends its requests through.
+
+    pysmarthashtag opens a new client for every call and closes it right
+    after, which used to mean a TCP and TLS handshake per call. The clients
+    now share this transport; closing one of them leaves the pool open, and
+    only async_close shuts it down.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Initialize the shared transport around the pool doing the work."""
+        self._transport = transport
+        self.requests = 0
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over a pooled connection."""
+        self.requests += 1
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Keep the pool open when a client of the library is closed."""
+
+    async def async_close(self) -> None:
+        """Close the pooled connections."""
+        self.closed = True
+        await self._transport.aclose()
+
+
+def _init_transport(self: SmartClient, *args: Any, **kwargs: Any) -> Any:
+    """Hand a library client the shared transport of its account, if any."""
+    config = getattr(self, "config", None)
+    if (transport := getattr(config, "transport", None)) is not None:
+        return transport
+    return httpx.AsyncClient._init_transport(self, *args, **kwargs)
+
+
+def install_transport_hook() -> None:
+    """
+    Let library clients pick up the transport set on their configuration.
+
+    The library builds its clients itself, in several modules, and takes no
+    client or transport to use. Its clients keep their configuration in
+    self.config before httpx sets up their transport, so that is where the
+    shared transport is handed over. Clients whose configuration has no
+    transport, e.g. of other users of the library, are left as they were.
+    """
+    SmartClient._init_transport = _init_transport  # type: ignore[method-assign]
+
+
+def remove_transport_hook() -> None:
+    """Give library clients their own transports again."""
+    if SmartClient.__dict__.get("_init_transport") is _init_transport:
+        del SmartClient._init_transport
+
+
+def async_get_shared_transport(hass: HomeAssistant) -> SharedTransport:
+    """
+    Return the transport shared by the Smart accounts, creating it if needed.
+
+    The hook handing it to library clients is installed along with it and
+    removed once it is released.
+    """
+    transport: SharedTransport | None = hass.data.get(DATA_TRANSPORT)
+    if transport is None:
+        install_transport_hook()
+        transport = hass.data[DATA_TRANSPORT] = SharedTransport(
+            httpx.AsyncHTTPTransport(
+                # The SSL context of Home Assistant's own httpx clients, which
+                # is created once instead of blocking the loop per client.
+                verify=client_context(),
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+        )
+        LOGGER.debug("Opened the shared Smart cloud connection pool")
+    return transport
+
+
+def use_shared_transport(hass: HomeAssistant, account: SmartAccount) -> SmartAccount:
+    """Send all requests of an account through the shared transport."""
+    account.config.transport = async_get_shared_transport(hass)
+    return account
+
+
+async def async_release_shared_transport(hass: HomeAssistant) -> None:
+    """Close the shared transport once no account hub uses it anymore."""
+    if hass.data.get(DOMAIN_DATA):
+        return
+    transport: SharedTransport | None = hass.data.pop(DATA_TRANSPORT, None)
+    if transport is not None:
+        remove_transport_hook()
+        await transport.async_close()
+        LOGGER.debug("Closed the shared Smart cloud connection pool")
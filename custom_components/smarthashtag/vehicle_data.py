@@ -0,0 +1,287 @@
+"""Immutable, versioned vehicle snapshots for Smart #1/#3."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+
+from pysmarthashtag.models import ValueWithUnit
+from pysmarthashtag.vehicle.battery import Battery
+from pysmarthashtag.vehicle.climate import Climate
+from pysmarthashtag.vehicle.journal import TripJournal
+from pysmarthashtag.vehicle.maintenance import Maintenance
+from pysmarthashtag.vehicle.position import Position
+from pysmarthashtag.vehicle.running import Running
+from pysmarthashtag.vehicle.safety import Safety
+from pysmarthashtag.vehicle.tires import Tires
+from pysmarthashtag.vehicle.vehicle_state import VehicleState
+
+from .freshness import DataSource
+from .normalize import normalize_subsystem, normalize_value
+
+# The attributes of a library vehicle holding its subsystems.
+SUBSYSTEMS = (
+    "battery",
+    "tires",
+    "position",
+    "maintenance",
+    "running",
+    "climate",
+    "safety",
+    "last_trip",
+    "state",
+)
+
+# Mappings a snapshot holds read-only copies of.
+_COPIED_FIELDS = ("service", "data", "fetched_at")
+
+
+@dataclass(frozen=True, slots=True)
+class VehicleData:
+    """
+    A vehicle as of one coordinator refresh.
+
+    The values are normalized once, when the snapshot is taken: units are in
+    the form Home Assistant knows, the charging status is one the library
+    knows, and the position is in degrees. Subsystems are the objects the
+    library built for that refresh, or normalized copies of them. The library
+    builds new ones on every refresh instead of updating them, so they do not
+    change behind the snapshot's back; they must not be changed here either.
+    The raw data, the service values and the fetch times of the sources are
+    read-only copies.
+    """
+
+    vin: str | None
+    name: str | None
+    last_update: datetime | None
+    engine_state: str | None
+    odometer: ValueWithUnit | None
+    battery: Battery | None
+    tires: Tires | None
+    position: Position | None
+    maintenance: Maintenance | None
+    running: Running | None
+    climate: Climate | None
+    safety: Safety | None
+    last_trip: TripJournal | None
+    state: VehicleState | None
+    service: Mapping[str, Any]
+    data: Mapping[str, Any]
+    fetched_at: Mapping[DataSource, datetime]
+
+    @classmethod
+    def from_vehicle(
+        cls,
+        vehicle: Any,
+        previous: VehicleData | None = None,
+        fetched_at: Mapping[DataSource, datetime] | None = None,
+    ) -> VehicleData:
+        """
+        Take a snapshot of a library vehicle.
+
+        Parts equal to those of the previous snapshot are taken from it, so
+        consecutive snapshots share whatever did not change. If nothing changed
+        at all, the previous snapshot itself is returned.
+
+        Parameters:
+            vehicle (SmartVehicle): The vehicle as the library holds it.
+            previous (VehicleData | None): The last snapshot of the vehicle.
+            fetched_at (Mapping[DataSource, datetime] | None): When each source
+                of the vehicle was last fetched successfully, if known.
+
+        Returns:
+            VehicleData: The snapshot.
+        """
+        values: dict[str, Any] = {
+            "vin": getattr(vehicle, "vin", None),
+            "name": getattr(vehicle, "name", None),
+            "last_update": getattr(vehicle, "last_update", None),
+            "engine_state": getattr(vehicle, "engine_state", None),
+            "odometer": normalize_value(getattr(vehicle, "odometer", None)),
+        }
+        for name in SUBSYSTEMS:
+            values[name] = normalize_subsystem(name, getattr(vehicle, name, None))
+        values["service"] = {
+            key: normalize_value(value)
+            for key, value in (getattr(vehicle, "service", None) or {}).items()
+        }
+        values["data"] = getattr(vehicle, "data", None) or {}
+        values["fetched_at"] = fetched_at or {}
+        if previous is None:
+            for field in _COPIED_FIELDS:
+                values[field] = MappingProxyType(dict(values[field]))
+            return cls(**values)
+
+        for field, value in values.items():
+            old = getattr(previous, field)
+            if old == value:
+                values[field] = old
+            elif field in _COPIED_FIELDS:
+                values[field] = MappingProxyType(dict(value))
+        if all(values[field] is getattr(previous, field) for field in values):
+            return previous
+        return cls(**values)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FleetData(Mapping[str, VehicleData]):
+    """
+    The vehicles of an entry as of one coordinator refresh, by VIN.
+
+    The version goes up by one with every refresh that produced data, so two
+    snapshots with the same version hold the same data.
+    """
+
+    version: int
+    vehicles: Mapping[str, VehicleData]
+
+    def __getitem__(self, vin: str) -> VehicleData:
+        """Return the snapshot of a vehicle."""
+        return self.vehicles[vin]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the VINs."""
+        return iter(self.vehicles)
+
+    def __len__(self) -> int:
+        """Return the number of vehicles."""
+        return len(self.vehicles)
+
+
+def build_fleet_data(
+    vehicles: Mapping[str, Any] | None,
+    previous: Mapping[str, Any] | None = None,
+    fetched_at: Mapping[str, Mapping[DataSource, datetime]] | None = None,
+) -> FleetData:
+    """
+    Take the next snapshot of the vehicles the library holds.
+
+    Parameters:
+        vehicles (Mapping[str, SmartVehicle] | None): The vehicles by VIN.
+        previous (Mapping[str, Any] | None): The last snapshot, which the new
+            one shares unchanged vehicles and subsystems with.
+        fetched_at (Mapping[str, Mapping[DataSource, datetime]] | None): When
+            each source of each vehicle was last fetched successfully, by VIN.
+
+    Returns:
+        FleetData: The snapshot, one version after the previous one.
+    """
+    if not isinstance(previous, FleetData):
+        previous = None
+    return FleetData(
+        version=previous.version + 1 if previous is not None else 1,
+        vehicles=MappingProxyType(
+            {
+                vin: VehicleData.from_vehicle(
+                    vehicle,
+                    previous.vehicles.get(vin) if previous is not None else None,
+                    (fetched_at or {}).get(vin),
+                )
+                for vin, vehicle in (vehicles or {}).items()
+            }
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """A value of a vehicle that changed between two snapshots."""
+
+    old: Any
+    new: Any
+
+
+def diff_vehicle_data(old: VehicleData, new: VehicleData) -> dict[str, FieldChange]:
+    """
+    Return the values that changed between two snapshots of a vehicle.
+
+    Values are keyed by their path, e.g. "battery.charging_status" or
+    "service.daysToService". Subsystems the snapshots share are skipped
+    without looking inside. The raw data and the timestamps of the subsystems
+    are left out: the parsed values cover the former, last_update the latter.
+    So are the fetch times, which change on every refresh.
+
+    Parameters:
+        old (VehicleData): The earlier snapshot.
+        new (VehicleData): The later snapshot.
+
+    Returns:
+        dict[str, FieldChange]: The changes by path, empty if nothing changed.
+    """
+    changes: dict[str, FieldChange] = {}
+    if old is new:
+        return changes
+    for field in fields(VehicleData):
+        name = field.name
+        before, after = getattr(old, name), getattr(new, name)
+        if before is after or name in ("data", "fetched_at"):
+            continue
+        if name == "service":
+            for key in before.keys() | after.keys():
+                if before.get(key) != after.get(key):
+                    changes[f"service.{key}"] = FieldChange(
+                        before.get(key), after.get(key)
+                    )
+        elif (
+            is_dataclass(before) and is_dataclass(after) and type(before) is type(after)
+        ):
+            for subfield in fields(before):
+                if subfield.name == "timestamp":
+                    continue
+                value, new_value = (
+                    getattr(before, subfield.name),
+                    getattr(after, subfield.name),
+                )
+                if value != new_value:
+                    changes[f"{name}.{subfield.name}"] = FieldChange(value, new_value)
+        elif before != after:
+            changes[name] = FieldChange(before, after)
+    return changes
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSubscription:
+    """
+    Changes of a vehicle that a consumer asked to hear about.
+
+    A path matches the value it names and everything below it, so "safety"
+    matches every safety value and "battery.charging_status" only that one.
+    """
+
+    field_paths: tuple[str, ...]
+    update_callback: Callable[[str, Mapping[str, FieldChange]], None]
+
+    def matching(self, changes: Mapping[str, FieldChange]) -> dict[str, FieldChange]:
+        """Return the changes this subscription asked for."""
+        return {
+            path: change
+            for path, change in changes.items()
+            if any(
+                path == wanted or path.startswith(f"{wanted}.")
+                for wanted in self.field_paths
+            )
+        }
+
+
+def event_value(value: Any) -> Any:
+    """Return a value as it can go into an event, and into the recorder."""
+    if isinstance(value, ValueWithUnit):
+        return {"value": value.value, "unit": value.unit}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        return {str(key): event_value(item) for key, item in value.items()}
+    if isinstance(value, Iterable) and not isinstance(value, str):
+        return [event_value(item) for item in value]
+    if is_dataclass(value):
+        return {
+            field.name: event_value(getattr(value, field.name))
+            for field in fields(value)
+        }
+    return value
@@ -0,0 +1,56 @@
+"""Vehicle mode detection for Smart #1/#3."""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Any
+
+from pysmarthashtag.models import ValueWithUnit
+
+
+class VehicleMode(StrEnum):
+    """What a vehicle is doing, as far as polling is concerned."""
+
+    PARKED = "parked"
+    CHARGING = "charging"
+    DC_CHARGING = "dc_charging"
+    DRIVING = "driving"
+    CONDITIONING = "conditioning"
+
+
+def detect_vehicle_mode(vehicle: Any) -> VehicleMode:
+    """
+    Classify a vehicle from the data of its latest update.
+
+    Driving wins over charging, charging over conditioning. Anything the
+    snapshot does not report counts as parked, so a partial snapshot never
+    speeds polling up on its own.
+
+    Parameters:
+        vehicle (SmartVehicle): The vehicle as returned by the Smart API.
+
+    Returns:
+        VehicleMode: The mode the vehicle is in.
+    """
+    if getattr(vehicle, "engine_state", None) == "engine_running":
+        return VehicleMode.DRIVING
+
+    battery = getattr(vehicle, "battery", None)
+    if battery is not None:
+        charging_status = getattr(battery, "charging_status", None)
+        if charging_status == "DC_CHARGING":
+            return VehicleMode.DC_CHARGING
+        if charging_status == "CHARGING":
+            return VehicleMode.CHARGING
+        # Older firmware only reports a current while charging.
+        current = getattr(battery, "charging_current", None)
+        if isinstance(current, ValueWithUnit):
+            current = current.value
+        if current:
+            return VehicleMode.CHARGING
+
+    climate = getattr(vehicle, "climate", None)
+    if climate is not None and getattr(climate, "pre_climate_active", None):
+        return VehicleMode.CONDITIONING
+
+    return VehicleMode.PARKED
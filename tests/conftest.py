@@ -1,7 +1,10 @@
 """Fixtures for testing."""
 
+from unittest.mock import patch
+
 import pytest
 import respx
+from homeassistant.helpers.entity import Entity
 
 # Import fixtures to make them available to tests
 from pysmarthashtag.tests.conftest import smart_fixture  # noqa: F401
@@ -12,6 +15,13 @@ def _auto_enable_custom_integrations(enable_custom_integrations):
     return
 
 
+@pytest.fixture
+def enable_all_entities():
+    """Register every entity enabled, including those disabled by default."""
+    with patch.object(Entity, "entity_registry_enabled_default", True):
+        yield
+
+
 @pytest.fixture
 def smart_intl_fixture(
     smart_fixture: respx.Router,  # noqa: F811
@@ -0,0 +1,166 @@
+"""Unit tests for the circuit breaker of the Smart cloud."""
+
+import asyncio
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from httpx import Request, Response
+from pysmarthashtag.tests import RESPONSE_DIR, load_response
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.circuit_breaker import (
+    BASE_BACKOFF,
+    JITTER,
+    MAX_BACKOFF,
+    BreakerState,
+    CircuitBreaker,
+)
+from custom_components.smarthashtag.const import DOMAIN
+
+NOW = datetime(2024, 1, 23, 16, 44, tzinfo=UTC)
+STATUS_URL = "https://api.ecloudeu.com/remote-control/vehicle/status/TestVIN0000000001?latest=True&target=basic%2Cmore&userId=112233"
+
+
+def _breaker(failures_to_open: int = 3, jitter: float = JITTER) -> CircuitBreaker:
+    return CircuitBreaker(
+        failures_to_open=failures_to_open, jitter=jitter, rng=random.Random(42)
+    )
+
+
+def test_breaker_opens_after_repeated_failures():
+    """Test that refreshes go to the cloud until failures pile up."""
+    breaker = _breaker()
+
+    for _ in range(2):
+        breaker.record_failure(NOW)
+        assert breaker.state is BreakerState.CLOSED
+        assert breaker.allow_request(NOW)
+        assert breaker.delay(NOW) is None
+
+    breaker.record_failure(NOW)
+
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow_request(NOW)
+    assert not breaker.allow_request(NOW + timedelta(seconds=30))
+    assert breaker.rejected == 2
+    assert breaker.delay(NOW) == breaker.retry_at - NOW
+
+
+def test_breaker_probes_once_the_delay_passed():
+    """Test that a successful probe closes the breaker, a failed one reopens it."""
+    breaker = _breaker(failures_to_open=1, jitter=0)
+    breaker.record_failure(NOW)
+    assert breaker.retry_at == NOW + BASE_BACKOFF
+
+    later = breaker.retry_at
+    assert breaker.allow_request(later)
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    breaker.record_failure(later)
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.backoff == 2 * BASE_BACKOFF
+
+    assert breaker.allow_request(breaker.retry_at)
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert breaker.retry_at is None
+    assert breaker.delay(NOW) is None
+
+    # Backing off starts over after the cloud recovered.
+    breaker.record_failure(NOW)
+    assert breaker.backoff == BASE_BACKOFF
+
+
+def test_breaker_backoff_is_capped():
+    """Test that the delay stops doubling at MAX_BACKOFF."""
+    breaker = _breaker(failures_to_open=1)
+    now = NOW
+    breaker.record_failure(now)
+    for _ in range(20):
+        now = breaker.retry_at
+        assert breaker.allow_request(now)
+        breaker.record_failure(now)
+        assert breaker.backoff <= MAX_BACKOFF
+    assert breaker.backoff > MAX_BACKOFF * (1 - JITTER) - timedelta(seconds=1)
+
+
+def test_breaker_jitter_stays_within_bounds():
+    """Test that jitter spreads the delays without leaving its bounds."""
+    delays = set()
+    for seed in range(50):
+        breaker = CircuitBreaker(failures_to_open=1, rng=random.Random(seed))
+        breaker.record_failure(NOW)
+        assert BASE_BACKOFF * (1 - JITTER) <= breaker.backoff
+        assert breaker.backoff <= BASE_BACKOFF * (1 + JITTER)
+        delays.add(breaker.backoff)
+    assert len(delays) > 1
+
+    # The same seed gives the same delay.
+    first, second = _breaker(failures_to_open=1), _breaker(failures_to_open=1)
+    first.record_failure(NOW)
+    second.record_failure(NOW)
+    assert first.backoff == second.backoff
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_backs_off_during_outage(
+    hass: HomeAssistant, smart_fixture: respx.Router, freezer
+):
+    """Test that an outage costs a few probes instead of one call per refresh."""
+    calls = 0
+    outage = False
+
+    async def status(request: Request, route: respx.Route) -> Response:
+        nonlocal calls
+        calls += 1
+        if outage:
+            raise asyncio.TimeoutError("Connection timed out")
+        return Response(200, json=load_response(RESPONSE_DIR / "vehicle_info.json"))
+
+    smart_fixture.get(STATUS_URL).mock(side_effect=status)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    coordinator.breaker.rng = random.Random(42)
+    assert hass.states.get("sensor.smart_cloud_circuit").state == "closed"
+
+    outage = True
+    for _ in range(3):
+        await coordinator.async_refresh()
+    assert coordinator.breaker.state is BreakerState.OPEN
+    assert coordinator.update_interval == coordinator.breaker.delay(dt_util.utcnow())
+    state = hass.states.get("sensor.smart_cloud_circuit")
+    assert state.state == "open"
+    assert state.attributes["consecutive_failures"] == 3
+
+    # Refreshes while open do not reach the cloud, but still serve the data.
+    calls_when_opened = calls
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert calls == calls_when_opened
+    assert coordinator.breaker.rejected == 2
+    assert hass.states.get("sensor.smart_last_update").state != "unavailable"
+
+    # Once the delay passed, one probe goes out; the cloud is back.
+    outage = False
+    freezer.move_to(coordinator.breaker.retry_at)
+    await coordinator.async_refresh()
+    assert calls > calls_when_opened
+    assert coordinator.breaker.state is BreakerState.CLOSED
+    assert coordinator.update_interval == coordinator.polling.interval
+    assert hass.states.get("sensor.smart_cloud_circuit").state == "closed"
@@ -1,5 +1,7 @@
 """Unit tests for climate entity."""
 
+import dataclasses
+
 import pytest
 import respx
 from homeassistant.components.climate.const import HVACMode
@@ -309,7 +311,7 @@ async def test_climate_sync_methods_not_implemented(
 async def test_climate_turn_on_restores_heating_levels(
     hass: HomeAssistant, smart_fixture: respx.Router
 ):
-    """Test that turning on climate restores heating levels from config entry.
+    """Test that turning on climate restores the saved heating levels.
 
     When a coordinator refresh creates a new ClimateControll instance, the saved
     heating levels must be restored before the preconditioning API call is made.
@@ -348,7 +350,7 @@ async def test_climate_turn_on_restores_heating_levels(
     assert vehicle.climate_control.heating_levels[HeatingLocation.DRIVER_SEAT] == 0
     assert vehicle.climate_control.heating_levels[HeatingLocation.STEERING_WHEEL] == 0
 
-    # Turn on climate — this should restore heating levels from config before the API call
+    # Turn on climate — this should restore heating levels before the API call
     entity_id = get_climate_entity_id(hass)
     assert entity_id is not None
 
@@ -360,7 +362,7 @@ async def test_climate_turn_on_restores_heating_levels(
     )
     await hass.async_block_till_done()
 
-    # After turn_on, the heating levels should have been restored from the config entry
+    # After turn_on, the heating levels should have been restored from the store
     assert vehicle.climate_control.heating_levels[HeatingLocation.DRIVER_SEAT] == 2
     assert vehicle.climate_control.heating_levels[HeatingLocation.PASSENGER_SEAT] == 1
     assert vehicle.climate_control.heating_levels[HeatingLocation.STEERING_WHEEL] == 3
@@ -465,3 +467,45 @@ async def test_climate_entity_has_device_info(
     device_registry = dr.async_get(hass)
     device = device_registry.async_get(entity_entry.device_id)
     assert device is not None, "Device must exist for the climate entity"
+
+
+@pytest.mark.asyncio()
+async def test_climate_follows_snapshot_without_climate_values(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that missing climate values in the snapshot read as off and unknown."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={},
+    )
+
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    vehicle = coordinator.data["TestVIN0000000001"]
+    climate = dataclasses.replace(
+        vehicle.climate, pre_climate_active=None, interior_temperature=None
+    )
+    coordinator.async_set_updated_data(
+        dataclasses.replace(
+            coordinator.data,
+            version=coordinator.data.version + 1,
+            vehicles={
+                **coordinator.data.vehicles,
+                "TestVIN0000000001": dataclasses.replace(vehicle, climate=climate),
+            },
+        )
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(get_climate_entity_id(hass))
+    assert state.state == HVACMode.OFF
+    assert state.attributes.get("current_temperature") is None
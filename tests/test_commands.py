@@ -0,0 +1,209 @@
+"""Unit tests for the remote command queue of a vehicle."""
+
+import asyncio
+import dataclasses
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from pysmarthashtag.models import SmartRemoteServiceError
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.smarthashtag.commands import CONFIRM_TIMEOUT
+from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.switch import CHARGING_COMMAND
+
+VIN = "TestVIN0000000001"
+SWITCH = "switch.smart_charging_control"
+CLIMATE = "climate.smart_testvin0000000001_conditioning"
+
+
+async def _setup(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the entry of the test vehicle."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def _charging(entry: MockConfigEntry, status: str) -> None:
+    """Publish data in which the vehicle reports a charging status."""
+    coordinator = entry.runtime_data
+    vehicle = coordinator.data[VIN]
+    vehicle = dataclasses.replace(
+        vehicle,
+        battery=dataclasses.replace(vehicle.battery, charging_status=status),
+    )
+    coordinator.async_set_updated_data(
+        dataclasses.replace(
+            coordinator.data,
+            version=coordinator.data.version + 1,
+            vehicles={**coordinator.data.vehicles, VIN: vehicle},
+        )
+    )
+
+
+@pytest.mark.asyncio()
+async def test_superseded_commands_collapse(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that on, off, on while the first is sent makes a single call."""
+    entry = await _setup(hass)
+    control = entry.runtime_data.account.vehicles[VIN].charging_control
+    sent: list[str] = []
+    release = asyncio.Event()
+
+    async def start_charging():
+        sent.append("start")
+        await release.wait()
+
+    async def stop_charging():
+        sent.append("stop")
+
+    control.start_charging = start_charging
+    control.stop_charging = stop_charging
+    assert hass.states.get(SWITCH).state == "off"
+
+    calls = []
+    for service in ("turn_on", "turn_off", "turn_on"):
+        calls.append(
+            hass.async_create_task(
+                hass.services.async_call(
+                    "switch", service, {"entity_id": SWITCH}, blocking=True
+                )
+            )
+        )
+        await asyncio.sleep(0)
+    # The requested state shows while the command is still being sent.
+    assert hass.states.get(SWITCH).state == "on"
+
+    release.set()
+    await asyncio.gather(*calls)
+    await hass.async_block_till_done()
+
+    queue = entry.runtime_data.command_queue(VIN)
+    assert sent == ["start"]
+    assert queue.superseded == 1
+    assert queue.sent == 1
+    assert hass.states.get(SWITCH).state == "on"
+
+
+@pytest.mark.asyncio()
+async def test_command_confirmed_by_reported_state(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that fast polling ends once the vehicle reports the command's outcome."""
+    entry = await _setup(hass)
+    coordinator = entry.runtime_data
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": SWITCH}, blocking=True
+    )
+    await hass.async_block_till_done()
+    queue = coordinator.command_queue(VIN)
+    assert queue.optimistic == {CHARGING_COMMAND: True}
+    assert f"{VIN}_{CHARGING_COMMAND}" in coordinator.fast_poll_leases
+
+    _charging(entry, "CHARGING")
+    await hass.async_block_till_done()
+
+    assert queue.optimistic == {}
+    assert coordinator.fast_poll_leases == {}
+    assert hass.states.get(SWITCH).state == "on"
+
+
+@pytest.mark.asyncio()
+async def test_unconfirmed_command_reverts(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that the reported state shows again when the vehicle never gets there."""
+    entry = await _setup(hass)
+    coordinator = entry.runtime_data
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": SWITCH}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH).state == "on"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=CONFIRM_TIMEOUT + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert coordinator.command_queue(VIN).reverted == 1
+    assert coordinator.fast_poll_leases == {}
+    assert hass.states.get(SWITCH).state == "off"
+
+
+@pytest.mark.asyncio()
+async def test_rejected_command_raises_and_reverts(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that a command the cloud rejects fails the service call."""
+    entry = await _setup(hass)
+    control = entry.runtime_data.account.vehicles[VIN].charging_control
+
+    async def start_charging():
+        raise SmartRemoteServiceError("vehicle asleep")
+
+    control.start_charging = start_charging
+
+    with pytest.raises(HomeAssistantError) as error:
+        await hass.services.async_call(
+            "switch", "turn_on", {"entity_id": SWITCH}, blocking=True
+        )
+    assert error.value.translation_key == "command_failed"
+    await hass.async_block_till_done()
+
+    assert hass.states.get(SWITCH).state == "off"
+    assert entry.runtime_data.fast_poll_leases == {}
+
+
+@pytest.mark.asyncio()
+async def test_commands_of_a_vehicle_run_one_at_a_time(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that charging and conditioning commands are not sent concurrently."""
+    entry = await _setup(hass)
+    vehicle = entry.runtime_data.account.vehicles[VIN]
+    running = 0
+    overlaps = 0
+
+    async def command(*args):
+        nonlocal running, overlaps
+        running += 1
+        overlaps += running > 1
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    vehicle.charging_control.start_charging = command
+    vehicle.climate_control.set_climate_conditioning = command
+
+    await asyncio.gather(
+        hass.services.async_call(
+            "switch", "turn_on", {"entity_id": SWITCH}, blocking=True
+        ),
+        hass.services.async_call(
+            "climate", "turn_on", {"entity_id": CLIMATE}, blocking=True
+        ),
+    )
+    await hass.async_block_till_done()
+
+    assert overlaps == 0
+    assert entry.runtime_data.command_queue(VIN).sent == 2
+    assert hass.states.get(CLIMATE).state == "heat_cool"
@@ -1,6 +1,7 @@
 """Unit tests for coordinator behavior on API errors."""
 
 import asyncio
+import dataclasses
 import logging
 from datetime import timedelta
 
@@ -10,12 +11,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from httpx import ConnectError, Request, Response
 from pysmarthashtag.tests import RESPONSE_DIR, load_response
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 
-from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.const import DOMAIN, EVENT_VEHICLE_CHANGED
 from custom_components.smarthashtag.coordinator import (
     SmartHashtagDataUpdateCoordinator,
 )
+from custom_components.smarthashtag.vehicle_data import FleetData
 
 
 @pytest.mark.asyncio()
@@ -87,11 +92,11 @@ async def test_coordinator_returns_last_data_on_api_error(
 
 
 @pytest.mark.asyncio()
-async def test_coordinator_set_and_reset_update_interval(
+async def test_coordinator_fast_poll_leases(
     hass: HomeAssistant, smart_fixture: respx.Router
 ):
     """
-    Test the coordinator's set_update_interval and reset_update_interval methods.
+    Test the coordinator's acquire_fast_poll and release_fast_poll methods.
     """
     entry = MockConfigEntry(
         domain=DOMAIN,
@@ -109,31 +114,109 @@ async def test_coordinator_set_and_reset_update_interval(
     await hass.async_block_till_done()
 
     coordinator = entry.runtime_data
+    ttl = timedelta(minutes=2)
 
-    # Test set_update_interval
-    coordinator.set_update_interval("test_key", timedelta(seconds=60))
+    # Test acquire_fast_poll
+    coordinator.acquire_fast_poll("test_key", timedelta(seconds=60), ttl)
     assert coordinator.update_interval == timedelta(seconds=60)
 
     # Add a longer interval - shortest should still be selected
-    coordinator.set_update_interval("another_key", timedelta(seconds=120))
+    coordinator.acquire_fast_poll("another_key", timedelta(seconds=120), ttl)
     assert coordinator.update_interval == timedelta(seconds=60)
 
     # Add a shorter interval - should use this one
-    coordinator.set_update_interval("short_key", timedelta(seconds=30))
+    coordinator.acquire_fast_poll("short_key", timedelta(seconds=30), ttl)
     assert coordinator.update_interval == timedelta(seconds=30)
+    assert set(coordinator.fast_poll_leases) == {"test_key", "another_key", "short_key"}
 
-    # Reset an interval - key should be removed, shortest remaining is selected
-    coordinator.reset_update_interval("short_key")
-    # After reset, short_key is removed, so shortest remaining is test_key (60 seconds)
+    # Release a lease - key should be removed, shortest remaining is selected
+    coordinator.release_fast_poll("short_key")
     assert coordinator.update_interval == timedelta(seconds=60)
-    assert "short_key" not in coordinator._update_intervals
+    assert "short_key" not in coordinator.fast_poll_leases
+
+    # Release all remaining leases - should revert to configured default
+    coordinator.release_fast_poll("test_key")
+    coordinator.release_fast_poll("another_key")
+    assert coordinator.update_interval == timedelta(seconds=300)
+    assert len(coordinator.fast_poll_leases) == 0
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_fast_poll_lease_expires(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that a lease nobody releases still ends after its TTL."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={"scan_interval": 300},
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    if coordinator._unsub_refresh:
+        coordinator._unsub_refresh()
+        coordinator._unsub_refresh = None
+
+    lease = coordinator.acquire_fast_poll(
+        "climate", timedelta(seconds=5), timedelta(seconds=0.05)
+    )
+    assert coordinator.update_interval == timedelta(seconds=5)
+    assert coordinator.fast_poll_leases == {"climate": lease}
 
-    # Reset all remaining intervals - should revert to configured default
-    coordinator.reset_update_interval("test_key")
-    coordinator.reset_update_interval("another_key")
-    # All intervals removed, should use configured default (300 seconds)
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    assert coordinator.fast_poll_leases == {}
+    assert coordinator.update_interval == timedelta(seconds=300)
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_fast_poll_lease_ends_on_predicate(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that a lease ends on the first update that meets its condition."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={"scan_interval": 300},
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    waiting_for = "CHARGING"
+    coordinator.acquire_fast_poll(
+        "charging",
+        timedelta(seconds=5),
+        timedelta(minutes=2),
+        until=lambda vehicles: (
+            vehicles["TestVIN0000000001"].battery.charging_status == waiting_for
+        ),
+    )
+
+    # The fixture vehicle is not charging, so the lease holds.
+    await coordinator.async_refresh()
+    assert "charging" in coordinator.fast_poll_leases
+    assert coordinator.update_interval == timedelta(seconds=5)
+
+    waiting_for = coordinator.data["TestVIN0000000001"].battery.charging_status
+    await coordinator.async_refresh()
+    assert coordinator.fast_poll_leases == {}
     assert coordinator.update_interval == timedelta(seconds=300)
-    assert len(coordinator._update_intervals) == 0
 
 
 @pytest.mark.asyncio()
@@ -524,3 +607,248 @@ async def test_coordinator_repeated_8040_asks_for_reauth(hass: HomeAssistant):
     # Reaching the threshold means the vehicle really is gone.
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_concurrent_refreshes_share_one_fetch(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test that simultaneous refreshes and refresh requests cost one fetch.
+
+    Entities, remote commands and the scheduled poll can all ask for fresh
+    data at the same moment. Each of them used to start its own
+    fetch chain; now they join the fetch that is already in flight.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    if coordinator._unsub_refresh:
+        coordinator._unsub_refresh()
+        coordinator._unsub_refresh = None
+
+    fetch = coordinator.hub.async_fetch
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_fetch(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return await fetch(*args, **kwargs)
+
+    coordinator.hub.async_fetch = slow_fetch
+    # Requests entities made during setup may still wait out the cooldown;
+    # the fetch below serves them as well.
+    coalesced_before = (
+        coordinator.coalesced_refresh_requests + coordinator._pending_refresh_requests
+    )
+
+    refreshes = [hass.async_create_task(coordinator.async_refresh())]
+    await asyncio.sleep(0)
+    refreshes += [
+        hass.async_create_task(coordinator.async_request_refresh()) for _ in range(5)
+    ]
+    refreshes += [hass.async_create_task(coordinator.async_refresh()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(*refreshes)
+    await hass.async_block_till_done()
+
+    assert calls == 1
+    assert coordinator.coalesced_refresh_requests - coalesced_before == 7
+    assert coordinator.last_update_success
+    assert hass.states.get("sensor.smart_last_update").state != "unavailable"
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_debounces_refresh_requests(hass: HomeAssistant):
+    """Test that requests inside the cooldown window fold into one trailing fetch."""
+
+    class CountingAccount:
+        vehicles = {}
+
+        def __init__(self):
+            self.calls = 0
+
+        async def get_vehicles(self):
+            self.calls += 1
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    account = CountingAccount()
+    coordinator = SmartHashtagDataUpdateCoordinator(
+        hass=hass,
+        account=account,
+        entry=entry,
+        request_refresh_cooldown=0.05,
+    )
+
+    # The first request runs right away, the rest land in the cooldown window.
+    for _ in range(5):
+        await coordinator.async_request_refresh()
+    assert account.calls == 1
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    assert account.calls == 2
+    assert coordinator.coalesced_refresh_requests == 3
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_data_is_versioned_snapshot(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test that every refresh produces a new, immutable snapshot of the vehicles.
+
+    The library updates its vehicles in place. The coordinator data must not
+    follow those updates, and consecutive snapshots share what did not change.
+    """
+    vin = "TestVIN0000000001"
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": vin,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    first = coordinator.data
+    assert isinstance(first, FleetData)
+    assert list(first) == [vin]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[vin].battery = None
+    with pytest.raises(TypeError):
+        first[vin].data["vin"] = "changed"
+
+    status = load_response(RESPONSE_DIR / "vehicle_info.json")
+    status["data"]["vehicleStatus"]["additionalVehicleStatus"]["electricVehicleStatus"][
+        "chargeLevel"
+    ] = "48"
+    smart_fixture.get(
+        f"https://api.ecloudeu.com/remote-control/vehicle/status/{vin}?latest=True&target=basic%2Cmore&userId=112233",
+    ).mock(return_value=Response(200, json=status))
+    await coordinator.async_refresh()
+
+    second = coordinator.data
+    assert second.version == first.version + 1
+    assert second[vin] is not first[vin]
+    assert first[vin].battery.remaining_battery_percent.value == 47
+    assert second[vin].battery.remaining_battery_percent.value == 48
+    # Subsystems the refresh did not change are shared with the last snapshot.
+    assert second[vin].safety is first[vin].safety
+    assert second[vin].position is first[vin].position
+    assert second[vin].climate is first[vin].climate
+
+    await coordinator.async_refresh()
+    assert coordinator.data.version == second.version + 1
+    assert coordinator.data[vin].battery is second[vin].battery
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio()
+async def test_coordinator_publishes_vehicle_changes(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that a refresh tells subscribers and the event bus what changed."""
+    vin = "TestVIN0000000001"
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": vin,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    events = async_capture_events(hass, EVENT_VEHICLE_CHANGED)
+    battery_changes = []
+    safety_changes = []
+    unsubscribe = coordinator.async_subscribe(
+        vin,
+        ["battery.remaining_battery_percent"],
+        lambda vin, changes: battery_changes.append(changes),
+    )
+    coordinator.async_subscribe(
+        vin, ["safety"], lambda vin, changes: safety_changes.append(changes)
+    )
+
+    # Nothing the car reports changed, so there is nothing to tell.
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert events == []
+
+    status = load_response(RESPONSE_DIR / "vehicle_info.json")
+    status["data"]["vehicleStatus"]["additionalVehicleStatus"]["electricVehicleStatus"][
+        "chargeLevel"
+    ] = "48"
+    route = smart_fixture.get(
+        f"https://api.ecloudeu.com/remote-control/vehicle/status/{vin}?latest=True&target=basic%2Cmore&userId=112233",
+    ).mock(return_value=Response(200, json=status))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["vin"] == vin
+    assert events[0].data["version"] == coordinator.data.version
+    assert events[0].data["changed"]["battery.remaining_battery_percent"] == {
+        "value": 48,
+        "unit": "%",
+    }
+    assert (
+        events[0].data["previous"]["battery.remaining_battery_percent"]["value"] == 47
+    )
+    assert not any(path.startswith("safety.") for path in events[0].data["changed"])
+    assert len(battery_changes) == 1
+    change = battery_changes[0]["battery.remaining_battery_percent"]
+    assert (change.old.value, change.new.value) == (47, 48)
+    assert safety_changes == []
+
+    unsubscribe()
+    status["data"]["vehicleStatus"]["additionalVehicleStatus"]["electricVehicleStatus"][
+        "chargeLevel"
+    ] = "49"
+    route.mock(return_value=Response(200, json=status))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert len(battery_changes) == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -8,7 +8,7 @@ from pysmarthashtag.tests import RESPONSE_DIR, load_response
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.smarthashtag.const import DOMAIN
-from custom_components.smarthashtag.device_tracker import POSITION_SCALE_FACTOR
+from custom_components.smarthashtag.normalize import POSITION_SCALE_FACTOR
 
 
 def get_device_tracker_entity_id(hass: HomeAssistant) -> str | None:
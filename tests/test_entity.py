@@ -0,0 +1,157 @@
+"""Tests for the state entities compute once per coordinator update."""
+
+import dataclasses
+from collections import Counter
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from pysmarthashtag.models import ValueWithUnit
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.entity import SmartHashtagEntity
+
+VIN = "TestVIN0000000001"
+
+
+async def _setup_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up an entry for the fixture vehicle."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.asyncio()
+async def test_state_follows_coordinator_updates(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that entities compute their state on updates, not on reads."""
+    entry = await _setup_entry(hass)
+    coordinator = entry.runtime_data
+    vehicle = coordinator.account.vehicles[VIN]
+    range_sensor = next(
+        entity
+        for entity in hass.data["sensor"].entities
+        if entity.entity_description.key == f"{VIN}_remaining_range"
+    )
+    before = range_sensor.native_value
+
+    # The library builds new subsystems on each refresh; the coordinator
+    # takes a snapshot of them.
+    vehicle.battery = dataclasses.replace(
+        vehicle.battery, remaining_range=ValueWithUnit(before + 10, "km")
+    )
+    assert range_sensor.native_value == before
+
+    coordinator.async_set_updated_data(coordinator._snapshot_vehicles())
+    assert range_sensor.native_value == before + 10
+    assert hass.states.get("sensor.smart_range").state == str(before + 10)
+
+
+@pytest.mark.asyncio()
+async def test_unchanged_states_are_not_written(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test that an update only writes the entities whose state changed.
+
+    A refresh still shows up as such on the polling sensor, which carries
+    the time of the last refresh and the write counts.
+    """
+    entry = await _setup_entry(hass)
+    coordinator = entry.runtime_data
+    vehicle = coordinator.account.vehicles[VIN]
+    entities = [
+        entity
+        for entity in hass.data["sensor"].entities
+        if isinstance(entity, SmartHashtagEntity)
+    ]
+    last_updated = hass.states.get("sensor.smart_range").last_updated
+
+    # At most the polling sensor is written: it carries the write counts of
+    # the previous update in its attributes.
+    coordinator.async_update_listeners()
+    assert coordinator.state_writes.written <= 1
+    assert coordinator.state_writes.skipped >= len(entities) - 1
+    assert hass.states.get("sensor.smart_range").last_updated == last_updated
+
+    vehicle.battery = dataclasses.replace(
+        vehicle.battery, remaining_range=ValueWithUnit(1, "km")
+    )
+    coordinator.async_set_updated_data(coordinator._snapshot_vehicles())
+    assert 1 <= coordinator.state_writes.written <= 2
+    assert hass.states.get("sensor.smart_range").state == "1"
+    last_updated = hass.states.get("sensor.smart_range").last_updated
+
+    coordinator.async_update_listeners()
+    assert hass.states.get("sensor.smart_range").last_updated == last_updated
+
+    # A state written outside an update, e.g. an optimistic one, is what the
+    # next update compares with.
+    range_sensor = next(
+        entity
+        for entity in entities
+        if entity.entity_description.key == f"{VIN}_remaining_range"
+    )
+    range_sensor._attr_native_value = 2
+    range_sensor.async_write_ha_state()
+    assert hass.states.get("sensor.smart_range").state == "2"
+    coordinator.async_update_listeners()
+    assert hass.states.get("sensor.smart_range").state == "1"
+
+    await coordinator.async_refresh()
+    polling = hass.states.get("sensor.smart_polling_state")
+    assert polling.attributes["last_refresh"] == coordinator.last_refresh.isoformat()
+    assert polling.attributes["states_written"] >= 1
+    assert "states_skipped" in polling.attributes
+
+
+@pytest.mark.asyncio()
+async def test_state_computed_once_per_update(
+    hass: HomeAssistant, smart_fixture: respx.Router, enable_all_entities: None
+):
+    """
+    Test that each update computes the state of every entity exactly once.
+
+    Reading the state afterwards, as the UI and templates do, only reads the
+    computed attributes.
+    """
+    entry = await _setup_entry(hass)
+    coordinator = entry.runtime_data
+    entities = [
+        entity
+        for platform in ("sensor", "binary_sensor", "device_tracker")
+        for entity in hass.data[platform].entities
+        if isinstance(entity, SmartHashtagEntity)
+    ]
+    assert len(entities) > 100
+
+    computations = Counter()
+    for entity in entities:
+        compute = entity._update_from_coordinator
+
+        def spy(entity=entity, compute=compute):
+            computations[entity.entity_id] += 1
+            compute()
+
+        entity._update_from_coordinator = spy
+
+    rounds = 3
+    for _ in range(rounds):
+        coordinator.async_update_listeners()
+    for entity in entities:
+        _ = entity.state
+        _ = entity.extra_state_attributes
+        _ = entity.available
+
+    assert computations == {entity.entity_id: rounds for entity in entities}
@@ -0,0 +1,143 @@
+"""Unit tests for the budgeted, retried and hedged cloud calls of a refresh."""
+
+import asyncio
+import itertools
+
+import httpx
+import pytest
+from aiohttp import web
+
+from custom_components.smarthashtag import executor as executor_module
+from custom_components.smarthashtag.executor import RequestExecutor
+from custom_components.smarthashtag.latency import LATENCY_WINDOW
+
+
+@pytest.fixture
+def short_budgets(monkeypatch: pytest.MonkeyPatch):
+    """Scale the budget constants down to test speed."""
+    monkeypatch.setattr(executor_module, "MIN_CALL_BUDGET", 0.05)
+    monkeypatch.setattr(executor_module, "MIN_HEDGE_DELAY", 0.01)
+
+
+class _Clock:
+    """A loop clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio()
+async def test_slow_call_leaves_time_for_the_rest(short_budgets):
+    """Test that one slow call cannot use up the time of the calls after it."""
+    budget = RequestExecutor().budget(0.3)
+    # The budget reads the clock, the call timeouts still run on the loop.
+    budget._loop = clock = _Clock()
+    budget.deadline = 0.3
+    budget.plan(3)
+
+    async def slow_status():
+        clock.now += 0.2
+        await asyncio.sleep(10)
+
+    # The first call may take all but the time reserved for the other two.
+    assert budget._call_timeout() == pytest.approx(0.2)
+    with pytest.raises(TimeoutError):
+        await budget.run("status", slow_status)
+    # Two calls are still planned, and there is time for them.
+    assert budget.remaining == pytest.approx(0.1)
+    assert budget._call_timeout() == pytest.approx(0.05)
+    assert await budget.run("soc", lambda: asyncio.sleep(0, "soc")) == "soc"
+    assert await budget.run("ota", lambda: asyncio.sleep(0, "ota")) == "ota"
+
+    # Once the budget is gone, calls fail right away.
+    budget = RequestExecutor().budget(0)
+    with pytest.raises(TimeoutError, match="No time left"):
+        await budget.run("status", lambda: asyncio.sleep(0))
+
+
+@pytest.mark.asyncio()
+async def test_idempotent_calls_are_retried(short_budgets):
+    """Test that only idempotent calls are repeated after a dropped request."""
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("dropped")
+        return "data"
+
+    executor = RequestExecutor()
+    assert await executor.budget(1).run("status", flaky, idempotent=True) == "data"
+    assert calls == 2
+    assert executor.retries == 1
+
+    calls = 0
+    with pytest.raises(httpx.ConnectError):
+        await executor.budget(1).run("select", flaky)
+    assert calls == 1
+
+
+@pytest.mark.asyncio()
+async def test_late_call_is_hedged(short_budgets):
+    """Test that a call running past its usual latency is sent again."""
+    executor = RequestExecutor()
+    for _ in range(LATENCY_WINDOW):
+        executor.latency["status"].record(0.01)
+    answers = iter([asyncio.sleep(10, "late"), asyncio.sleep(0, "hedge")])
+
+    result = await executor.budget(1).run(
+        "status", lambda: next(answers), idempotent=True
+    )
+
+    assert result == "hedge"
+    assert executor.hedges == 1
+
+
+@pytest.mark.asyncio()
+async def test_hedging_cuts_tail_latency_of_a_spiky_server(
+    short_budgets, socket_enabled
+):
+    """Test against a local server delaying one request in 25 by a spike."""
+    counter = itertools.count()
+
+    async def status(request: web.Request) -> web.Response:
+        if next(counter) % 25 == 24:
+            await asyncio.sleep(0.5)
+        return web.json_response({"code": 1000})
+
+    app = web.Application()
+    app.router.add_get("/status", status)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    async def slowest(client: httpx.AsyncClient, *, hedge: bool) -> float:
+        executor = RequestExecutor()
+        loop = asyncio.get_running_loop()
+        durations = []
+        for _ in range(100):
+            started = loop.time()
+            await executor.budget(5).run(
+                "status",
+                lambda: client.get(f"http://127.0.0.1:{port}/status"),
+                idempotent=hedge,
+            )
+            durations.append(loop.time() - started)
+        # The first requests only teach the executor the usual latency.
+        return max(durations[LATENCY_WINDOW:])
+
+    try:
+        async with httpx.AsyncClient() as client:
+            plain = await slowest(client, hedge=False)
+            hedged = await slowest(client, hedge=True)
+    finally:
+        await runner.cleanup()
+
+    assert plain >= 0.5
+    assert hedged < plain / 2
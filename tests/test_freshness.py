@@ -0,0 +1,269 @@
+"""Tests for per-source refresh of vehicle data."""
+
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from httpx import Response
+from pysmarthashtag.tests import RESPONSE_DIR, load_response
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.coordinator import MAX_TRANSIENT_FAILURES
+from custom_components.smarthashtag.freshness import (
+    SOURCE_TTLS,
+    DataSource,
+    FreshnessTracker,
+    source_of,
+    stale_sources,
+)
+
+VIN = "TestVIN0000000001"
+API = "https://api.ecloudeu.com/remote-control/vehicle/status"
+STATUS_URL = f"{API}/{VIN}?latest=True&target=basic%2Cmore&userId=112233"
+SOC_URL = f"{API}/soc/{VIN}?setting=charging"
+
+
+def test_tracker_reports_unknown_and_expired_sources_as_due():
+    """Test that a source is due until fetched and again once its TTL runs out."""
+    now = dt_util.utcnow()
+    tracker = FreshnessTracker()
+    assert tracker.due(VIN, now) == set(DataSource)
+
+    tracker.mark(VIN, DataSource, now)
+    # Status has no TTL and is fetched on every poll.
+    assert tracker.due(VIN, now) == {DataSource.STATUS}
+
+    later = now + SOURCE_TTLS[DataSource.JOURNAL]
+    assert DataSource.JOURNAL in tracker.due(VIN, later)
+    assert DataSource.OTA not in tracker.due(VIN, later)
+
+
+def test_sources_turn_stale_once_they_keep_failing_past_the_limit():
+    """Test that the limit counts from when a source became due."""
+    now = dt_util.utcnow()
+    limit = timedelta(minutes=10)
+    fetched = {
+        DataSource.STATUS: now - timedelta(minutes=11),
+        DataSource.OTA: now - SOURCE_TTLS[DataSource.OTA] - timedelta(minutes=5),
+    }
+    assert stale_sources(fetched, now, limit) == {DataSource.STATUS}
+    assert stale_sources({}, now, limit) == set()
+
+    assert source_of("battery", "charging_target_soc") is DataSource.CHARGING_SETTINGS
+    assert source_of("battery", "remaining_range") is DataSource.STATUS
+    assert source_of("last_trip", "distance") is DataSource.JOURNAL
+    assert source_of(None, "odometer") is DataSource.STATUS
+
+
+def _requested_paths(router: respx.Router, since: int) -> list[str]:
+    """Return the paths of the requests the router saw after the first `since`."""
+    return [call.request.url.path for call in list(router.calls)[since:]]
+
+
+@pytest.mark.asyncio()
+async def test_regular_refresh_only_fetches_status(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test the HTTP calls a refresh costs once every source has been fetched.
+
+    A full get_vehicles() chain is six calls per vehicle. A regular poll only
+    needs the vehicle bound and its status; the other sources follow once
+    their TTL runs out, and keep their values in between.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    vehicle = coordinator.data[VIN]
+    ota = vehicle.data.get("ota")
+    target_soc = vehicle.battery.charging_target_soc
+
+    before = len(smart_fixture.calls)
+    await coordinator.async_refresh()
+    paths = _requested_paths(smart_fixture, before)
+
+    assert len(paths) == 2
+    assert any(path.endswith(f"/vehicle/status/{VIN}") for path in paths)
+    assert not any("/soc/" in path or "/app/info/" in path for path in paths)
+    assert coordinator.data[VIN].data.get("ota") == ota
+    assert coordinator.data[VIN].battery.charging_target_soc == target_soc
+
+    # Once the TTLs run out, the next refresh fetches the slow sources again.
+    for source in DataSource:
+        coordinator.hub.freshness.mark(
+            VIN, (source,), dt_util.utcnow() - SOURCE_TTLS[source] - timedelta(1)
+        )
+    before = len(smart_fixture.calls)
+    await coordinator.async_refresh()
+    paths = _requested_paths(smart_fixture, before)
+
+    assert any(path.endswith(f"/status/soc/{VIN}") for path in paths)
+    assert any(path.endswith(f"/app/info/{VIN}") for path in paths)
+    assert len(paths) > 2
+    assert coordinator.last_update_success
+
+
+@pytest.mark.asyncio()
+async def test_failing_source_keeps_the_others_updating(
+    hass: HomeAssistant, smart_fixture: respx.Router, enable_all_entities: None
+):
+    """
+    Test that a failing status call does not throw away the other sources.
+
+    The charging target still comes through, and the refresh counts as a
+    success. Values of the status source keep their last good values until
+    it kept failing past the staleness limit; then only its entities turn
+    unavailable.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+        options={"staleness_limit": 600},
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    remaining_range = hass.states.get("sensor.smart_range").state
+
+    smart_fixture.get(STATUS_URL).mock(
+        return_value=Response(
+            200,
+            json={"code": "1509", "message": "Service maintenance, try again later."},
+        )
+    )
+    smart_fixture.get(SOC_URL).mock(
+        return_value=Response(200, json={"code": 1000, "data": {"soc": 800}})
+    )
+    freshness = coordinator.hub.freshness
+    status_fetched_at = freshness.fetched(VIN)[DataSource.STATUS]
+    freshness.mark(
+        VIN,
+        (DataSource.CHARGING_SETTINGS,),
+        dt_util.utcnow() - SOURCE_TTLS[DataSource.CHARGING_SETTINGS],
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert coordinator._consecutive_failures == 0
+    assert hass.states.get("sensor.smart_charging_target").state == "80.0"
+    assert hass.states.get("sensor.smart_range").state == remaining_range
+    assert coordinator.data[VIN].fetched_at[DataSource.STATUS] == status_fetched_at
+
+    # Status keeps failing past the limit: only its entities go unavailable.
+    freshness.mark(VIN, (DataSource.STATUS,), dt_util.utcnow() - timedelta(hours=1))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert hass.states.get("sensor.smart_range").state == STATE_UNAVAILABLE
+    trackers = hass.states.async_all("device_tracker")
+    assert [tracker.state for tracker in trackers] == [STATE_UNAVAILABLE]
+    assert hass.states.get("sensor.smart_charging_target").state == "80.0"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio()
+async def test_long_status_outage_is_not_ended_by_other_sources(
+    hass: HomeAssistant, smart_fixture: respx.Router, enable_all_entities: None
+):
+    """
+    Test that the charging target coming through does not end a status outage.
+
+    It is fetched every 15 minutes, while the status fails on every poll.
+    Those refreshes neither reset the failure count of the status nor turn
+    its entities available again in between.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    remaining_range = hass.states.get("sensor.smart_range").state
+    freshness = coordinator.hub.freshness
+
+    async def refresh(charging_settings_due: bool = False) -> None:
+        if charging_settings_due:
+            freshness.mark(
+                VIN,
+                (DataSource.CHARGING_SETTINGS,),
+                dt_util.utcnow() - SOURCE_TTLS[DataSource.CHARGING_SETTINGS],
+            )
+        # The circuit breaker would hold back the polls of a long outage.
+        coordinator.breaker.record_success()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    status = smart_fixture.get(STATUS_URL).mock(
+        return_value=Response(
+            200,
+            json={"code": "1509", "message": "Service maintenance, try again later."},
+        )
+    )
+    smart_fixture.get(SOC_URL).mock(
+        return_value=Response(200, json={"code": 1000, "data": {"soc": 800}})
+    )
+
+    # Early in the outage, the charging target comes through without ending it.
+    await refresh()
+    await refresh(charging_settings_due=True)
+    assert coordinator._consecutive_failures == 1
+    assert coordinator.last_update_success
+    assert hass.states.get("sensor.smart_charging_target").state == "80.0"
+    assert hass.states.get("sensor.smart_range").state == remaining_range
+
+    while coordinator._consecutive_failures < MAX_TRANSIENT_FAILURES:
+        await refresh()
+    assert not coordinator.last_update_success
+    assert hass.states.get("sensor.smart_range").state == STATE_UNAVAILABLE
+
+    await refresh(charging_settings_due=True)
+    assert coordinator._consecutive_failures == MAX_TRANSIENT_FAILURES
+    assert not coordinator.last_update_success
+    assert hass.states.get("sensor.smart_range").state == STATE_UNAVAILABLE
+
+    # The status is back: so are its entities, and the charging target.
+    status.mock(
+        return_value=Response(
+            200, json=load_response(RESPONSE_DIR / "vehicle_info.json")
+        )
+    )
+    await refresh()
+    assert coordinator._consecutive_failures == 0
+    assert coordinator.last_update_success
+    assert hass.states.get("sensor.smart_range").state == remaining_range
+    assert hass.states.get("sensor.smart_charging_target").state == "80.0"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,191 @@
+"""Tests for the account hub shared by entries of the same login."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pysmarthashtag.const import API_CARS_URL, API_SESION_URL
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.smarthashtag import coordinator as coordinator_module
+from custom_components.smarthashtag.const import DOMAIN, DOMAIN_DATA
+from custom_components.smarthashtag.hub import REFRESH_JOIN_SHARE
+
+VINS = ("TestVIN0000000001", "TestVIN0000000002")
+
+
+def _count_calls(router: respx.Router, path: str) -> int:
+    """Return how many requests the router saw for a path."""
+    return sum(call.request.url.path == path for call in router.calls)
+
+
+def _slow_fetches(monkeypatch: pytest.MonkeyPatch, hub) -> None:
+    """
+    Make each fetch of the hub take more than half of a shortened budget.
+
+    Refreshes queued behind one another then only succeed if waiting for
+    the hub does not count against their budget.
+    """
+    monkeypatch.setattr(coordinator_module, "API_TIMEOUT", 1.0)
+    monkeypatch.setattr(coordinator_module, "API_TIMEOUT_GRACE", 0.5)
+    fetch = hub._async_fetch
+
+    async def slow_fetch(vins, budget):
+        await budget.run("slow", lambda: asyncio.sleep(0.6))
+        await fetch(vins, budget)
+
+    monkeypatch.setattr(hub, "_async_fetch", slow_fetch)
+
+
+@pytest.mark.asyncio()
+async def test_entries_of_one_login_share_a_session(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test that vehicles of one login cost one login and one vehicle list.
+
+    Each entry still only sees its own vehicle, and the hub lives as long as
+    any entry of the login is loaded.
+    """
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "username": "sample_user",
+                "password": "sample_password",
+                "vehicle": vin,
+            },
+        )
+        for vin in VINS
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    # Setting up the integration sets up every entry of the domain.
+    await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    assert _count_calls(smart_fixture, API_SESION_URL) == 1
+    assert _count_calls(smart_fixture, API_CARS_URL) == 1
+
+    first, second = (entry.runtime_data for entry in entries)
+    assert first.hub is second.hub
+    assert first.hub.tracked_vins == list(VINS)
+    assert list(first.data) == [VINS[0]]
+    assert list(second.data) == [VINS[1]]
+
+    await first.async_refresh()
+    await second.async_refresh()
+    assert first.last_update_success
+    assert second.last_update_success
+    assert _count_calls(smart_fixture, API_SESION_URL) == 1
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    assert hass.data[DOMAIN_DATA]["sample_user"] is second.hub
+    assert second.hub.tracked_vins == [VINS[1]]
+
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    assert "sample_user" not in hass.data[DOMAIN_DATA]
+
+
+@pytest.mark.asyncio()
+async def test_entries_of_one_login_poll_in_one_loop(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that one timer of the hub refreshes every entry of a login together.
+
+    The joined refreshes queue for the hub, yet each gets its whole budget.
+    """
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "username": "sample_user",
+                "password": "sample_password",
+                "vehicle": vin,
+            },
+        )
+        for vin in VINS
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    first, second = (entry.runtime_data for entry in entries)
+    hub = first.hub
+
+    def timers() -> list[asyncio.TimerHandle]:
+        return [
+            handle
+            for handle in hass.loop._scheduled
+            if not handle.cancelled()
+            and getattr(handle._callback, "__self__", None) in (hub, first, second)
+        ]
+
+    assert set(hub._scheduled) == {entry.entry_id for entry in entries}
+    assert [handle._callback for handle in timers()] == [hub._start_due_refreshes]
+
+    # The second entry is due a little later, yet refreshes along.
+    scheduled = hub._scheduled
+    first_due = scheduled[entries[0].entry_id].due
+    joining = scheduled[entries[1].entry_id]
+    joining.due = first_due + joining.interval * REFRESH_JOIN_SHARE / 2
+    hub._arm_refresh_timer(hass)
+    _slow_fetches(monkeypatch, hub)
+    refreshed = (first.last_refresh, second.last_refresh)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=first_due - hass.loop.time() + 1)
+    )
+    await hass.async_block_till_done()
+
+    for coordinator, last_refresh in zip((first, second), refreshed, strict=True):
+        assert coordinator.last_refresh != last_refresh
+        assert coordinator._consecutive_failures == 0
+    assert set(hub._scheduled) == {entry.entry_id for entry in entries}
+    assert len(timers()) == 1
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not timers()
+
+
+@pytest.mark.asyncio()
+async def test_entries_of_one_login_refresh_together(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a refresh waiting for the hub keeps its whole budget."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "username": "sample_user",
+                "password": "sample_password",
+                "vehicle": vin,
+            },
+        )
+        for vin in VINS
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    first, second = (entry.runtime_data for entry in entries)
+    hub = first.hub
+
+    _slow_fetches(monkeypatch, hub)
+    refreshed = (first.last_refresh, second.last_refresh)
+    await asyncio.gather(first.async_refresh(), second.async_refresh())
+
+    for coordinator, last_refresh in zip((first, second), refreshed, strict=True):
+        assert coordinator.last_update_success
+        assert coordinator.last_refresh != last_refresh
+        assert coordinator._consecutive_failures == 0
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -1,9 +1,25 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
 import respx
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from pysmarthashtag.account import SmartAccount
+from pysmarthashtag.const import API_CARS_URL, API_SESION_URL
+from pysmarthashtag.models import SmartAuthError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.const import (
+    ATTR_RESTORED_AT,
+    CONF_CHARGING_INTERVAL,
+    CONF_CONDITIONING_TEMP,
+    CONF_DRIVING_INTERVAL,
+    CONF_STALENESS_LIMIT,
+    DOMAIN,
+)
 
 
 @pytest.mark.skip("Not implemented")
@@ -30,3 +46,198 @@ async def test_component_reload(hass: HomeAssistant, smart_fixture: respx.Router
     await entry.runtime_data.async_refresh()
 
     assert await entry.runtime_data.async_reload(entry.entry_id)
+
+
+def _gated_cloud(
+    monkeypatch: pytest.MonkeyPatch,
+    gate: asyncio.Event,
+    error: Exception | None = None,
+) -> asyncio.Event:
+    """
+    Hold every vehicle selection until the gate opens, then fail or go ahead.
+
+    Every fetch starts with one. Returns an event set once a fetch waits.
+    """
+    select_active_vehicle = SmartAccount.select_active_vehicle
+    waiting = asyncio.Event()
+
+    async def gated_select_active_vehicle(self, *args, **kwargs):
+        waiting.set()
+        await gate.wait()
+        if error is not None:
+            raise error
+        return await select_active_vehicle(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        SmartAccount, "select_active_vehicle", gated_select_active_vehicle
+    )
+    return waiting
+
+
+@pytest.mark.asyncio()
+async def test_setup_shows_snapshot_before_first_refresh(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that only a setup without a saved snapshot waits for the cloud.
+
+    The first setup has nothing to show before the cloud answers and waits
+    for it. After a restart the snapshot is shown right away and the cloud
+    refresh replaces it in the background.
+    """
+    gate = asyncio.Event()
+    waiting = _gated_cloud(monkeypatch, gate)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    setup = hass.async_create_task(hass.config_entries.async_setup(entry.entry_id))
+    await waiting.wait()
+    assert not setup.done()
+    assert hass.states.get("sensor.smart_last_update") is None
+    gate.set()
+    assert await setup
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    gate.clear()
+    waiting.clear()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    state = hass.states.get("sensor.smart_last_update")
+    assert ATTR_RESTORED_AT in state.attributes
+    await waiting.wait()
+
+    gate.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    state = hass.states.get("sensor.smart_last_update")
+    assert ATTR_RESTORED_AT not in state.attributes
+
+
+@pytest.mark.asyncio()
+async def test_background_first_refresh_starts_reauth(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a login rejected after a restart still asks for reauth."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    gate = asyncio.Event()
+    _gated_cloud(monkeypatch, gate, SmartAuthError("Invalid credentials"))
+    with patch.object(entry, "async_start_reauth") as start_reauth:
+        await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.LOADED
+        gate.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    start_reauth.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_setup_fetches_each_vehicle_once(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test the cloud calls from setup until every platform is loaded.
+
+    Two vehicles of one login cost a single get_vehicles() chain: one login,
+    one vehicle list and one status call per vehicle, however many platforms
+    set up entities.
+    """
+    get_vehicles = SmartAccount.get_vehicles
+    chains = 0
+
+    async def counting_get_vehicles(self, *args, **kwargs):
+        nonlocal chains
+        chains += 1
+        return await get_vehicles(self, *args, **kwargs)
+
+    monkeypatch.setattr(SmartAccount, "get_vehicles", counting_get_vehicles)
+    vins = ("TestVIN0000000001", "TestVIN0000000002")
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                "username": "sample_user",
+                "password": "sample_password",
+                "vehicle": vin,
+            },
+        )
+        for vin in vins
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    paths = [call.request.url.path for call in smart_fixture.calls]
+    assert chains == 1
+    assert paths.count(API_SESION_URL) == 1
+    assert paths.count(API_CARS_URL) == 1
+    for vin in vins:
+        assert paths.count(f"/remote-control/vehicle/status/{vin}") == 1
+
+
+@pytest.mark.asyncio()
+async def test_options_apply_without_reload(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that changed options reach the running entry without a reload."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    smart_fixture.reset()
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            CONF_SCAN_INTERVAL: 900,
+            CONF_CHARGING_INTERVAL: 120,
+            CONF_DRIVING_INTERVAL: 60,
+            CONF_CONDITIONING_TEMP: 24,
+            CONF_STALENESS_LIMIT: 3600,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data is coordinator
+    assert not smart_fixture.calls
+    assert coordinator.update_interval == timedelta(seconds=900)
+    assert coordinator.staleness_limit == timedelta(seconds=3600)
+    state = hass.states.get("climate.smart_testvin0000000001_conditioning")
+    assert state.attributes["temperature"] == 24
+
+    # A new password is only used by a new login.
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_PASSWORD: "new_password"}
+    )
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data is not coordinator
@@ -0,0 +1,131 @@
+"""Unit tests for the refresh latency estimate and the interval floor."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_DRIVING_INTERVAL,
+    DOMAIN,
+)
+from custom_components.smarthashtag.coordinator import latency_issue_id
+from custom_components.smarthashtag.latency import (
+    LATENCY_WINDOW,
+    MIN_LATENCY_SAMPLES,
+    LatencyTracker,
+)
+
+
+def test_latency_percentiles():
+    """Test that the percentiles follow the recorded durations."""
+    tracker = LatencyTracker()
+    assert tracker.p50 is None
+    assert tracker.p95 is None
+
+    for seconds in range(1, 21):
+        tracker.record(float(seconds))
+
+    assert tracker.p50 == 10.0
+    assert tracker.p95 == 19.0
+    assert tracker.percentile(100) == 20.0
+
+
+def test_latency_floor_needs_samples_and_rolls():
+    """Test that the floor waits for enough refreshes and forgets old ones."""
+    tracker = LatencyTracker()
+    for _ in range(MIN_LATENCY_SAMPLES - 1):
+        tracker.record(20.4)
+    assert tracker.floor is None
+
+    tracker.record(20.4)
+    assert tracker.floor == timedelta(seconds=21)
+
+    # Once the cloud got faster, the slow refreshes roll out of the window.
+    for _ in range(LATENCY_WINDOW):
+        tracker.record(2.0)
+    assert tracker.samples == LATENCY_WINDOW
+    assert tracker.floor == timedelta(seconds=2)
+
+
+@pytest.mark.asyncio()
+async def test_slow_refreshes_raise_interval_floor_and_issue(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that polling slows down to the refresh duration and says so."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={
+            CONF_SCAN_INTERVAL: 300,
+            CONF_CHARGING_INTERVAL: 30,
+            CONF_DRIVING_INTERVAL: 60,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    issue_id = latency_issue_id(entry.entry_id)
+    issues = ir.async_get(hass)
+    assert issues.async_get_issue(DOMAIN, issue_id) is None
+
+    # Refreshes take about 40 seconds, more than the 30 second charging interval.
+    for _ in range(LATENCY_WINDOW):
+        coordinator.latency.record(40.0)
+    coordinator.acquire_fast_poll("test", timedelta(seconds=5), timedelta(minutes=2))
+    await coordinator.async_refresh()
+
+    assert coordinator.update_interval == timedelta(seconds=40)
+    issue = issues.async_get_issue(DOMAIN, issue_id)
+    assert issue is not None
+    assert issue.translation_placeholders == {"interval": "30", "latency": "40"}
+
+    # Once refreshes are fast again, the lease's interval applies again.
+    for _ in range(LATENCY_WINDOW):
+        coordinator.latency.record(1.0)
+    await coordinator.async_refresh()
+
+    assert coordinator.update_interval == timedelta(seconds=5)
+    assert issues.async_get_issue(DOMAIN, issue_id) is None
+    coordinator.release_fast_poll("test")
+
+
+@pytest.mark.asyncio()
+async def test_refresh_latency_leaves_out_lock_waits(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that waiting for a remote command is not counted as refresh time."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    samples = coordinator.latency.samples
+    # A command being sent holds the hub's lock for a while.
+    async with coordinator.hub.lock:
+        refresh = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.sleep(0.5)
+    await refresh
+
+    assert coordinator.latency.samples == samples + 1
+    assert coordinator.latency.percentile(100) < 0.5
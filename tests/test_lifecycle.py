@@ -0,0 +1,156 @@
+"""Tests that unloading and reloading an entry leaves nothing behind."""
+
+import asyncio
+import gc
+import logging
+import os
+import tracemalloc
+import weakref
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from pysmarthashtag.account import SmartAccount
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import DOMAIN, DOMAIN_DATA
+from custom_components.smarthashtag.coordinator import SmartHashtagDataUpdateCoordinator
+from custom_components.smarthashtag.transport import DATA_TRANSPORT
+
+
+def _entry() -> MockConfigEntry:
+    """Return the config entry of the test vehicle."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+
+
+def _footprint(hass: HomeAssistant) -> tuple[dict[str, int], int]:
+    """Return the event listeners and the timers scheduled on the loop."""
+    timers = sum(1 for handle in hass.loop._scheduled if not handle.cancelled())
+    return hass.bus.async_listeners(), timers
+
+
+@pytest.mark.asyncio()
+async def test_unload_cancels_fetch_in_flight_and_leases(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that unloading stops a running fetch and drops the fast poll leases."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    coordinator.acquire_fast_poll("test", timedelta(seconds=5), timedelta(minutes=2))
+
+    stuck = asyncio.Event()
+
+    async def hanging_select_active_vehicle(self, *args, **kwargs):
+        stuck.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(
+        SmartAccount, "select_active_vehicle", hanging_select_active_vehicle
+    )
+    refresh = hass.async_create_task(coordinator.async_refresh())
+    await stuck.wait()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert refresh.done()
+    assert coordinator._update_task is None
+    assert not coordinator.polling.leases
+    assert not coordinator._lease_timers
+    assert DOMAIN_DATA not in hass.data or not hass.data[DOMAIN_DATA]
+    assert DATA_TRANSPORT not in hass.data
+
+
+@pytest.mark.asyncio()
+async def test_reload_leaves_no_listeners_or_timers(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that reloads neither pile up listeners and timers nor keep coordinators."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    first = weakref.ref(entry.runtime_data)
+    entry.runtime_data.acquire_fast_poll(
+        "test", timedelta(seconds=5), timedelta(minutes=2)
+    )
+
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    baseline = _footprint(hass)
+
+    for _ in range(20):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert _footprint(hass) == baseline
+    gc.collect()
+    assert first() is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_TRANSPORT not in hass.data
+
+
+@pytest.mark.asyncio()
+async def test_reload_soak_keeps_fds_and_memory_flat(
+    hass: HomeAssistant, smart_fixture: respx.Router, caplog: pytest.LogCaptureFixture
+):
+    """Test that many reloads neither leak file descriptors nor memory."""
+    # Captured log records and the calls recorded by the mocks of the test
+    # harness would otherwise grow with every reload.
+    caplog.set_level(logging.WARNING)
+    entry = _entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    async def reload(times: int) -> None:
+        for _ in range(times):
+            assert await hass.config_entries.async_reload(entry.entry_id)
+            await hass.async_block_till_done()
+            smart_fixture.reset()
+            Store._async_load.reset_mock()
+            Store._async_write_data.reset_mock()
+
+    # Only what the integration allocates counts; Home Assistant itself keeps
+    # the entity platforms of unloaded entries around.
+    ours = [tracemalloc.Filter(True, "*/custom_components/smarthashtag/*")]
+    tracemalloc.start()
+    try:
+        # Warm up caches that fill once, such as translations and the registries.
+        await reload(10)
+        gc.collect()
+        fds = len(os.listdir("/proc/self/fd"))
+        before = tracemalloc.take_snapshot().filter_traces(ours)
+        await reload(40)
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(ours)
+    finally:
+        tracemalloc.stop()
+
+    assert len(os.listdir("/proc/self/fd")) <= fds
+    growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # One leaked coordinator with its entities is well above this.
+    assert growth < 16 * 1024
+    coordinators = [
+        obj
+        for obj in gc.get_objects()
+        if isinstance(obj, SmartHashtagDataUpdateCoordinator)
+    ]
+    assert coordinators == [entry.runtime_data]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,95 @@
+"""Unit tests for the normalization of the vehicle data."""
+
+from types import SimpleNamespace
+
+import pytest
+from pysmarthashtag.models import ValueWithUnit
+from pysmarthashtag.vehicle.battery import Battery
+from pysmarthashtag.vehicle.position import Position
+from pysmarthashtag.vehicle.tires import Tires
+
+from custom_components.smarthashtag.normalize import (
+    POSITION_SCALE_FACTOR,
+    normalize_charging_status,
+    normalize_subsystem,
+    normalize_value,
+)
+from custom_components.smarthashtag.vehicle_data import VehicleData
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (ValueWithUnit(-0.0, "W"), ValueWithUnit(0.0, "W")),
+        (ValueWithUnit(21, "C"), ValueWithUnit(21, "°C")),
+        (ValueWithUnit(None, None), ValueWithUnit(None, None)),
+        ([ValueWithUnit(20, "C")], [ValueWithUnit(20, "°C")]),
+        ("engine_off", "engine_off"),
+    ],
+)
+def test_normalize_value(value, expected):
+    """Test that units and zeros come out in one form."""
+    normalized = normalize_value(value)
+    assert normalized == expected
+    if isinstance(expected, ValueWithUnit) and isinstance(expected.value, float):
+        assert str(normalized.value) == str(expected.value)
+
+
+def test_normalize_value_keeps_canonical_values():
+    """Test that values already in canonical form are not copied."""
+    value = ValueWithUnit(2.5, "bar")
+    assert normalize_value(value) is value
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        ("CHARGING", "CHARGING"),
+        ("dc_charging", "DC_CHARGING"),
+        ("SOMETHING_NEW", None),
+        (None, None),
+    ],
+)
+def test_normalize_charging_status(status, expected):
+    """Test that only charging statuses the library knows pass."""
+    assert normalize_charging_status(status) == expected
+
+
+def test_normalize_subsystem_copies_only_when_needed():
+    """Test that the library's objects are never changed."""
+    battery = Battery(
+        charging_status="charging", charging_power=ValueWithUnit(-0.0, "W")
+    )
+    normalized = normalize_subsystem("battery", battery)
+    assert normalized is not battery
+    assert normalized.charging_status == "CHARGING"
+    assert str(normalized.charging_power.value) == "0.0"
+    assert battery.charging_status == "charging"
+
+    # A power of 0 W reads 0.0, like every other power.
+    idle = normalize_subsystem("battery", Battery(charging_power=ValueWithUnit(0, "W")))
+    assert str(idle.charging_power.value) == "0.0"
+
+    canonical = Battery(charging_status="CHARGING")
+    assert normalize_subsystem("battery", canonical) is canonical
+    assert normalize_subsystem("battery", None) is None
+
+
+def test_vehicle_data_is_normalized():
+    """Test that a snapshot holds canonical values only."""
+    vehicle = SimpleNamespace(
+        position=Position(latitude=123456789, longitude=987654321),
+        tires=Tires(temperature=[ValueWithUnit(20, "C")] * 4),
+        service={"distanceToService": ValueWithUnit(-0.0, "km")},
+    )
+    snapshot = VehicleData.from_vehicle(vehicle)
+
+    assert snapshot.position.latitude == 123456789 / POSITION_SCALE_FACTOR
+    assert snapshot.position.longitude == 987654321 / POSITION_SCALE_FACTOR
+    assert {value.unit for value in snapshot.tires.temperature} == {"°C"}
+    assert str(snapshot.service["distanceToService"].value) == "0.0"
+    assert vehicle.position.latitude == 123456789
+
+    # Normalized values compare equal to the last snapshot and are shared.
+    vehicle.position = Position(latitude=123456789, longitude=987654321)
+    assert VehicleData.from_vehicle(vehicle, snapshot).position is snapshot.position
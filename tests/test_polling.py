@@ -0,0 +1,219 @@
+"""Unit tests for the adaptive polling scheduler."""
+
+from datetime import timedelta
+
+import pytest
+import respx
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_DRIVING_INTERVAL,
+    DOMAIN,
+)
+from custom_components.smarthashtag.polling import (
+    EXIT_HYSTERESIS,
+    FastPollLease,
+    PollingScheduler,
+    PollingState,
+)
+from custom_components.smarthashtag.vehicle_mode import VehicleMode
+
+VIN = "TestVIN0000000001"
+OPTIONS = {
+    CONF_SCAN_INTERVAL: 300,
+    CONF_CHARGING_INTERVAL: 30,
+    CONF_DRIVING_INTERVAL: 60,
+}
+
+
+def test_active_state_is_entered_on_first_report():
+    """Test that an active mode switches the interval on the poll that reports it."""
+    scheduler = PollingScheduler(OPTIONS)
+    assert scheduler.interval == timedelta(seconds=300)
+
+    polling = scheduler.observe(VIN, VehicleMode.DC_CHARGING)
+
+    assert polling.state is PollingState.CHARGING
+    assert scheduler.interval == timedelta(seconds=30)
+    assert "dc_charging" in scheduler.reason
+
+
+def test_active_state_exit_has_hysteresis_and_decay():
+    """Test that leaving an active state waits for confirmation, then decays."""
+    scheduler = PollingScheduler(OPTIONS)
+    scheduler.observe(VIN, VehicleMode.CHARGING)
+
+    # A lone parked snapshot in the middle of a charge changes nothing.
+    for _ in range(EXIT_HYSTERESIS - 1):
+        polling = scheduler.observe(VIN, VehicleMode.PARKED)
+        assert polling.state is PollingState.CHARGING
+        assert scheduler.interval == timedelta(seconds=30)
+
+    intervals = []
+    while (polling := scheduler.observe(VIN, VehicleMode.PARKED)).state in (
+        PollingState.CHARGING,
+        PollingState.DECAY,
+    ):
+        intervals.append(polling.interval.total_seconds())
+
+    assert intervals == [60, 120, 240]
+    assert polling.state is PollingState.IDLE
+    assert scheduler.interval == timedelta(seconds=300)
+
+    # Charging again interrupts the decay right away.
+    scheduler.observe(VIN, VehicleMode.PARKED)
+    assert scheduler.observe(VIN, VehicleMode.CHARGING).state is PollingState.CHARGING
+
+
+def test_shortest_vehicle_or_lease_wins():
+    """Test that the coordinator interval follows the most demanding input."""
+    now = dt_util.utcnow()
+    scheduler = PollingScheduler(OPTIONS)
+    scheduler.observe(VIN, VehicleMode.DRIVING)
+    scheduler.observe("OtherVIN", VehicleMode.PARKED)
+    assert scheduler.interval == timedelta(seconds=60)
+
+    scheduler.add_lease(
+        FastPollLease("climate", timedelta(seconds=5), now + timedelta(minutes=2))
+    )
+    assert scheduler.interval == timedelta(seconds=5)
+    assert scheduler.reason == "lease climate"
+
+    assert scheduler.release("climate") is not None
+    assert scheduler.release("climate") is None
+    assert scheduler.interval == timedelta(seconds=60)
+
+    scheduler.forget(VIN)
+    assert scheduler.interval == timedelta(seconds=300)
+
+
+def test_settle_leases_drops_expired_and_satisfied():
+    """Test that leases end on their TTL or their predicate, never later."""
+    now = dt_util.utcnow()
+    scheduler = PollingScheduler(OPTIONS)
+    scheduler.add_lease(
+        FastPollLease("ttl", timedelta(seconds=5), now + timedelta(seconds=30))
+    )
+    scheduler.add_lease(
+        FastPollLease(
+            "until",
+            timedelta(seconds=5),
+            now + timedelta(minutes=2),
+            until=lambda data: data["charging"],
+        )
+    )
+    scheduler.add_lease(
+        FastPollLease(
+            "broken",
+            timedelta(seconds=5),
+            now + timedelta(minutes=2),
+            until=lambda data: data["missing"],
+        )
+    )
+
+    assert scheduler.settle_leases(now, {"charging": False}) == []
+    ended = scheduler.settle_leases(now, {"charging": True})
+    assert [lease.key for lease in ended] == ["until"]
+
+    ended = scheduler.settle_leases(now + timedelta(seconds=30))
+    assert [lease.key for lease in ended] == ["ttl"]
+
+    ended = scheduler.settle_leases(now + timedelta(minutes=2))
+    assert [lease.key for lease in ended] == ["broken"]
+    assert scheduler.interval == timedelta(seconds=300)
+
+
+def test_apply_options_updates_running_states():
+    """Test that new option values apply to vehicles already in a state."""
+    scheduler = PollingScheduler(OPTIONS)
+    scheduler.observe(VIN, VehicleMode.CHARGING)
+
+    scheduler.apply_options({**OPTIONS, CONF_CHARGING_INTERVAL: 20})
+
+    assert scheduler.interval == timedelta(seconds=20)
+
+
+def test_simulated_day_polls_less_without_reacting_later():
+    """
+    Test a day of parking, driving, charging and conditioning.
+
+    Polling at the charging interval all day would be the simplest way to
+    react as quickly as the scheduler does while charging. The scheduler has
+    to get there with a fraction of the calls, and must notice every event
+    no later than one idle interval after it starts.
+    """
+    hour = 3600
+    timeline = [
+        (7 * hour, VehicleMode.CONDITIONING),
+        (7 * hour + 1200, VehicleMode.DRIVING),
+        (8 * hour, VehicleMode.PARKED),
+        (17 * hour, VehicleMode.DRIVING),
+        (18 * hour, VehicleMode.CHARGING),
+        (22 * hour, VehicleMode.PARKED),
+    ]
+
+    def mode_at(seconds: float) -> VehicleMode:
+        mode = VehicleMode.PARKED
+        for start, event_mode in timeline:
+            if seconds >= start:
+                mode = event_mode
+        return mode
+
+    scheduler = PollingScheduler(OPTIONS)
+    polls = 0
+    now = 0.0
+    detected: dict[int, float] = {}
+    while now < 24 * hour:
+        mode = mode_at(now)
+        polling = scheduler.observe(VIN, mode)
+        polls += 1
+        for start, event_mode in timeline:
+            if start not in detected and start <= now and mode is event_mode:
+                detected[start] = now - start
+                if event_mode is not VehicleMode.PARKED:
+                    assert polling.state is not PollingState.IDLE
+        now += scheduler.interval.total_seconds()
+
+    fixed_rate_polls = 24 * hour / OPTIONS[CONF_CHARGING_INTERVAL]
+    assert polls < fixed_rate_polls * 0.35
+    assert len(detected) == len(timeline)
+    assert max(detected.values()) <= OPTIONS[CONF_SCAN_INTERVAL]
+
+
+@pytest.mark.asyncio()
+async def test_polling_state_sensor_exposes_state_and_reason(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that the diagnostic sensor shows the state and why it was chosen."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+        options=OPTIONS,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.smart_polling_state")
+    assert state
+    assert state.state == PollingState.IDLE
+    assert state.attributes["reason"] == "parked"
+    assert state.attributes["coordinator_interval"] == 300
+
+    coordinator = entry.runtime_data
+    coordinator.polling.observe(VIN, VehicleMode.DRIVING)
+    coordinator.async_update_listeners()
+
+    state = hass.states.get("sensor.smart_polling_state")
+    assert state.state == PollingState.DRIVING
+    assert state.attributes["reason"] == "driving reported"
+    assert state.attributes["interval"] == 60
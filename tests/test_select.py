@@ -1,25 +1,35 @@
 """Unit tests for select entity persistence."""
 
+from datetime import timedelta
+from typing import Any
+
 import pytest
 import respx
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 from pysmarthashtag.control.climate import HeatingLocation
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.heating import HEATING_LEVELS_SAVE_DELAY
 
 
 @pytest.mark.asyncio()
-async def test_select_option_saves_to_config_entry(
-    hass: HomeAssistant, smart_fixture: respx.Router
+async def test_select_option_saves_to_store(
+    hass: HomeAssistant, smart_fixture: respx.Router, hass_storage: dict[str, Any]
 ):
     """
-    Test that selecting an option saves the value to config entry data.
+    Test that selecting an option saves the value to the heating level store.
 
     This verifies that when a user selects a heating level, the value is
-    persisted to the config entry data using string keys (not enum objects).
+    persisted to storage using string keys (not enum objects), and that the
+    config entry is left alone.
     """
 
     entry = MockConfigEntry(
@@ -55,11 +65,20 @@ async def test_select_option_saves_to_config_entry(
     )
     await hass.async_block_till_done()
 
-    # Verify the value was saved to config entry data
-    assert "selects" in entry.data
+    state = hass.states.get(
+        "select.smart_testvin0000000001_conditioning_steering_wheel"
+    )
+    assert state.state == "High"
+    assert "selects" not in entry.data
+
+    # The level is written once the save delay has passed
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=HEATING_LEVELS_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.heating_levels.{entry.entry_id}"]["data"]
     # The key should be the string value of the HeatingLocation enum
-    assert HeatingLocation.STEERING_WHEEL.value in entry.data["selects"]
-    assert entry.data["selects"][HeatingLocation.STEERING_WHEEL.value] == 3
+    assert stored["levels"] == {HeatingLocation.STEERING_WHEEL.value: 3}
 
 
 @pytest.mark.asyncio()
@@ -107,17 +126,10 @@ async def test_select_option_persists_after_reload(
 
 
 @pytest.mark.asyncio()
-async def test_select_option_updates_without_mutating_original(
-    hass: HomeAssistant, smart_fixture: respx.Router
+async def test_select_levels_move_out_of_config_entry(
+    hass: HomeAssistant, smart_fixture: respx.Router, hass_storage: dict[str, Any]
 ):
-    """
-    Test that updating a select option doesn't mutate the original config entry data.
-
-    This verifies the fix for the shallow copy issue where modifying the nested
-    'selects' dictionary would inadvertently modify the original config entry data.
-    """
-
-    # Create entry with pre-existing select data
+    """Test that levels saved in the config entry data move to the store."""
     entry = MockConfigEntry(
         domain=DOMAIN,
         data={
@@ -135,36 +147,71 @@ async def test_select_option_updates_without_mutating_original(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    # Verify initial state
+    assert "selects" not in entry.data
+    stored = hass_storage[f"{DOMAIN}.heating_levels.{entry.entry_id}"]["data"]
+    assert stored["levels"] == {HeatingLocation.STEERING_WHEEL.value: 1}
+
+    # After a restart the levels come from the store
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
     state = hass.states.get(
         "select.smart_testvin0000000001_conditioning_steering_wheel"
     )
     assert state
     assert state.state == "Low"
 
-    # Store a reference to the original selects dict
-    original_selects_id = id(entry.data["selects"])
 
-    # Update the steering wheel to a new value
-    await hass.services.async_call(
-        "select",
-        "select_option",
-        {
-            "entity_id": "select.smart_testvin0000000001_conditioning_steering_wheel",
-            "option": "High",
+@pytest.mark.asyncio()
+async def test_select_changes_batch_into_one_write(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that changing three levels neither reloads nor writes more than once."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
         },
-        blocking=True,
     )
+
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    key = f"{DOMAIN}.heating_levels.{entry.entry_id}"
 
-    # Verify the value was updated
-    assert entry.data["selects"][HeatingLocation.STEERING_WHEEL.value] == 3
+    def writes() -> int:
+        return sum(
+            call.args[0].key == key for call in Store._async_write_data.call_args_list
+        )
 
-    # Verify that the selects dict is a new object (not mutated in place)
-    new_selects_id = id(entry.data["selects"])
-    assert new_selects_id != original_selects_id, (
-        "The selects dictionary should be a new object, not mutated in place"
+    for location, option in (
+        ("steering_wheel", "High"),
+        ("driver_seat", "Mid"),
+        ("passenger_seat", "Low"),
+    ):
+        await hass.services.async_call(
+            "select",
+            "select_option",
+            {
+                "entity_id": f"select.smart_testvin0000000001_conditioning_{location}",
+                "option": option,
+            },
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+    assert writes() == 0
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=HEATING_LEVELS_SAVE_DELAY)
     )
+    await hass.async_block_till_done()
+
+    assert writes() == 1
+    assert entry.runtime_data is coordinator
+    assert coordinator.heating_levels.get(HeatingLocation.DRIVER_SEAT) == 2
 
 
 @pytest.mark.asyncio()
@@ -274,7 +321,8 @@ async def test_select_cycling_through_options(
         expected_level = {"Off": 0, "Low": 1, "Mid": 2, "High": 3}[option]
         await hass.async_block_till_done()
         assert (
-            entry.data["selects"][HeatingLocation.DRIVER_SEAT.value] == expected_level
+            entry.runtime_data.heating_levels.get(HeatingLocation.DRIVER_SEAT)
+            == expected_level
         )
 
 
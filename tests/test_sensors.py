@@ -1,21 +1,35 @@
 """Unit tests for _handle_error function."""
 
 import logging
+from collections import Counter
 
 import pytest
 import respx
-from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
 from homeassistant.core import HomeAssistant
 from httpx import Request, Response
+from pysmarthashtag.models import ValueWithUnit
 from pysmarthashtag.tests import RESPONSE_DIR, load_response
 from pysmarthashtag.vehicle.battery import CHARGER_CONNECTION_STATES, CHARGING_STATES
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.smarthashtag.const import DOMAIN
-from custom_components.smarthashtag.sensor import remove_vin_from_key, vin_from_key
+from custom_components.smarthashtag.sensor import (
+    _MISSING,
+    SENSOR_GROUPS,
+    SensorResolver,
+    SmartHashtagSensor,
+    compile_resolver,
+    remove_vin_from_key,
+    vin_from_key,
+)
 from custom_components.smarthashtag.sensor_groups.battery import (
     ENTITY_BATTERY_DESCRIPTIONS,
 )
+from custom_components.smarthashtag.sensor_groups.general import (
+    ENTITY_GENERAL_DESCRIPTIONS,
+)
+from custom_components.smarthashtag.sensor_groups.tire import ENTITY_TIRE_DESCRIPTIONS
 
 
 def test_remove_vin_from_key():
@@ -120,14 +134,14 @@ async def test_odometer_updates(hass: HomeAssistant, smart_fixture: respx.Router
     state = hass.states.get("sensor.smart_odometer")
 
     assert state
-    assert state.state == "502"
+    assert state.state == "500"
 
     await entry.runtime_data.async_refresh()
 
     state = hass.states.get("sensor.smart_odometer")
 
     assert state
-    assert state.state == "503"
+    assert state.state == "501"
 
 
 @pytest.mark.asyncio()
@@ -173,14 +187,14 @@ async def test_battery_updates(hass: HomeAssistant, smart_fixture: respx.Router)
     state = hass.states.get("sensor.smart_battery")
 
     assert state
-    assert state.state == "45"
+    assert state.state == "47"
 
     await entry.runtime_data.async_refresh()
 
     state = hass.states.get("sensor.smart_battery")
 
     assert state
-    assert state.state == "44"
+    assert state.state == "46"
 
 
 @pytest.mark.asyncio()
@@ -688,7 +702,7 @@ async def test_native_unit_of_measurement_with_none_vehicle(
     after initial successful setup. It verifies that the entity continues to function
     without raising AttributeError when coordinator.account.vehicles.get(vin) returns None.
 
-    The native_unit_of_measurement property in SmartHashtagUpdateSensor checks for None
+    The native_unit_of_measurement property in SmartHashtagSensor checks for None
     vehicle and returns entity_description.native_unit_of_measurement as fallback.
 
     This addresses the scenario where:
@@ -823,3 +837,176 @@ async def test_charging_status_state_is_selectable(
     options = state.attributes["options"]
     assert isinstance(options, list)
     assert state.state in options
+
+
+@pytest.mark.asyncio()
+async def test_sensor_reads_have_no_side_effects(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """
+    Test that reading sensor properties never schedules polling.
+
+    charging_current and engine_state used to change the polling interval and
+    request refreshes from inside native_value, so the polling rate depended
+    on how often Home Assistant happened to read them.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    vehicle = coordinator.account.vehicles["TestVIN0000000001"]
+    vehicle.battery.charging_current = ValueWithUnit(16.0, "A")
+    vehicle.engine_state = "engine_running"
+
+    refresh_requests = 0
+
+    async def count_refresh_request() -> None:
+        nonlocal refresh_requests
+        refresh_requests += 1
+
+    coordinator.async_request_refresh = count_refresh_request
+    leases = dict(coordinator.fast_poll_leases)
+    update_interval = coordinator.update_interval
+
+    component = hass.data["sensor"]
+    sensors = [
+        entity
+        for entity in component.entities
+        if entity.entity_description.key.endswith(("charging_current", "engine_state"))
+    ]
+    assert len(sensors) == 2
+
+    for _ in range(50):
+        for sensor in sensors:
+            _ = sensor.native_value
+            _ = sensor.native_unit_of_measurement
+            _ = sensor.icon
+    await hass.async_block_till_done()
+
+    assert refresh_requests == 0
+    assert coordinator.fast_poll_leases == leases
+    assert coordinator.update_interval == update_interval
+
+
+def test_resolvers_take_keys_apart_once():
+    """Test that resolvers find the section, attribute and index of a key."""
+    tire_group = next(group for _, group in SENSOR_GROUPS if group.section == "tires")
+    general_group = next(group for _, group in SENSOR_GROUPS if group.section is None)
+
+    tire = compile_resolver(
+        "TestVIN0000000001",
+        tire_group,
+        next(d for d in ENTITY_TIRE_DESCRIPTIONS if d.key == "tire_pressure_3"),
+    )
+    assert (tire.vin, tire.section, tire.attribute, tire.index) == (
+        "TestVIN0000000001",
+        "tires",
+        "tire_pressure",
+        3,
+    )
+
+    service = compile_resolver(
+        "TestVIN0000000001",
+        general_group,
+        SensorEntityDescription(key="service_daysToService"),
+    )
+    assert (service.section, service.attribute, service.index) == (
+        "service",
+        "",
+        "daysToService",
+    )
+
+    engine = compile_resolver(
+        "TestVIN0000000001",
+        general_group,
+        next(d for d in ENTITY_GENERAL_DESCRIPTIONS if d.key == "engine_state"),
+    )
+    assert engine.icon is not None
+
+
+def _lookup_by_key(vehicle, section, key):
+    """Find a sensor's data by taking its key apart, as sensors did on each read."""
+    key = remove_vin_from_key(key)
+    if section == "tires":
+        attribute, position = key.rsplit("_", maxsplit=1)
+        return getattr(vehicle.tires, attribute)[int(position)]
+    if section is None and key.startswith("service"):
+        return vehicle.service[key.rsplit("_", maxsplit=1)[-1]]
+    source = vehicle if section is None else getattr(vehicle, section)
+    return getattr(source, key) if source is not None else None
+
+
+@pytest.mark.asyncio()
+async def test_resolvers_match_key_lookup_and_run_once_per_update(
+    hass: HomeAssistant, smart_fixture: respx.Router, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that compiled resolvers find what the key names, once per update.
+
+    Home Assistant reads the value, the unit and the icon of a sensor for
+    each state write; none of these reads looks the data up again.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+
+    sensors = [
+        entity
+        for entity in hass.data["sensor"].entities
+        if isinstance(entity, SmartHashtagSensor) and entity.hass is not None
+    ]
+    assert sensors
+
+    vehicle = coordinator.data["TestVIN0000000001"]
+    for sensor in sensors:
+        resolver = sensor.resolver
+        try:
+            expected = _lookup_by_key(
+                vehicle, resolver.group.section, sensor.entity_description.key
+            )
+        except resolver.group.errors:
+            with pytest.raises(resolver.group.errors):
+                resolver.lookup(vehicle)
+            continue
+        found = resolver.lookup(vehicle)
+        assert found == expected or (found is _MISSING and expected is None), (
+            sensor.entity_description.key
+        )
+
+    lookups = Counter()
+    lookup = SensorResolver.lookup
+
+    def counting_lookup(resolver, vehicle):
+        lookups[resolver] += 1
+        return lookup(resolver, vehicle)
+
+    monkeypatch.setattr(SensorResolver, "lookup", counting_lookup)
+    for _ in range(3):
+        for sensor in sensors:
+            _ = sensor.native_value
+            _ = sensor.native_unit_of_measurement
+            _ = sensor.icon
+            sensor.async_write_ha_state()
+    assert not lookups
+
+    coordinator.async_update_listeners()
+    assert lookups == Counter({sensor.resolver: 1 for sensor in sensors})
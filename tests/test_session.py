@@ -0,0 +1,107 @@
+"""Tests for the session tokens kept across restarts."""
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+import respx
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from httpx import Response
+from pysmarthashtag.const import API_BASE_URL, API_SESION_URL, LOGIN_URL
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.session import (
+    RENEWED_SESSION_LIFETIME,
+    STORAGE_KEY,
+)
+
+VIN = "TestVIN0000000001"
+
+
+def _count_logins(router: respx.Router) -> int:
+    """Return how many credential logins the router saw."""
+    return sum(str(call.request.url) == LOGIN_URL for call in router.calls)
+
+
+def _add_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add an entry for the fixture vehicle."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.mark.asyncio()
+async def test_restart_resumes_saved_session(
+    hass: HomeAssistant, smart_fixture: respx.Router, hass_storage: dict[str, Any]
+):
+    """Test that a restart reuses the saved tokens instead of logging in."""
+    entry = _add_entry(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert _count_logins(smart_fixture) == 1
+
+    session = hass_storage[STORAGE_KEY]["data"]["sessions"]["sample_user"]
+    assert session["api_user_id"] == "112233"
+    assert session["api_access_token"]
+    assert session["expires_at"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    # Read the tokens back from storage, as after a restart.
+    hass.data.pop(f"{DOMAIN}_session_store")
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.last_update_success
+    assert _count_logins(smart_fixture) == 1
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert "sample_user" not in hass_storage[STORAGE_KEY]["data"]["sessions"]
+
+
+@pytest.mark.asyncio()
+async def test_session_renewed_before_expiry(
+    hass: HomeAssistant, smart_fixture: respx.Router, hass_storage: dict[str, Any]
+):
+    """Test that the background renewal exchanges the refresh token."""
+    entry = _add_entry(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hub = entry.runtime_data.hub
+    authentication = hub.account.config.authentication
+
+    exchange = smart_fixture.put(API_BASE_URL + API_SESION_URL).mock(
+        return_value=Response(
+            200,
+            json={
+                "code": 1000,
+                "data": {"accessToken": "renewed", "refreshToken": "rotated"},
+            },
+        )
+    )
+    await hub._async_refresh_session(dt_util.utcnow())
+
+    assert exchange.called
+    assert _count_logins(smart_fixture) == 1
+    assert authentication.access_token == "renewed"
+    assert authentication.expires_at > (
+        dt_util.utcnow() + RENEWED_SESSION_LIFETIME - timedelta(minutes=1)
+    )
+    session = hass_storage[STORAGE_KEY]["data"]["sessions"]["sample_user"]
+    assert session["access_token"] == "renewed"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
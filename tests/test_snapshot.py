@@ -0,0 +1,82 @@
+"""Tests for the persistent vehicle snapshots."""
+
+from typing import Any
+
+import pytest
+import respx
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from httpx import Response
+from pysmarthashtag.tests import RESPONSE_DIR, load_response
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import ATTR_RESTORED_AT, DOMAIN
+
+VIN = "TestVIN0000000001"
+STATUS_URL = (
+    "https://api.ecloudeu.com/remote-control/vehicle/status/"
+    f"{VIN}?latest=True&target=basic%2Cmore&userId=112233"
+)
+
+
+@pytest.mark.asyncio()
+async def test_restart_serves_snapshot_while_cloud_fails(
+    hass: HomeAssistant, smart_fixture: respx.Router, hass_storage: dict[str, Any]
+):
+    """
+    Test that entities come back with their last values after a restart.
+
+    The snapshot written on unload is the initial data of the next setup. A
+    cloud that fails right after the restart keeps serving it, marked as
+    restored, and the first successful refresh clears the mark.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": VIN,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    last_update = hass.states.get("sensor.smart_last_update").state
+    assert entry.runtime_data.snapshots._store._private
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    snapshot = hass_storage[f"{DOMAIN}.snapshot.{entry.entry_id}"]
+    assert snapshot["version"] == 1
+    assert list(snapshot["data"]["vehicles"]) == [VIN]
+
+    status = smart_fixture.get(STATUS_URL).mock(
+        return_value=Response(
+            200,
+            json={"code": "1509", "message": "Service maintenance, try again later."},
+        )
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    state = hass.states.get("sensor.smart_last_update")
+    assert state.state == last_update
+    assert state.attributes[ATTR_RESTORED_AT]
+
+    status.mock(
+        return_value=Response(
+            200, json=load_response(RESPONSE_DIR / "vehicle_info.json")
+        )
+    )
+    await entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.smart_last_update")
+    assert state.state == last_update
+    assert ATTR_RESTORED_AT not in state.attributes
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.snapshot.{entry.entry_id}" not in hass_storage
@@ -1,11 +1,16 @@
 """Unit tests for switch entity."""
 
+import dataclasses
+from datetime import timedelta
+
 import pytest
 import respx
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pysmarthashtag.tests import RESPONSE_DIR, load_response
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.const import DOMAIN, FAST_INTERVAL, FAST_POLL_TTL
 
 
 def get_switch_entity_id(hass: HomeAssistant) -> str | None:
@@ -138,3 +143,95 @@ async def test_switch_properties(hass: HomeAssistant, smart_fixture: respx.Route
 
     # Check that the entity has the expected icon
     assert state.attributes.get("icon") == "mdi:ev-station"
+
+
+@pytest.mark.asyncio()
+async def test_switch_turn_on_takes_fast_poll_lease(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that starting a charge polls fast on a lease that ends by itself."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={},
+    )
+
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = get_switch_entity_id(hass)
+    assert entity_id is not None, "Switch entity not found"
+
+    await hass.services.async_call(
+        "switch",
+        "turn_on",
+        {"entity_id": entity_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    lease = coordinator.fast_poll_leases["TestVIN0000000001_charging"]
+    assert lease.interval == timedelta(seconds=FAST_INTERVAL)
+    assert lease.expires_at <= dt_util.utcnow() + timedelta(seconds=FAST_POLL_TTL)
+    assert coordinator.update_interval == timedelta(seconds=FAST_INTERVAL)
+
+    # Once the car reports the charge, the lease is over.
+    smart_fixture.get(
+        "https://api.ecloudeu.com/remote-control/vehicle/status/TestVIN0000000001"
+        "?latest=True&target=basic%2Cmore&userId=112233"
+    ).respond(200, json=load_response(RESPONSE_DIR / "vehicle_info_dc_charging.json"))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert (
+        coordinator.data["TestVIN0000000001"].battery.charging_status == "DC_CHARGING"
+    )
+    assert coordinator.fast_poll_leases == {}
+    assert coordinator.update_interval > timedelta(seconds=FAST_INTERVAL)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [("DC_CHARGING", "on"), ("CHARGING", "on"), ("NOT_CHARGING", "off"), (None, "off")],
+)
+async def test_switch_follows_normalized_snapshot(
+    hass: HomeAssistant, smart_fixture: respx.Router, status: str | None, expected: str
+):
+    """Test that the switch reads the snapshot, including an unknown status."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={},
+    )
+
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    vehicle = coordinator.data["TestVIN0000000001"]
+    vehicle = dataclasses.replace(
+        vehicle, battery=dataclasses.replace(vehicle.battery, charging_status=status)
+    )
+    coordinator.async_set_updated_data(
+        dataclasses.replace(
+            coordinator.data,
+            version=coordinator.data.version + 1,
+            vehicles={**coordinator.data.vehicles, "TestVIN0000000001": vehicle},
+        )
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(get_switch_entity_id(hass)).state == expected
@@ -0,0 +1,143 @@
+"""Unit tests for the pooled transport shared by all Smart cloud traffic."""
+
+import asyncio
+import datetime
+import ipaddress
+import ssl
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from homeassistant.core import HomeAssistant
+from pysmarthashtag.api.client import SmartClient, SmartClientConfiguration
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import DOMAIN
+from custom_components.smarthashtag.transport import (
+    DATA_TRANSPORT,
+    SharedTransport,
+    install_transport_hook,
+    remove_transport_hook,
+)
+
+
+def _self_signed_certificate(directory: Path) -> tuple[Path, Path]:
+    """Write a certificate for 127.0.0.1 and its key, returning both paths."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+@pytest.mark.asyncio()
+async def test_entry_shares_transport_and_closes_it_on_unload(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that the cloud calls of an entry go through one pool, closed with it."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    transport = hass.data[DATA_TRANSPORT]
+    coordinator = entry.runtime_data
+    assert coordinator.account.config.transport is transport
+    requests = transport.requests
+    assert requests > 0
+
+    await coordinator.async_refresh()
+    assert transport.requests > requests
+    assert hass.data[DATA_TRANSPORT] is transport
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert transport.closed
+    assert DATA_TRANSPORT not in hass.data
+    # Library clients of others get their own transports again.
+    assert "_init_transport" not in SmartClient.__dict__
+
+
+@pytest.mark.asyncio()
+async def test_shared_transport_saves_handshakes(tmp_path: Path, socket_enabled):
+    """Test against a local TLS server that library clients reuse connections."""
+    cert_path, key_path = _self_signed_certificate(tmp_path)
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_path, key_path)
+    client_context = ssl.create_default_context(cafile=str(cert_path))
+
+    connections: set[tuple[str, int]] = set()
+
+    async def status(request: web.Request) -> web.Response:
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"code": 1000})
+
+    app = web.Application()
+    app.router.add_get("/status", status)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_context)
+    await site.start()
+    url = f"https://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/status"
+    config = SmartClientConfiguration(authentication=None, ssl_context=client_context)
+
+    async def refresh() -> None:
+        # Like the library, one client per call.
+        for _ in range(10):
+            async with SmartClient(config) as client:
+                assert (await client.get(url)).status_code == 200
+
+    try:
+        await refresh()
+        assert len(connections) == 10
+
+        connections.clear()
+        config.transport = SharedTransport(
+            httpx.AsyncHTTPTransport(verify=client_context)
+        )
+        install_transport_hook()
+        await refresh()
+        await refresh()
+        assert len(connections) == 1
+        assert config.transport.requests == 20
+        await config.transport.async_close()
+    finally:
+        remove_transport_hook()
+        await runner.cleanup()
+        await asyncio.sleep(0)
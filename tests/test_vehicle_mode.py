@@ -0,0 +1,104 @@
+"""Unit tests for the vehicle mode detector."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+import respx
+from homeassistant.core import HomeAssistant
+from pysmarthashtag.models import ValueWithUnit
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.smarthashtag.const import (
+    CONF_CHARGING_INTERVAL,
+    CONF_DRIVING_INTERVAL,
+    DOMAIN,
+)
+from custom_components.smarthashtag.vehicle_mode import (
+    VehicleMode,
+    detect_vehicle_mode,
+)
+
+
+def make_vehicle(
+    engine_state="engine_off",
+    charging_status="NOT_CHARGING",
+    charging_current=0.0,
+    pre_climate_active=False,
+):
+    """Build a minimal stand-in for a SmartVehicle."""
+    return SimpleNamespace(
+        engine_state=engine_state,
+        battery=SimpleNamespace(
+            charging_status=charging_status,
+            charging_current=ValueWithUnit(charging_current, "A"),
+        ),
+        climate=SimpleNamespace(pre_climate_active=pre_climate_active),
+    )
+
+
+@pytest.mark.parametrize(
+    ("vehicle", "expected"),
+    [
+        (make_vehicle(), VehicleMode.PARKED),
+        (make_vehicle(charging_status="CHARGING"), VehicleMode.CHARGING),
+        (make_vehicle(charging_status="DC_CHARGING"), VehicleMode.DC_CHARGING),
+        (make_vehicle(charging_current=16.0), VehicleMode.CHARGING),
+        (make_vehicle(engine_state="engine_running"), VehicleMode.DRIVING),
+        (make_vehicle(pre_climate_active=True), VehicleMode.CONDITIONING),
+        (
+            make_vehicle(engine_state="engine_running", charging_status="CHARGING"),
+            VehicleMode.DRIVING,
+        ),
+        (
+            make_vehicle(charging_status="CHARGING", pre_climate_active=True),
+            VehicleMode.CHARGING,
+        ),
+        (
+            SimpleNamespace(engine_state=None, battery=None, climate=None),
+            VehicleMode.PARKED,
+        ),
+    ],
+)
+def test_detect_vehicle_mode(vehicle, expected):
+    """Test that each snapshot is classified into the expected mode."""
+    assert detect_vehicle_mode(vehicle) == expected
+
+
+@pytest.mark.asyncio()
+async def test_vehicle_mode_drives_update_interval(
+    hass: HomeAssistant, smart_fixture: respx.Router
+):
+    """Test that the detected mode sets the polling interval once per update."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "sample_user",
+            "password": "sample_password",
+            "vehicle": "TestVIN0000000001",
+        },
+        options={CONF_CHARGING_INTERVAL: 45, CONF_DRIVING_INTERVAL: 90},
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    vehicles = coordinator.account.vehicles
+
+    vehicles["TestVIN0000000001"] = make_vehicle(charging_status="CHARGING")
+    coordinator._update_vehicle_modes(vehicles)
+    assert coordinator.vehicle_modes == {"TestVIN0000000001": VehicleMode.CHARGING}
+    assert coordinator.update_interval == timedelta(seconds=45)
+
+    vehicles["TestVIN0000000001"] = make_vehicle(engine_state="engine_running")
+    coordinator._update_vehicle_modes(vehicles)
+    assert coordinator.update_interval == timedelta(seconds=90)
+
+    # Back to idle once the scheduler has seen enough parked snapshots.
+    vehicles["TestVIN0000000001"] = make_vehicle()
+    for _ in range(5):
+        coordinator._update_vehicle_modes(vehicles)
+    assert coordinator.vehicle_modes == {"TestVIN0000000001": VehicleMode.PARKED}
+    assert coordinator.update_interval == timedelta(seconds=300)